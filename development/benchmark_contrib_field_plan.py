@@ -0,0 +1,66 @@
+"""Benchmarks the per-object cost of loading through the contrib NautobotAdapter with and without cached field plans.
+
+To run this script use the following command:
+
+```
+invoke nbshell \
+    --plain \
+    --file development/benchmark_contrib_field_plan.py \
+    --env BENCHMARK_OBJECTS=10000
+```
+
+Synthetic tenants are created in a transaction that is rolled back afterwards, so the database is left untouched. As
+with all files passed to `nbshell`, this file can't contain empty lines within indented blocks.
+"""
+
+import os
+import timeit
+from unittest.mock import MagicMock
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from nautobot.extras.models import Tag
+from nautobot.tenancy.models import Tenant, TenantGroup
+
+from nautobot_ssot.contrib.field_plan import get_field_plan, get_typed_dict_keys
+from nautobot_ssot.tests.contrib_base_classes import NautobotTenant, TestAdapter
+
+_OBJECTS = int(os.getenv("BENCHMARK_OBJECTS", "10000"))
+_REPEAT = int(os.getenv("BENCHMARK_REPEAT", "3"))
+
+
+def _load(tenants, clear_plans):
+    adapter = TestAdapter(job=MagicMock())
+    parameter_names = adapter._get_parameter_names(NautobotTenant)  # pylint: disable=protected-access
+    for tenant in tenants:
+        if clear_plans:
+            # Simulate introspecting the type hints and Django model metadata for every object.
+            get_field_plan.cache_clear()
+            get_typed_dict_keys.cache_clear()
+        parameters = {}
+        for parameter_name in parameter_names:
+            adapter._handle_single_parameter(parameters, parameter_name, tenant, NautobotTenant)  # pylint: disable=protected-access
+
+
+def _benchmark():
+    with transaction.atomic():
+        tenant_group = TenantGroup.objects.create(name="Benchmark Tenant Group")
+        tag = Tag.objects.create(name="Benchmark Tag")
+        tag.content_types.add(ContentType.objects.get_for_model(Tenant))
+        Tenant.objects.bulk_create(
+            [Tenant(name=f"Benchmark Tenant {i}", tenant_group=tenant_group) for i in range(_OBJECTS)]
+        )
+        # Load the database objects once, so that only the adapter's per-object work is measured.
+        database_objects = list(
+            Tenant.objects.filter(tenant_group=tenant_group).select_related("tenant_group").prefetch_related("tags")
+        )
+        uncached = min(timeit.repeat(lambda: _load(database_objects, True), number=1, repeat=_REPEAT))
+        cached = min(timeit.repeat(lambda: _load(database_objects, False), number=1, repeat=_REPEAT))
+        print(f"Objects:              {len(database_objects)}")
+        print(f"Uncached field plans: {uncached / len(database_objects) * 1e6:.1f}µs per object")
+        print(f"Cached field plans:   {cached / len(database_objects) * 1e6:.1f}µs per object")
+        print(f"Speedup:              {uncached / cached:.1f}x")
+        transaction.set_rollback(True)
+
+
+_benchmark()
@@ -31,3 +31,15 @@ class SyncLogEntryStatusChoices(ChoiceSet):
         (STATUS_FAILURE, "failed"),
         (STATUS_ERROR, "errored"),
     )
+
+
+class SyncAdapterSnapshotSideChoices(ChoiceSet):
+    """Valid values for a SyncAdapterSnapshot.side field."""
+
+    SIDE_SOURCE = "source"
+    SIDE_TARGET = "target"
+
+    CHOICES = (
+        (SIDE_SOURCE, "source"),
+        (SIDE_TARGET, "target"),
+    )
@@ -3,35 +3,27 @@
 # pylint: disable=protected-access
 # Diffsync relies on underscore-prefixed attributes quite heavily, which is why we disable this here.
 
-from collections import defaultdict
-from typing import DefaultDict, Dict, FrozenSet, Hashable, Tuple, Type, get_args
+from typing import Dict, Iterable, Optional, Type
 
 import pydantic
 from diffsync import Adapter
+from diffsync.enum import DiffSyncFlags
 from diffsync.exceptions import ObjectCrudException
+from django.contrib.contenttypes.fields import GenericForeignKey, GenericRelation
 from django.contrib.contenttypes.models import ContentType
-from django.db.models import Model
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Model, Prefetch, Q
 from nautobot.extras.choices import RelationshipTypeChoices
 from nautobot.extras.models import Relationship, RelationshipAssociation
-from typing_extensions import get_type_hints
 
+from nautobot_ssot.contrib.batching import BatchedWriteQueue
+from nautobot_ssot.contrib.cache import ORMCache
+from nautobot_ssot.contrib.field_plan import FieldKind, get_field_plan, get_typed_dict_keys
 from nautobot_ssot.contrib.types import (
-    CustomFieldAnnotation,
     CustomRelationshipAnnotation,
     RelationshipSideEnum,
 )
-
-# This type describes a set of parameters to use as a dictionary key for the cache. As such, its needs to be hashable
-# and therefore a frozenset rather than a normal set or a list.
-#
-# The following is an example of a parameter set that describes a tenant based on its name and group:
-# frozenset(
-#  [
-#   ("name", "ABC Inc."),
-#   ("group__name", "Customers"),
-#  ]
-# )
-ParameterSet = FrozenSet[Tuple[str, Hashable]]
+from nautobot_ssot.snapshots import restore_adapter
 
 
 class NautobotAdapter(Adapter):
@@ -41,91 +33,268 @@ class NautobotAdapter(Adapter):
     This adapter is able to infer how to load data from Nautobot based on how the models attached to it are defined.
     """
 
-    # This dictionary acts as an ORM cache.
-    _cache: DefaultDict[str, Dict[ParameterSet, Model]]
-    _cache_hits: DefaultDict[str, int] = defaultdict(int)
+    # Optional limits on the number of objects kept in the ORM cache, either for all model classes or for specific
+    # ones. The least recently used objects are evicted first. See `ORMCache` for details.
+    orm_cache_max_size: Optional[int] = None
+    orm_cache_max_sizes: Dict[Type[Model], int] = {}
+
+    # Set this to `True` to have the models queue their ORM writes during the sync and perform them in bulk once the
+    # sync is complete. See `BatchedWriteQueue` for details.
+    batched_writes: bool = False
+    batched_writes_batch_size: int = 250
+
+    # Set this to `True` to only load the objects that changed since the last successful sync when the job runs in
+    # incremental mode, restoring all other objects from the snapshot taken during that sync. See `_load_incrementally`.
+    incremental_load: bool = False
 
     def __init__(self, *args, job, sync=None, **kwargs):
         """Instantiate this class, but do not load data immediately from the local system."""
         super().__init__(*args, **kwargs)
         self.job = job
         self.sync = sync
-        self.invalidate_cache()
+        self.orm_cache = ORMCache(max_size=self.orm_cache_max_size, max_sizes=self.orm_cache_max_sizes)
+        self.write_queue = (
+            BatchedWriteQueue(self, batch_size=self.batched_writes_batch_size) if self.batched_writes else None
+        )
+
+    @property
+    def _cache_hits(self):
+        """Number of ORM cache hits per model class."""
+        return self.orm_cache.hits
 
     def invalidate_cache(self, zero_out_hits=True):
         """Invalidates all the objects in the ORM cache."""
-        self._cache = defaultdict(dict)
-        if zero_out_hits:
-            self._cache_hits = defaultdict(int)
+        self.orm_cache.invalidate(zero_out_statistics=zero_out_hits)
+
+    def warm_cache(self, model_class: Type[Model], field_names: Iterable[str]):
+        """Preload all objects of a model class into the ORM cache with a single query.
+
+        Subsequent calls to `get_from_orm_cache` for this model class that look up objects by exactly these fields
+        are answered without querying the database.
+
+        :param model_class: The Django ORM model class to preload, i.e. `Location`.
+        :param field_names: The fields objects are looked up by, i.e. `["name", "location_type__name"]`.
+        """
+        count = self.orm_cache.warm(model_class, field_names)
+        self.job.logger.debug(f"Warmed ORM cache with {count} {model_class._meta.verbose_name_plural}.")
+
+    def get_orm_cache_statistics(self):
+        """Return the ORM cache hits, misses, evictions and size per model class, as recorded on the Sync."""
+        return self.orm_cache.statistics()
 
     def get_from_orm_cache(self, parameters: Dict, model_class: Type[Model]):
         """Retrieve an object from the ORM or the cache."""
         parameter_set = frozenset(parameters.items())
-        content_type = ContentType.objects.get_for_model(model_class)
-        model_cache_key = f"{content_type.app_label}.{content_type.model}"
-        if cached_object := self._cache[model_cache_key].get(parameter_set):
-            self._cache_hits[model_cache_key] += 1
+        if cached_object := self.orm_cache.get(model_class, parameter_set):
             return cached_object
+        # Objects that are queued for creation in batched mode aren't in the database yet.
+        if self.write_queue is not None and (pending_object := self.write_queue.get_pending(parameters, model_class)):
+            self.orm_cache.set(model_class, parameter_set, pending_object)
+            return pending_object
         # As we are using `get` here, this will error if there is not exactly one object that corresponds to the
         # parameter set. We intentionally pass these errors through.
-        self._cache[model_cache_key][parameter_set] = model_class.objects.get(**dict(parameter_set))
-        return self._cache[model_cache_key][parameter_set]
+        database_object = model_class.objects.get(**parameters)
+        self.orm_cache.set(model_class, parameter_set, database_object)
+        return database_object
 
     @staticmethod
     def _get_parameter_names(diffsync_model):
         """Ignore the differences between identifiers and attributes, because at this point they don't matter to us."""
         return list(diffsync_model._identifiers) + list(diffsync_model._attributes)  # pylint: disable=protected-access
 
-    def _load_objects(self, diffsync_model):
-        """Given a diffsync model class, load a list of models from the database and return them."""
+    def _load_objects(self, diffsync_model, changed_since=None):
+        """Given a diffsync model class, load a list of models from the database and return them.
+
+        :param diffsync_model: The diffsync model class to load
+        :param changed_since: If given, only load the objects that changed since this point in time
+        """
         parameter_names = self._get_parameter_names(diffsync_model)
-        for database_object in diffsync_model._get_queryset():
+        queryset = diffsync_model._get_queryset()
+        if changed_since is not None:
+            changed_objects = diffsync_model._model._default_manager.filter(
+                self._get_changed_filter(diffsync_model, changed_since)
+            )
+            queryset = queryset.filter(pk__in=changed_objects.values("pk"))
+        for database_object in self._optimize_queryset(diffsync_model, queryset):
             self._load_single_object(database_object, diffsync_model, parameter_names)
 
+    def _optimize_queryset(self, diffsync_model, queryset, required_fields=()):
+        """Eagerly load everything that is needed to load `diffsync_model` (and its children) from `queryset`.
+
+        Foreign key chains are joined in with `select_related`, to-many fields and children are loaded with one query
+        each through `prefetch_related` and, where possible, the query is restricted to the columns that are actually
+        used. This way loading a model class takes a fixed number of queries, no matter how many objects there are.
+
+        :param diffsync_model: The diffsync model class to load
+        :param queryset: The queryset as returned by `diffsync_model._get_queryset`
+        :param required_fields: Additional fields to load, i.e. the foreign key pointing to the parent object
+        :return: The optimized queryset
+        """
+        # Leave querysets returning dictionaries/tuples as well as ones that already select specific columns alone.
+        if queryset._fields is not None:
+            return queryset
+        can_restrict_columns = (
+            queryset.query.deferred_loading == (frozenset(), True)
+            and queryset.query.select_related is False
+            and not queryset._prefetch_related_lookups
+        )
+        only_fields = set(required_fields)
+        select_related = set()
+        prefetch_related = {}
+        model = diffsync_model._model
+        field_plan = get_field_plan(diffsync_model)
+
+        for parameter_name in self._get_parameter_names(diffsync_model):
+            field_info = field_plan[parameter_name]
+            if field_info.kind == FieldKind.CUSTOM_FIELD:
+                only_fields.add("_custom_field_data")
+                continue
+            # Custom relationships are loaded through `RelationshipAssociation`, which only needs the primary key.
+            if field_info.kind in (FieldKind.CUSTOM_RELATIONSHIP_FOREIGN_KEY, FieldKind.CUSTOM_RELATIONSHIP_TO_MANY):
+                continue
+            if field_info.kind in (FieldKind.FOREIGN_KEY, FieldKind.GENERIC_FOREIGN_KEY):
+                can_restrict_columns &= self._plan_foreign_key(
+                    model, parameter_name, only_fields, select_related, prefetch_related
+                )
+                continue
+            # Adapter hooks may access any field on the database object.
+            if hasattr(self, f"load_param_{parameter_name}"):
+                can_restrict_columns = False
+                continue
+            if field_info.django_field is None:
+                # This is most likely a property on the model, which may use any field.
+                can_restrict_columns = False
+                continue
+            if field_info.kind == FieldKind.TO_MANY:
+                prefetch_related[parameter_name] = self._plan_to_many_relationship(
+                    field_info.django_field, parameter_name, field_info.inner_type
+                )
+                continue
+            only_fields.add(parameter_name)
+
+        for children_parameter, children_field in diffsync_model._children.items():
+            try:
+                database_field = model._meta.get_field(children_field)
+            except FieldDoesNotExist:
+                continue
+            if not (database_field.many_to_many or database_field.one_to_many):
+                continue
+            diffsync_model_child = self._get_diffsync_class(model_name=children_parameter)
+            # The child objects need to keep the field(s) pointing back to the parent for the prefetch to work.
+            if isinstance(database_field, GenericRelation):
+                child_required_fields = (database_field.object_id_field_name, database_field.content_type_field_name)
+            elif database_field.one_to_many:
+                child_required_fields = (database_field.field.name,)
+            else:
+                child_required_fields = ()
+            child_queryset = self._optimize_queryset(
+                diffsync_model_child,
+                diffsync_model_child._model._default_manager.all(),
+                child_required_fields,
+            )
+            prefetch_related[children_field] = Prefetch(children_field, queryset=child_queryset)
+
+        if select_related:
+            queryset = queryset.select_related(*sorted(select_related))
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related.values())
+        if can_restrict_columns:
+            queryset = queryset.only(*sorted(only_fields))
+        return queryset
+
+    @staticmethod
+    def _plan_foreign_key(model, parameter_name, only_fields, select_related, prefetch_related):
+        """Work out how to eagerly load a '__' delimited foreign key parameter such as 'tenant__tenant_group__name'.
+
+        Foreign keys are followed with `select_related` for as long as possible, a generic foreign key is prefetched.
+
+        :return: Whether the query for `model` can still be restricted to the fields in `only_fields`.
+        """
+        *relations, remote_field_name = parameter_name.split("__")
+        path = []
+        for relation in relations:
+            try:
+                database_field = model._meta.get_field(relation)
+            except FieldDoesNotExist:
+                return False
+            if isinstance(database_field, GenericForeignKey):
+                prefix = "__".join(path + [""])
+                only_fields.update((prefix + database_field.ct_field, prefix + database_field.fk_field))
+                prefetch_related.setdefault(prefix + relation, prefix + relation)
+                return True
+            if not (database_field.many_to_one or database_field.one_to_one):
+                return False
+            path.append(relation)
+            select_related.add("__".join(path))
+            if not database_field.concrete:
+                # Reverse one-to-one relations can be joined in, but their columns can't be restricted.
+                return False
+            model = database_field.related_model
+        try:
+            database_field = model._meta.get_field(remote_field_name)
+        except FieldDoesNotExist:
+            # The remote side is a property or uses the generic foreign key 'app_label'/'model' convention.
+            return False
+        if not database_field.concrete or database_field.many_to_many:
+            return False
+        only_fields.add(parameter_name)
+        return True
+
+    @classmethod
+    def _plan_to_many_relationship(cls, database_field, parameter_name, inner_type):
+        """Return the `prefetch_related` lookup for a to-many field, joining in foreign keys from its typed dict."""
+        select_related = set()
+        prefetch_related = {}
+        related_model = database_field.related_model
+        for field_name in get_typed_dict_keys(inner_type):
+            if "__" in field_name:
+                cls._plan_foreign_key(related_model, field_name, set(), select_related, prefetch_related)
+        if not select_related and not prefetch_related:
+            return parameter_name
+        queryset = related_model._default_manager.all()
+        if select_related:
+            queryset = queryset.select_related(*sorted(select_related))
+        if prefetch_related:
+            queryset = queryset.prefetch_related(*prefetch_related.values())
+        return Prefetch(parameter_name, queryset=queryset)
+
     def _handle_single_parameter(self, parameters, parameter_name, database_object, diffsync_model):
-        type_hints = get_type_hints(diffsync_model, include_extras=True)
+        field_info = get_field_plan(diffsync_model)[parameter_name]
         # Handle custom fields and custom relationships. See CustomFieldAnnotation and CustomRelationshipAnnotation
         # docstrings for more details.
-        is_custom_field = False
-        custom_relationship_annotation = None
-        metadata_for_this_field = getattr(type_hints[parameter_name], "__metadata__", [])
-        for metadata in metadata_for_this_field:
-            if isinstance(metadata, CustomFieldAnnotation):
-                if metadata.name in database_object.cf:
-                    parameters[parameter_name] = database_object.cf[metadata.key]
-                is_custom_field = True
-                break
-            if isinstance(metadata, CustomRelationshipAnnotation):
-                custom_relationship_annotation = metadata
-                break
-        if is_custom_field:
+        if field_info.kind == FieldKind.CUSTOM_FIELD:
+            annotation = field_info.custom_field_annotation
+            if annotation.name in database_object.cf:
+                parameters[parameter_name] = database_object.cf[annotation.key]
             return
 
         # Handling of foreign keys where the local side is the many and the remote side the one.
         # Note: This includes the side of a generic foreign key that has the foreign key, i.e.
         # the 'many' side.
-        if "__" in parameter_name:
-            if custom_relationship_annotation:
-                parameters[parameter_name] = self._handle_custom_relationship_foreign_key(
-                    database_object, parameter_name, custom_relationship_annotation
-                )
-            else:
-                parameters[parameter_name] = self._handle_foreign_key(database_object, parameter_name)
+        if field_info.kind == FieldKind.CUSTOM_RELATIONSHIP_FOREIGN_KEY:
+            parameters[parameter_name] = self._handle_custom_relationship_foreign_key(
+                database_object, parameter_name, field_info.custom_relationship_annotation
+            )
+            return
+        if field_info.kind in (FieldKind.FOREIGN_KEY, FieldKind.GENERIC_FOREIGN_KEY):
+            parameters[parameter_name] = self._handle_foreign_key(database_object, parameter_name)
             return
 
         # Handling of one- and many-to custom relationship fields:
-        if custom_relationship_annotation:
+        if field_info.kind == FieldKind.CUSTOM_RELATIONSHIP_TO_MANY:
             parameters[parameter_name] = self._handle_custom_relationship_to_many_relationship(
-                database_object, diffsync_model, parameter_name, custom_relationship_annotation
+                database_object, diffsync_model, parameter_name, field_info.custom_relationship_annotation
             )
             return
 
-        database_field = diffsync_model._model._meta.get_field(parameter_name)
+        if field_info.django_field is None:
+            # Raise the appropriate error for fields that don't exist on the Django model.
+            diffsync_model._model._meta.get_field(parameter_name)
 
         # Handling of one- and many-to-many non-custom relationship fields.
         # Note: This includes the side of a generic foreign key that constitutes the foreign key,
         # i.e. the 'one' side.
-        if database_field.many_to_many or database_field.one_to_many:
+        if field_info.kind == FieldKind.TO_MANY:
             parameters[parameter_name] = self._handle_to_many_relationship(
                 database_object, diffsync_model, parameter_name
             )
@@ -167,6 +336,11 @@ class NautobotAdapter(Adapter):
         if not hasattr(self, "top_level") or not self.top_level:
             raise ValueError("'top_level' needs to be set on the class.")
 
+        snapshot = self.job.get_incremental_snapshot(self) if self.incremental_load else None
+        if snapshot is not None:
+            self._load_incrementally(snapshot)
+            return
+
         for model_name in self.top_level:
             diffsync_model = self._get_diffsync_class(model_name)
 
@@ -174,6 +348,120 @@ class NautobotAdapter(Adapter):
             # for this specific model class as well as its children without returning anything.
             self._load_objects(diffsync_model)
 
+    def _load_incrementally(self, snapshot):
+        """Load the objects that changed since a snapshot was taken and restore all other objects from the snapshot.
+
+        An object counts as changed if its `last_updated` timestamp, or that of one of its children or of an object it
+        references through a foreign key parameter, is past the watermark of the snapshot. Other changes, such as
+        adding a relationship association without saving the object itself, aren't picked up. Model classes for which
+        this can't be determined, i.e. because they have no `last_updated` field, are loaded in full.
+        """
+        unique_ids = {}
+        for model_name in self.top_level:
+            diffsync_model = self._get_diffsync_class(model_name)
+            if not self._supports_incremental_load(diffsync_model):
+                self._load_objects(diffsync_model)
+                continue
+            self._collect_unique_ids(diffsync_model, diffsync_model._get_queryset(), unique_ids)
+            self._load_objects(diffsync_model, changed_since=snapshot.watermark)
+
+        loaded = self.count()
+        restored, missing = restore_adapter(self, snapshot.data, unique_ids)
+        for model_name, unique_id in missing:
+            self.job.logger.warning(f"{model_name} {unique_id} is neither changed nor part of the snapshot, skipping.")
+        self.job.logger.info(
+            f"Loaded {loaded} objects from the database, restored {restored} unchanged objects from the snapshot."
+        )
+
+    def _supports_incremental_load(self, diffsync_model):
+        """Whether the objects of a diffsync model class and its children can be loaded incrementally.
+
+        This requires a `last_updated` field, identifiers that can be read with `values_list` and children that are
+        reverse foreign keys.
+        """
+        model = diffsync_model._model
+        try:
+            model._meta.get_field("last_updated")
+        except FieldDoesNotExist:
+            return False
+        field_plan = get_field_plan(diffsync_model)
+        for identifier in diffsync_model._identifiers:
+            field_info = field_plan[identifier]
+            if hasattr(self, f"load_param_{identifier}") or field_info.django_field is None:
+                return False
+            if field_info.kind not in (FieldKind.PLAIN, FieldKind.FOREIGN_KEY):
+                return False
+        for children_parameter, children_field in diffsync_model._children.items():
+            try:
+                database_field = model._meta.get_field(children_field)
+            except FieldDoesNotExist:
+                return False
+            if not database_field.one_to_many or isinstance(database_field, GenericRelation):
+                return False
+            if not self._supports_incremental_load(self._get_diffsync_class(children_parameter)):
+                return False
+        return True
+
+    def _get_changed_filter(self, diffsync_model, since, prefix=""):
+        """Build a filter matching objects that, or whose children or foreign keys, were updated since `since`."""
+        query = Q(**{f"{prefix}last_updated__gte": since})
+        field_plan = get_field_plan(diffsync_model)
+        for parameter_name in self._get_parameter_names(diffsync_model):
+            if field_plan[parameter_name].kind != FieldKind.FOREIGN_KEY:
+                continue
+            model = diffsync_model._model
+            path = []
+            for relation in parameter_name.split("__")[:-1]:
+                try:
+                    database_field = model._meta.get_field(relation)
+                except FieldDoesNotExist:
+                    break
+                if not (database_field.many_to_one or database_field.one_to_one) or not database_field.related_model:
+                    break
+                model = database_field.related_model
+                path.append(relation)
+                try:
+                    model._meta.get_field("last_updated")
+                except FieldDoesNotExist:
+                    continue
+                query |= Q(**{f"{prefix}{'__'.join(path)}__last_updated__gte": since})
+        for children_parameter, children_field in diffsync_model._children.items():
+            diffsync_model_child = self._get_diffsync_class(children_parameter)
+            query |= self._get_changed_filter(diffsync_model_child, since, f"{prefix}{children_field}__")
+        return query
+
+    def _collect_unique_ids(self, diffsync_model, queryset, unique_ids):
+        """Collect the unique IDs of all objects in `queryset` and their children, without loading the objects."""
+        identifiers = list(diffsync_model._identifiers)
+        unique_ids.setdefault(diffsync_model._modelname, set()).update(
+            diffsync_model.create_unique_id(**dict(zip(identifiers, values)))
+            for values in queryset.values_list(*identifiers)
+        )
+        for children_parameter, children_field in diffsync_model._children.items():
+            database_field = diffsync_model._model._meta.get_field(children_field)
+            diffsync_model_child = self._get_diffsync_class(children_parameter)
+            child_queryset = diffsync_model_child._model._default_manager.filter(
+                **{f"{database_field.field.name}__in": queryset.values("pk")}
+            )
+            self._collect_unique_ids(diffsync_model_child, child_queryset, unique_ids)
+
+    def _get_model_class_order(self):
+        """Return the ORM model classes of this adapter in dependency order, following `top_level` and `_children`."""
+        model_classes = []
+        model_names = list(self.top_level)
+        while model_names:
+            diffsync_model = self._get_diffsync_class(model_names.pop(0))
+            if diffsync_model._model not in model_classes:
+                model_classes.append(diffsync_model._model)
+            model_names.extend(diffsync_model._children.keys())
+        return model_classes
+
+    def sync_complete(self, source, diff, flags=DiffSyncFlags.NONE, logger=None):
+        """Perform the queued ORM writes if batched writes are enabled."""
+        if self.write_queue is not None:
+            self.write_queue.flush(self._get_model_class_order())
+        return super().sync_complete(source, diff, flags, logger)
+
     def _get_diffsync_class(self, model_name):
         """Given a model name, return the diffsync class."""
         try:
@@ -189,8 +477,7 @@ class NautobotAdapter(Adapter):
     ):
         # Introspect type annotations to deduce which fields are of interest
         # for this many-to-many relationship.
-        diffsync_field_type = get_type_hints(diffsync_model)[parameter_name]
-        inner_type = get_args(diffsync_field_type)[0]
+        inner_type = get_field_plan(diffsync_model)[parameter_name].inner_type
         related_objects_list = []
         # TODO: Allow for filtering, i.e. not taking into account all the objects behind the relationship.
         relationship = self.get_from_orm_cache({"label": annotation.name}, Relationship)
@@ -250,7 +537,7 @@ class NautobotAdapter(Adapter):
         Returns: The dictionary representation of `related_object` as described by `inner_type`.
         """
         dictionary_representation = {}
-        for field_name in get_type_hints(inner_type):
+        for field_name in get_typed_dict_keys(inner_type):
             if "__" in field_name:
                 dictionary_representation[field_name] = cls._handle_foreign_key(related_object, field_name)
                 continue
@@ -322,7 +609,7 @@ class NautobotAdapter(Adapter):
         """
         # Introspect type annotations to deduce which fields are of interest
         # for this many-to-many relationship.
-        inner_type = get_args(get_type_hints(diffsync_model)[parameter_name])[0]
+        inner_type = get_field_plan(diffsync_model)[parameter_name].inner_type
         related_objects_list = []
         # TODO: Allow for filtering, i.e. not taking into account all the objects behind the relationship.
         for related_object in getattr(database_object, parameter_name).all():
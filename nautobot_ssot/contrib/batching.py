@@ -0,0 +1,269 @@
+"""Batched ORM writes for the contrib NautobotAdapter/NautobotModel."""
+
+# pylint: disable=protected-access
+# Django relies on underscore-prefixed attributes quite heavily, which is why we disable this here.
+
+from collections import defaultdict
+from copy import deepcopy
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional, Type
+
+from diffsync.exceptions import ObjectCrudException
+from django.core.exceptions import ObjectDoesNotExist, ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Model, ProtectedError
+
+
+class BatchedWriteQueue:  # pylint: disable=too-many-instance-attributes
+    """Queue ORM writes during a sync and perform them in bulk once the sync is complete.
+
+    Objects created, updated or deleted through `NautobotModel` are collected per model class instead of being saved
+    one by one. `flush()` then validates them with `full_clean` and writes them with `bulk_create`/`bulk_update` in
+    dependency order, after which any deferred writes (many-to-many fields and relationship associations) are made.
+    Deletions happen last, in reverse dependency order.
+
+    Objects that are queued for creation can already be looked up (see `get_pending`), so that later objects in the
+    same sync can point foreign keys to them before they are written to the database.
+    """
+
+    def __init__(self, adapter, batch_size: int = 250):
+        """Initialize the queue for the given NautobotAdapter."""
+        self.adapter = adapter
+        self.batch_size = batch_size
+        self._model_classes: List[Type[Model]] = []
+        self._creates: Dict[Type[Model], List[Model]] = defaultdict(list)
+        self._updates: Dict[Type[Model], Dict] = defaultdict(dict)
+        self._deletes: Dict[Type[Model], List[Model]] = defaultdict(list)
+        self._deferred = []
+        self._pending_pks = set()
+        self._failed_pks = set()
+        # Lookup indexes over objects queued for creation, per model class and set of lookup fields.
+        self._indexes: Dict[Type[Model], Dict] = defaultdict(dict)
+        self.created = 0
+        self.updated = 0
+        self.deleted = 0
+        self.failed = 0
+
+    def __len__(self):
+        """Number of writes currently queued."""
+        return (
+            sum(len(objs) for objs in self._creates.values())
+            + sum(len(objs) for objs in self._updates.values())
+            + sum(len(objs) for objs in self._deletes.values())
+        )
+
+    def _register_model_class(self, model_class):
+        if model_class not in self._model_classes:
+            self._model_classes.append(model_class)
+
+    @staticmethod
+    def snapshot(obj: Model):
+        """Record the current field values of an object, for later use by `queue_update`."""
+        return {field.attname: deepcopy(getattr(obj, field.attname)) for field in obj._meta.concrete_fields}
+
+    def queue_create(self, obj: Model, deferred: Optional[Callable] = None):
+        """Queue a new (unsaved) object for creation.
+
+        :param obj: The Django ORM object to create.
+        :param deferred: Callable to run once the object has been saved, i.e. to set its many-to-many fields.
+        """
+        model_class = type(obj)
+        self._register_model_class(model_class)
+        self._creates[model_class].append(obj)
+        self._pending_pks.add(obj.pk)
+        for lookups, index in self._indexes[model_class].items():
+            self._add_to_index(index, lookups, obj)
+        if deferred:
+            self._deferred.append((obj, deferred))
+
+    def queue_update(self, obj: Model, original_values: Dict, deferred: Optional[Callable] = None):
+        """Queue an existing object for update.
+
+        :param obj: The (already modified) Django ORM object to update.
+        :param original_values: The result of `snapshot(obj)` from before the object was modified.
+        :param deferred: Callable to run once the object has been saved, i.e. to set its many-to-many fields.
+        """
+        model_class = type(obj)
+        self._register_model_class(model_class)
+        changed_fields = {
+            field.name
+            for field in obj._meta.concrete_fields
+            if not field.primary_key and getattr(obj, field.attname) != original_values.get(field.attname)
+        }
+        if obj.pk in self._updates[model_class]:
+            changed_fields |= self._updates[model_class][obj.pk][1]
+        self._updates[model_class][obj.pk] = (obj, changed_fields)
+        if deferred:
+            self._deferred.append((obj, deferred))
+
+    def queue_delete(self, obj: Model):
+        """Queue an existing object for deletion."""
+        model_class = type(obj)
+        self._register_model_class(model_class)
+        self._deletes[model_class].append(obj)
+
+    @staticmethod
+    def _resolve_lookup(obj, lookup):
+        """Resolve a '__' delimited lookup such as 'location__name' against an in-memory object."""
+        value = obj
+        for attribute in lookup.split("__"):
+            try:
+                value = getattr(value, attribute)
+            except (AttributeError, ObjectDoesNotExist):
+                return None
+            if value is None:
+                return None
+        return value
+
+    def _add_to_index(self, index, lookups, obj):
+        try:
+            index[tuple(self._resolve_lookup(obj, lookup) for lookup in lookups)] = obj
+        except TypeError:
+            # Unhashable values can't be looked up this way, the object will be found in the database after flushing.
+            pass
+
+    def get_pending(self, parameters: Dict, model_class: Type[Model]) -> Optional[Model]:
+        """Find an object queued for creation that matches the given lookup parameters."""
+        if not self._creates.get(model_class):
+            return None
+        lookups = tuple(sorted(parameters))
+        index = self._indexes[model_class].get(lookups)
+        if index is None:
+            index = self._indexes[model_class][lookups] = {}
+            for obj in self._creates[model_class]:
+                self._add_to_index(index, lookups, obj)
+        try:
+            return index.get(tuple(parameters[lookup] for lookup in lookups))
+        except TypeError:
+            return None
+
+    def _log_failure(self, action, obj, error):
+        self.failed += 1
+        self._failed_pks.add(obj.pk)
+        self.adapter.job.logger.error(f"Batched {action} of {obj._meta.verbose_name} {obj} failed: {error}")
+
+    def flush(self, model_order: Iterable[Type[Model]] = ()):
+        """Write all queued objects to the database.
+
+        :param model_order: Model classes in dependency order, i.e. parents before children. Model classes that were
+            queued but aren't part of this are written afterwards, in the order they were first queued in.
+        """
+        start_time = datetime.now()
+        order = [model_class for model_class in model_order if model_class in self._model_classes]
+        order += [model_class for model_class in self._model_classes if model_class not in order]
+
+        for model_class in order:
+            self._flush_creates(model_class)
+        for model_class in order:
+            self._flush_updates(model_class)
+        deferred, self._deferred = self._deferred, []
+        for obj, function in deferred:
+            if obj.pk in self._failed_pks:
+                continue
+            try:
+                with transaction.atomic():
+                    function()
+            except (ObjectCrudException, ValidationError, IntegrityError) as error:
+                self._log_failure("relationship update", obj, error)
+        for model_class in reversed(order):
+            self._flush_deletes(model_class)
+
+        self._model_classes = []
+        self._indexes.clear()
+        self.adapter.job.logger.info(
+            "Batched writes: %s created, %s updated, %s deleted, %s failed in %s",
+            self.created,
+            self.updated,
+            self.deleted,
+            self.failed,
+            datetime.now() - start_time,
+        )
+
+    def _batches(self, objs):
+        for start in range(0, len(objs), self.batch_size):
+            yield objs[start : start + self.batch_size]
+
+    def _flush_creates(self, model_class):
+        objs = self._creates.pop(model_class, [])
+        foreign_keys = [field for field in model_class._meta.concrete_fields if field.many_to_one or field.one_to_one]
+        valid_objs = []
+        for obj in objs:
+            related_pks = {field.name: getattr(obj, field.attname) for field in foreign_keys}
+            if self._failed_pks.intersection(related_pks.values()):
+                self._log_failure("create", obj, "a related object could not be created")
+                continue
+            # Objects that are themselves queued for creation don't exist in the database yet and would fail
+            # validation. This only happens for self-referencing models, as other model classes are written first.
+            exclude = [name for name, related_pk in related_pks.items() if related_pk in self._pending_pks]
+            try:
+                obj.full_clean(exclude=exclude)
+            except ValidationError as error:
+                self._log_failure("create", obj, error)
+                continue
+            valid_objs.append(obj)
+
+        for batch in self._batches(valid_objs):
+            try:
+                with transaction.atomic():
+                    model_class.objects.bulk_create(batch)
+                self.created += len(batch)
+            except IntegrityError:
+                # Retry the objects one by one to find out which of them failed.
+                for obj in batch:
+                    try:
+                        with transaction.atomic():
+                            model_class.objects.bulk_create([obj])
+                        self.created += 1
+                    except IntegrityError as error:
+                        self._log_failure("create", obj, error)
+        self._pending_pks.difference_update(obj.pk for obj in objs)
+
+    def _flush_updates(self, model_class):
+        updates = self._updates.pop(model_class, {})
+        auto_now_fields = [field for field in model_class._meta.concrete_fields if getattr(field, "auto_now", False)]
+        valid_objs = []
+        fields = set()
+        for obj, changed_fields in updates.values():
+            try:
+                obj.full_clean()
+            except ValidationError as error:
+                self._log_failure("update", obj, error)
+                continue
+            for field in auto_now_fields:
+                # `bulk_update` doesn't do this for us.
+                field.pre_save(obj, add=False)
+            valid_objs.append(obj)
+            fields |= changed_fields
+        if not fields:
+            return
+        fields |= {field.name for field in auto_now_fields}
+
+        for batch in self._batches(valid_objs):
+            try:
+                with transaction.atomic():
+                    model_class.objects.bulk_update(batch, fields)
+                self.updated += len(batch)
+            except IntegrityError:
+                for obj in batch:
+                    try:
+                        with transaction.atomic():
+                            model_class.objects.bulk_update([obj], fields)
+                        self.updated += 1
+                    except IntegrityError as error:
+                        self._log_failure("update", obj, error)
+
+    def _flush_deletes(self, model_class):
+        objs = self._deletes.pop(model_class, [])
+        for batch in self._batches(objs):
+            try:
+                with transaction.atomic():
+                    model_class.objects.filter(pk__in=[obj.pk for obj in batch]).delete()
+                self.deleted += len(batch)
+            except ProtectedError:
+                for obj in batch:
+                    try:
+                        with transaction.atomic():
+                            obj.delete()
+                        self.deleted += 1
+                    except ProtectedError:
+                        self._log_failure("delete", obj, "it is referenced by another object")
@@ -0,0 +1,129 @@
+"""ORM cache for the contrib NautobotAdapter."""
+
+# pylint: disable=protected-access
+# Django relies on underscore-prefixed attributes quite heavily, which is why we disable this here.
+
+from collections import OrderedDict, defaultdict
+from typing import DefaultDict, Dict, FrozenSet, Hashable, Iterable, Optional, Tuple, Type
+
+from django.db.models import Model
+
+# This type describes a set of parameters to use as a dictionary key for the cache. As such, its needs to be hashable
+# and therefore a frozenset rather than a normal set or a list.
+#
+# The following is an example of a parameter set that describes a tenant based on its name and group:
+# frozenset(
+#  [
+#   ("name", "ABC Inc."),
+#   ("group__name", "Customers"),
+#  ]
+# )
+ParameterSet = FrozenSet[Tuple[str, Hashable]]
+
+# Marks parameter sets in a warmed index that match more than one object.
+_AMBIGUOUS = object()
+
+
+class ORMCache:
+    """Cache of ORM objects per model class and set of lookup parameters.
+
+    The number of objects kept per model class can optionally be limited, in which case the least recently used
+    objects are evicted first. Whole tables can be preloaded with `warm`, after which lookups on the warmed fields are
+    answered from memory.
+    """
+
+    def __init__(self, max_size: Optional[int] = None, max_sizes: Optional[Dict[Type[Model], int]] = None):
+        """Initialize the cache.
+
+        :param max_size: Maximum number of objects to keep per model class, `None` for no limit.
+        :param max_sizes: Maximum number of objects to keep for specific model classes, overrides `max_size`.
+        """
+        self.max_size = max_size
+        self.max_sizes = max_sizes or {}
+        self._cache: DefaultDict[Type[Model], OrderedDict] = defaultdict(OrderedDict)
+        # Warmed indexes per model class and set of field names.
+        self._warm: DefaultDict[Type[Model], Dict[FrozenSet[str], Dict]] = defaultdict(dict)
+        self.hits: DefaultDict[Type[Model], int] = defaultdict(int)
+        self.misses: DefaultDict[Type[Model], int] = defaultdict(int)
+        self.evictions: DefaultDict[Type[Model], int] = defaultdict(int)
+
+    def invalidate(self, zero_out_statistics=True):
+        """Remove all objects from the cache, including warmed indexes."""
+        self._cache.clear()
+        self._warm.clear()
+        if zero_out_statistics:
+            self.hits.clear()
+            self.misses.clear()
+            self.evictions.clear()
+
+    def get(self, model_class: Type[Model], parameter_set: ParameterSet) -> Optional[Model]:
+        """Return the cached object for the given parameters, or `None` if there is none."""
+        model_cache = self._cache[model_class]
+        cached_object = model_cache.get(parameter_set)
+        if cached_object is not None:
+            model_cache.move_to_end(parameter_set)
+            self.hits[model_class] += 1
+            return cached_object
+        index = self._warm[model_class].get(frozenset(field_name for field_name, _ in parameter_set))
+        if index is not None:
+            cached_object = index.get(parameter_set)
+            if cached_object is not None and cached_object is not _AMBIGUOUS:
+                self.hits[model_class] += 1
+                return cached_object
+        self.misses[model_class] += 1
+        return None
+
+    def set(self, model_class: Type[Model], parameter_set: ParameterSet, obj: Model):
+        """Add an object to the cache, evicting the least recently used object(s) if the cache is full."""
+        model_cache = self._cache[model_class]
+        model_cache[parameter_set] = obj
+        model_cache.move_to_end(parameter_set)
+        max_size = self.max_sizes.get(model_class, self.max_size)
+        while max_size is not None and len(model_cache) > max_size:
+            model_cache.popitem(last=False)
+            self.evictions[model_class] += 1
+
+    @staticmethod
+    def _resolve_lookup(obj, lookup):
+        """Resolve a '__' delimited lookup such as 'location__name' against an object."""
+        value = obj
+        for attribute in lookup.split("__"):
+            value = getattr(value, attribute)
+            if value is None:
+                return None
+        return value
+
+    def warm(self, model_class: Type[Model], field_names: Iterable[str]) -> int:
+        """Load all objects of a model class in a single query and index them by the given field names.
+
+        :param model_class: The Django ORM model class to load.
+        :param field_names: The lookups to index by, i.e. `["name", "location__name"]`.
+        :return: The number of objects loaded.
+        """
+        field_names = frozenset(field_names)
+        queryset = model_class.objects.all()
+        related_lookups = {field_name.rsplit("__", 1)[0] for field_name in field_names if "__" in field_name}
+        if related_lookups:
+            queryset = queryset.select_related(*related_lookups)
+        index = {}
+        count = 0
+        for obj in queryset:
+            parameter_set = frozenset((field_name, self._resolve_lookup(obj, field_name)) for field_name in field_names)
+            # Lookups that match multiple objects are left to the database, so that they raise accordingly.
+            index[parameter_set] = _AMBIGUOUS if parameter_set in index else obj
+            count += 1
+        self._warm[model_class][field_names] = index
+        return count
+
+    def statistics(self) -> Dict[str, Dict[str, int]]:
+        """Return the hits, misses, evictions and current size per model class, keyed by model label."""
+        model_classes = set(self.hits) | set(self.misses) | set(self.evictions) | set(self._cache)
+        return {
+            model_class._meta.label_lower: {
+                "hits": self.hits[model_class],
+                "misses": self.misses[model_class],
+                "evictions": self.evictions[model_class],
+                "size": len(self._cache[model_class]),
+            }
+            for model_class in sorted(model_classes, key=lambda model_class: model_class._meta.label_lower)
+        }
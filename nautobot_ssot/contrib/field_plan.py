@@ -0,0 +1,139 @@
+"""Per-class field plans for the contrib NautobotAdapter/NautobotModel."""
+
+# pylint: disable=protected-access
+# Diffsync relies on underscore-prefixed attributes quite heavily, which is why we disable this here.
+
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, Optional, Tuple, Type, get_args
+
+from django.contrib.contenttypes.fields import GenericForeignKey
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models import Field, Model
+from typing_extensions import get_type_hints
+
+from nautobot_ssot.contrib.types import CustomFieldAnnotation, CustomRelationshipAnnotation
+
+
+class FieldKind(Enum):
+    """How a field on a diffsync model maps to its Django ORM model."""
+
+    PLAIN = "PLAIN"
+    FOREIGN_KEY = "FOREIGN_KEY"
+    GENERIC_FOREIGN_KEY = "GENERIC_FOREIGN_KEY"
+    TO_MANY = "TO_MANY"
+    CUSTOM_FIELD = "CUSTOM_FIELD"
+    CUSTOM_RELATIONSHIP_FOREIGN_KEY = "CUSTOM_RELATIONSHIP_FOREIGN_KEY"
+    CUSTOM_RELATIONSHIP_TO_MANY = "CUSTOM_RELATIONSHIP_TO_MANY"
+
+
+@dataclass(frozen=True)
+class FieldInfo:  # pylint: disable=too-many-instance-attributes
+    """Everything the contrib adapter and model need to know about a single field of a diffsync model.
+
+    For foreign key fields such as `tenant__group__name`, `foreign_key` is `tenant`, `lookup` is `group__name` and
+    `django_field` is the Django field behind `tenant`.
+    """
+
+    name: str
+    kind: FieldKind
+    # The Django field behind this field, `None` if there is no such field (i.e. for custom fields or properties).
+    django_field: Optional[Field] = None
+    # The related model class for foreign keys and to-many fields, `None` for generic foreign keys.
+    related_model: Optional[Type[Model]] = None
+    foreign_key: Optional[str] = None
+    lookup: Optional[str] = None
+    custom_field_annotation: Optional[CustomFieldAnnotation] = None
+    custom_relationship_annotation: Optional[CustomRelationshipAnnotation] = None
+    # For to-many fields, the typed dict describing the related objects and its keys.
+    inner_type: Optional[type] = None
+    typed_dict_keys: Tuple[str, ...] = ()
+
+
+@lru_cache(maxsize=None)
+def get_typed_dict_keys(typed_dict) -> Tuple[str, ...]:
+    """Return the keys of a typed dict, memoised per typed dict class."""
+    return tuple(get_type_hints(typed_dict))
+
+
+def _get_django_field(model, name):
+    try:
+        return model._meta.get_field(name)
+    except FieldDoesNotExist:
+        return None
+
+
+def _build_field_info(diffsync_model, name, type_hint, type_hint_with_extras) -> FieldInfo:
+    custom_field_annotation = None
+    custom_relationship_annotation = None
+    for metadata in getattr(type_hint_with_extras, "__metadata__", []):
+        if isinstance(metadata, CustomFieldAnnotation):
+            custom_field_annotation = metadata
+            break
+        if isinstance(metadata, CustomRelationshipAnnotation):
+            custom_relationship_annotation = metadata
+            break
+    if custom_field_annotation:
+        return FieldInfo(name=name, kind=FieldKind.CUSTOM_FIELD, custom_field_annotation=custom_field_annotation)
+
+    type_args = get_args(type_hint)
+    inner_type = type_args[0] if type_args else None
+
+    if "__" in name:
+        foreign_key, lookup = name.split("__", maxsplit=1)
+        if custom_relationship_annotation:
+            return FieldInfo(
+                name=name,
+                kind=FieldKind.CUSTOM_RELATIONSHIP_FOREIGN_KEY,
+                foreign_key=foreign_key,
+                lookup=lookup,
+                custom_relationship_annotation=custom_relationship_annotation,
+            )
+        django_field = _get_django_field(diffsync_model._model, foreign_key)
+        is_generic = isinstance(django_field, GenericForeignKey)
+        return FieldInfo(
+            name=name,
+            kind=FieldKind.GENERIC_FOREIGN_KEY if is_generic else FieldKind.FOREIGN_KEY,
+            django_field=django_field,
+            related_model=getattr(django_field, "related_model", None),
+            foreign_key=foreign_key,
+            lookup=lookup,
+        )
+
+    if custom_relationship_annotation:
+        return FieldInfo(
+            name=name,
+            kind=FieldKind.CUSTOM_RELATIONSHIP_TO_MANY,
+            custom_relationship_annotation=custom_relationship_annotation,
+            inner_type=inner_type,
+            typed_dict_keys=get_typed_dict_keys(inner_type) if isinstance(inner_type, type) else (),
+        )
+
+    django_field = _get_django_field(diffsync_model._model, name)
+    if django_field is not None and (django_field.many_to_many or django_field.one_to_many):
+        return FieldInfo(
+            name=name,
+            kind=FieldKind.TO_MANY,
+            django_field=django_field,
+            related_model=django_field.related_model,
+            inner_type=inner_type,
+            typed_dict_keys=get_typed_dict_keys(inner_type) if isinstance(inner_type, type) else (),
+        )
+    return FieldInfo(name=name, kind=FieldKind.PLAIN, django_field=django_field)
+
+
+@lru_cache(maxsize=None)
+def get_field_plan(diffsync_model) -> Dict[str, FieldInfo]:
+    """Return the field plan for a diffsync model class, i.e. a `FieldInfo` for each of its fields.
+
+    The plan is built once per class, which saves introspecting type hints and Django model metadata for every single
+    object that is loaded or written.
+    """
+    type_hints = get_type_hints(diffsync_model)
+    type_hints_with_extras = get_type_hints(diffsync_model, include_extras=True)
+    return {
+        name: _build_field_info(diffsync_model, name, type_hints[name], type_hints_with_extras[name])
+        for name in diffsync_model.model_fields
+        if name in type_hints
+    }
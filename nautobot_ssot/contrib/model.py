@@ -4,6 +4,7 @@
 # Diffsync relies on underscore-prefixed attributes quite heavily, which is why we disable this here.
 
 from collections import defaultdict
+from functools import partial
 from typing import ClassVar, Optional
 from uuid import UUID
 
@@ -14,13 +15,9 @@ from django.core.exceptions import MultipleObjectsReturned, ValidationError
 from django.db.models import Model, ProtectedError
 from nautobot.extras.choices import RelationshipTypeChoices
 from nautobot.extras.models import Relationship, RelationshipAssociation
-from typing_extensions import get_type_hints
 
-from nautobot_ssot.contrib.types import (
-    CustomFieldAnnotation,
-    CustomRelationshipAnnotation,
-    RelationshipSideEnum,
-)
+from nautobot_ssot.contrib.field_plan import FieldKind, get_field_plan
+from nautobot_ssot.contrib.types import RelationshipSideEnum
 
 
 class NautobotModel(DiffSyncModel):
@@ -40,16 +37,11 @@ class NautobotModel(DiffSyncModel):
 
     @classmethod
     def _get_queryset(cls):
-        """Get the queryset used to load the models data from Nautobot."""
-        available_fields = {field.name for field in cls._model._meta.get_fields()}
-        parameter_names = [
-            parameter for parameter in list(cls._identifiers) + list(cls._attributes) if parameter in available_fields
-        ]
-        # Here we identify any foreign keys (i.e. fields with '__' in them) so that we can load them directly in the
-        # first query if this function hasn't been overridden.
-        prefetch_related_parameters = [parameter.split("__")[0] for parameter in parameter_names if "__" in parameter]
-        qs = cls.get_queryset()
-        return qs.prefetch_related(*prefetch_related_parameters)
+        """Get the queryset used to load the models data from Nautobot.
+
+        Related objects are loaded eagerly by `NautobotAdapter._optimize_queryset` based on the model's parameters.
+        """
+        return cls.get_queryset()
 
     @classmethod
     def get_queryset(cls):
@@ -84,6 +76,10 @@ class NautobotModel(DiffSyncModel):
             obj = self.get_from_db()
         except ObjectCrudException as error:
             raise ObjectNotDeleted(error) from error
+        write_queue = getattr(self.adapter, "write_queue", None)
+        if write_queue is not None:
+            write_queue.queue_delete(obj)
+            return super().delete()
         try:
             obj.delete()
         except ProtectedError as error:
@@ -119,21 +115,13 @@ class NautobotModel(DiffSyncModel):
             This is mutated over the course of this function.
         :param adapter: The related diffsync adapter used for looking up things in the cache.
         """
-        # Use type hints at runtime to determine which fields are custom fields
-        type_hints = get_type_hints(cls, include_extras=True)
-
         cls._check_field(field)
+        field_info = get_field_plan(cls)[field]
 
         # Handle custom fields. See CustomFieldAnnotation docstring for more details.
-        custom_relationship_annotation = None
-        metadata_for_this_field = getattr(type_hints[field], "__metadata__", [])
-        for metadata in metadata_for_this_field:
-            if isinstance(metadata, CustomFieldAnnotation):
-                obj.cf[metadata.key] = value
-                return
-            if isinstance(metadata, CustomRelationshipAnnotation):
-                custom_relationship_annotation = metadata
-                break
+        if field_info.kind == FieldKind.CUSTOM_FIELD:
+            obj.cf[field_info.custom_field_annotation.key] = value
+            return
 
         # Prepare handling of foreign keys and custom relationship foreign keys.
         # Example: If field is `tenant__group__name`, then
@@ -144,24 +132,26 @@ class NautobotModel(DiffSyncModel):
         # `foreign_keys["tenant"]["_model_class"] = nautobot.tenancy.models.Tenant
         # For custom relationship foreign keys, we add the annotation instead:
         # `custom_relationship_foreign_keys["tenant"]["_annotation"] = CustomRelationshipAnnotation(...)
-        if "__" in field:
-            related_model, lookup = field.split("__", maxsplit=1)
-            # Custom relationship foreign keys
-            if custom_relationship_annotation:
-                relationship_fields["custom_relationship_foreign_keys"][related_model][lookup] = value
-                relationship_fields["custom_relationship_foreign_keys"][related_model]["_annotation"] = (
-                    custom_relationship_annotation
-                )
-            # Normal foreign keys
-            else:
-                django_field = cls._model._meta.get_field(related_model)
-                relationship_fields["foreign_keys"][related_model][lookup] = value
-                # Add a special key to the dictionary to point to the related model's class
-                relationship_fields["foreign_keys"][related_model]["_model_class"] = django_field.related_model
+        if field_info.kind == FieldKind.CUSTOM_RELATIONSHIP_FOREIGN_KEY:
+            related_model, lookup = field_info.foreign_key, field_info.lookup
+            relationship_fields["custom_relationship_foreign_keys"][related_model][lookup] = value
+            relationship_fields["custom_relationship_foreign_keys"][related_model]["_annotation"] = (
+                field_info.custom_relationship_annotation
+            )
+            return
+        if field_info.kind in (FieldKind.FOREIGN_KEY, FieldKind.GENERIC_FOREIGN_KEY):
+            related_model, lookup = field_info.foreign_key, field_info.lookup
+            if field_info.django_field is None:
+                # Raise the appropriate error for fields that don't exist on the Django model.
+                cls._model._meta.get_field(related_model)
+            relationship_fields["foreign_keys"][related_model][lookup] = value
+            # Add a special key to the dictionary to point to the related model's class
+            relationship_fields["foreign_keys"][related_model]["_model_class"] = field_info.related_model
             return
 
         # Prepare handling of custom relationship many-to-many fields.
-        if custom_relationship_annotation:
+        if field_info.kind == FieldKind.CUSTOM_RELATIONSHIP_TO_MANY:
+            custom_relationship_annotation = field_info.custom_relationship_annotation
             relationship = adapter.get_from_orm_cache({"label": custom_relationship_annotation.name}, Relationship)
             if custom_relationship_annotation.side == RelationshipSideEnum.DESTINATION:
                 related_object_content_type = relationship.source_type
@@ -184,11 +174,14 @@ class NautobotModel(DiffSyncModel):
 
             return
 
-        django_field = cls._model._meta.get_field(field)
+        django_field = field_info.django_field
+        if django_field is None:
+            # Raise the appropriate error for fields that don't exist on the Django model.
+            cls._model._meta.get_field(field)
 
         # Prepare handling of many-to-many fields. If we are dealing with a many-to-many field,
         # we get all the related objects here to later set them once the object has been saved.
-        if django_field.many_to_many or django_field.one_to_many:
+        if field_info.kind == FieldKind.TO_MANY:
             try:
                 relationship_fields["many_to_many_fields"][field] = [
                     adapter.get_from_orm_cache(parameters, django_field.related_model) for parameters in value
@@ -208,7 +201,12 @@ class NautobotModel(DiffSyncModel):
 
     @classmethod
     def _update_obj_with_parameters(cls, obj, parameters, adapter):
-        """Update a given Nautobot ORM object with the given parameters."""
+        """Update a given Nautobot ORM object with the given parameters.
+
+        If the adapter has batched writes enabled, the object is queued on its `write_queue` rather than saved.
+        """
+        write_queue = getattr(adapter, "write_queue", None)
+        original_values = write_queue.snapshot(obj) if write_queue is not None and not obj._state.adding else None
         relationship_fields = {
             # Example: {"group": {"name": "Group Name", "_model_class": TenantGroup}}
             "foreign_keys": defaultdict(dict),
@@ -225,6 +223,14 @@ class NautobotModel(DiffSyncModel):
         # Set foreign keys
         cls._lookup_and_set_foreign_keys(relationship_fields["foreign_keys"], obj, adapter)
 
+        if write_queue is not None:
+            set_relationship_fields = partial(cls._set_relationship_fields, relationship_fields, obj, adapter)
+            if obj._state.adding:
+                write_queue.queue_create(obj, deferred=set_relationship_fields)
+            else:
+                write_queue.queue_update(obj, original_values, deferred=set_relationship_fields)
+            return
+
         # Save the object to the database
         try:
             obj.validated_save()
@@ -233,6 +239,11 @@ class NautobotModel(DiffSyncModel):
                 f"Validated save failed for Django object:\n{error}\nParameters: {parameters}"
             ) from error
 
+        cls._set_relationship_fields(relationship_fields, obj, adapter)
+
+    @classmethod
+    def _set_relationship_fields(cls, relationship_fields, obj, adapter):
+        """Set the relationship fields prepared by `_handle_single_field` on an object that has already been saved."""
         # Handle relationship association creation. This needs to be after object creation, because relationship
         # association objects rely on both sides already existing.
         cls._lookup_and_set_custom_relationship_foreign_keys(
@@ -1,10 +1,11 @@
 """Infoblox Adapter for Infoblox integration with SSoT app."""
 
 import re
+from functools import partial
 
 import requests
 from diffsync import Adapter
-from diffsync.enum import DiffSyncFlags
+from diffsync.enum import DiffSyncFlags, DiffSyncStatus
 from diffsync.exceptions import ObjectAlreadyExists
 from nautobot.extras.plugins.exceptions import PluginImproperlyConfigured
 
@@ -26,6 +27,21 @@ from nautobot_ssot.integrations.infoblox.utils.diffsync import (
     get_ext_attr_dict,
     map_network_view_to_namespace,
 )
+from nautobot_ssot.integrations.infoblox.utils.prefix_tree import PrefixTree
+
+
+def _fetch_all(getter, **kwargs) -> list:
+    """Call a paged getter of `InfobloxApi` and consume its results, i.e. within a worker of `execute_concurrently`."""
+    return list(getter(**kwargs))
+
+
+# Getters for loading DNS records and fixed addresses in bulk, with the name of the view parameter they take.
+IP_OBJECT_GETTERS = {
+    "fixedaddress": ("get_all_fixed_addresses", "network_view"),
+    "record:host": ("get_all_host_records", "dns_view"),
+    "record:a": ("get_all_a_records", "dns_view"),
+    "record:ptr": ("get_all_ptr_records", "dns_view"),
+}
 
 
 class InfobloxAdapter(Adapter):
@@ -67,6 +83,12 @@ class InfobloxAdapter(Adapter):
         self.config = config
         self.excluded_attrs = config.cf_fields_ignore.get("extensible_attributes", [])
         self.subnets = []
+        # Network containers and subnets per network view and IP version, see `_get_prefix_trees`.
+        self.prefix_trees = {}
+        # DNS records and fixed addresses referenced by IP addresses, indexed by their `_ref`.
+        self.ip_objects = {}
+        # Pairs of object types and views of which all DNS records or fixed addresses were loaded.
+        self.prefetched_ip_objects = set()
 
         if self.conn in [None, False]:
             self.job.logger.error(
@@ -84,7 +106,7 @@ class InfobloxAdapter(Adapter):
             self.job.logger.debug("Loading Network Views from Infoblox.")
         network_view_filters = {sf["network_view"] for sf in sync_filters if "network_view" in sf}
         try:
-            networkviews = self.conn.get_network_views()
+            networkviews = list(self.conn.get_network_views())
         except requests.exceptions.HTTPError as err:
             self.job.logger.error(f"Error while loading network views: {str(err)}")
             raise AdapterLoadException(str(err)) from err
@@ -104,9 +126,41 @@ class InfobloxAdapter(Adapter):
             )
             self.add(new_namespace)
 
+    def _get_prefix_trees(self, network_view: str, ip_version: str = "ipv4"):
+        """Return indexes of all network containers and subnets of a network view, loading them on first use.
+
+        Args:
+            network_view (str): Name of the network view
+            ip_version (str): IP version of prefixes, either "ipv4" or "ipv6"
+
+        Returns:
+            (tuple): Tuple consisting of a PrefixTree of container prefixes and a PrefixTree of subnet prefixes
+        """
+        key = (network_view, ip_version)
+        if key not in self.prefix_trees:
+            kwargs = {"network_view": network_view}
+            if ip_version == "ipv6":
+                kwargs["ipv6"] = True
+            containers_tree, subnets_tree = PrefixTree(), PrefixTree()
+            containers, subnets = self.conn.execute_concurrently(
+                [
+                    partial(_fetch_all, self.conn.get_network_containers, **kwargs),
+                    partial(_fetch_all, self.conn.get_all_subnets, **kwargs),
+                ]
+            )
+            for container in containers:
+                containers_tree.add(container["network"], container)
+            for subnet in subnets:
+                subnets_tree.add(subnet["network"], subnet)
+            self.prefix_trees[key] = containers_tree, subnets_tree
+        return self.prefix_trees[key]
+
     def _load_prefixes_filtered(self, sync_filter: dict, ip_version: str = "ipv4"):
         """Loads prefixes from Infoblox based on the provided sync filter.
 
+        The network containers and subnets of the network view are loaded once and indexed, rather than walking the
+        container hierarchy of each prefix in the filter with a request per container.
+
         Args:
             sync_filter (dict): Sync filter containing sync rules
             ip_version (str): IP version of prefixes, either "ipv4" or "ipv6"
@@ -117,20 +171,18 @@ class InfobloxAdapter(Adapter):
         containers = []
         subnets = []
         prefix_filter_attr = f"prefixes_{ip_version}"
-        network_view = sync_filter["network_view"]
+        containers_tree, subnets_tree = self._get_prefix_trees(sync_filter["network_view"], ip_version=ip_version)
 
         for prefix in sync_filter[prefix_filter_attr]:
-            tree = self.conn.get_tree_from_container(root_container=prefix, network_view=network_view)
-            containers.extend(tree)
-            # Need to check if the container has children. If it does, we need to get all subnets from the children
-            # If it doesn't, we can just get all subnets from the container
-            if tree:
-                for subnet in tree:
-                    subnets.extend(
-                        self.conn.get_child_subnets_from_container(prefix=subnet["network"], network_view=network_view)
-                    )
+            # If the prefix is a container, all containers and subnets within it are loaded.
+            # If it isn't, only the subnet matching the prefix is loaded.
+            if containers_tree.get(prefix) is not None:
+                containers.extend(containers_tree.subnets(prefix))
+                subnets.extend(subnets_tree.subnets(prefix))
             else:
-                subnets.extend(self.conn.get_all_subnets(prefix=prefix, network_view=network_view))
+                subnet = subnets_tree.get(prefix)
+                if subnet is not None:
+                    subnets.append(subnet)
 
         return containers, subnets
 
@@ -209,85 +261,136 @@ class InfobloxAdapter(Adapter):
             except ObjectAlreadyExists:
                 self.job.logger.warning(f"Duplicate prefix found: {new_pf}.")
 
-    def load_ipaddresses(self):  # pylint: disable=too-many-branches,too-many-locals,too-many-statements
-        """Load InfobloxIPAddress DiffSync model."""
+    def _prefetch_ip_objects(self, ref_type: str, view: str):
+        """Load all DNS records or fixed addresses of a type and view in bulk.
+
+        Records that can't be found in the loaded data are later fetched individually by `_get_ip_object`.
+
+        Args:
+            ref_type (str): Object type as found in references, i.e. `record:host` or `fixedaddress`
+            view (str): DNS view for DNS records, network view for fixed addresses
+        """
+        getter_name, view_param = IP_OBJECT_GETTERS[ref_type]
+        try:
+            for record in getattr(self.conn, getter_name)(**{view_param: view}):
+                self.ip_objects[record["_ref"]] = record
+        except requests.exceptions.HTTPError as err:
+            self.job.logger.warning(
+                f"Error while loading {ref_type} objects of view {view} in bulk, loading them one by one: {str(err)}"
+            )
+        if self.job.debug:
+            self.job.logger.debug(f"Loaded {len(self.ip_objects)} DNS records and fixed addresses from Infoblox.")
+
+    def _get_ip_object(self, ref: str, getter) -> dict:
+        """Return a DNS record or fixed address, fetching it using `getter` if it can't be loaded in bulk.
+
+        The first reference to a type of object in a view loads all objects of that type and view, so that IP
+        addresses referencing them don't need a request each.
+        """
+        ref_type = ref.split("/", 1)[0]
+        # References end with the view of the object, i.e. `record:host/ZG5z...:server.example.com/default`.
+        prefetch_key = (ref_type, ref.rsplit("/", 1)[-1])
+        if ref_type in IP_OBJECT_GETTERS and prefetch_key not in self.prefetched_ip_objects:
+            self.prefetched_ip_objects.add(prefetch_key)
+            self._prefetch_ip_objects(*prefetch_key)
+        ip_object = self.ip_objects.get(ref)
+        if ip_object is None:
+            ip_object = getter(ref)
+        return ip_object
+
+    def load_ipaddresses(self):
+        """Load InfobloxIPAddress DiffSync model.
+
+        IP addresses are processed page by page as they are returned by Infoblox, rather than loading all of them
+        into memory first.
+        """
         if self.job.debug:
             self.job.logger.debug("Loading IP addresses from Infoblox.")
+        default_ext_attrs = {}
         try:
-            ipaddrs = self.conn.get_all_ipv4address_networks(prefixes=self.subnets)
+            for _ip in self.conn.get_all_ipv4address_networks(prefixes=self.subnets):
+                ip_ext_attrs = get_ext_attr_dict(extattrs=_ip.get("extattrs", {}), excluded_attrs=self.excluded_attrs)
+                default_ext_attrs.update(dict.fromkeys(ip_ext_attrs))
+                self._load_ipaddress(_ip, ext_attrs=ip_ext_attrs)
         except requests.exceptions.HTTPError as err:
             self.job.logger.error(f"Error while loading IP addresses: {str(err)}")
             raise AdapterLoadException(str(err)) from err
 
-        default_ext_attrs = get_default_ext_attrs(review_list=ipaddrs, excluded_attrs=self.excluded_attrs)
-        for _ip in ipaddrs:
-            _, prefix_length = _ip["network"].split("/")
-            network_view = _ip["network_view"]
-            namespace = map_network_view_to_namespace(value=network_view, direction="nv_to_ns")
-
-            ip_ext_attrs = get_ext_attr_dict(extattrs=_ip.get("extattrs", {}), excluded_attrs=self.excluded_attrs)
-            new_ip = self.ipaddress(
-                address=_ip["ip_address"],
-                prefix=_ip["network"],
-                prefix_length=prefix_length,
-                namespace=namespace,
-                status=self.conn.get_ipaddr_status(_ip),
-                description="",
-                ip_addr_type="host",
-                ext_attrs={**default_ext_attrs, **ip_ext_attrs},
-                mac_address="" if not _ip["mac_address"] else _ip["mac_address"],
-                fixed_address_comment="",
-            )
+        # Extensibility Attributes missing from an IP address default to None, which can only be determined once
+        # all IP addresses have been seen.
+        for ipaddress in self.get_all(self.ipaddress):
+            ipaddress.ext_attrs = {**default_ext_attrs, **ipaddress.ext_attrs}
 
-            # Record references to DNS Records linked to this IP Address.
-            # Field `comment` in IP Address records can come from linked fixed address or DNS record.
-            # We add extra logic to tell DNS record and fixed address comments apart.
-            a_record_ref, host_record_ref, ptr_record_ref = None, None, None
-            for ref in _ip["objects"]:
-                obj_type = ref.split("/")[0]
-                if obj_type == "record:host":
-                    new_ip.has_host_record = True
-                    host_record_ref = ref
-                elif obj_type == "record:a":
-                    new_ip.has_a_record = True
-                    a_record_ref = ref
-                elif obj_type == "record:ptr":
-                    new_ip.has_ptr_record = True
-                    ptr_record_ref = ref
-                # We currently only support RESERVED and MAC_ADDRESS types for fixed address objects.
-                elif obj_type == "fixedaddress":
-                    if "RESERVATION" in _ip["types"]:
-                        new_ip.fixed_address_type = "RESERVED"
-                        new_ip.has_fixed_address = True
-                        new_ip.fixed_address_ref = ref
-                    elif "FA" in _ip["types"]:
-                        new_ip.fixed_address_type = "MAC_ADDRESS"
-                        new_ip.has_fixed_address = True
-                        new_ip.fixed_address_ref = ref
-
-            # We use Nautobot IP Address description for Infoblox Fixed Address name
-            if new_ip.has_fixed_address:
-                fixed_address = self.conn.get_fixed_address_by_ref(new_ip.fixed_address_ref)
-                new_ip.description = fixed_address.get("name") or ""
-                new_ip.fixed_address_comment = fixed_address.get("comment") or ""
-
-            # Default type is `host` but fixed address records must be `dhcp`
-            if (
-                new_ip.has_fixed_address
-                and self.config.fixed_address_type != FixedAddressTypeChoices.DONT_CREATE_RECORD
-            ):
-                new_ip.ip_addr_type = "dhcp"
-
-            # Load individual DNS records
-            if new_ip.has_a_record and a_record_ref:
-                self._load_dns_a_record_for_ip(ref=a_record_ref, ip_record=new_ip, namespace=namespace)
-            if new_ip.has_host_record and host_record_ref:
-                self._load_dns_host_record_for_ip(ref=host_record_ref, ip_record=new_ip, namespace=namespace)
-            if new_ip.has_ptr_record and ptr_record_ref:
-                self._load_dns_ptr_record_for_ip(ref=ptr_record_ref, ip_record=new_ip, namespace=namespace)
-
-            if new_ip.has_fixed_address or new_ip.has_a_record or new_ip.has_host_record:
-                self.add(new_ip)
+    def _load_ipaddress(self, _ip: dict, ext_attrs: dict):  # pylint: disable=too-many-branches
+        """Load a single InfobloxIPAddress and the DNS records linked to it.
+
+        Args:
+            _ip (dict): IP address as returned by `get_all_ipv4address_networks`
+            ext_attrs (dict): Normalized Extensibility Attributes of the IP address
+        """
+        _, prefix_length = _ip["network"].split("/")
+        network_view = _ip["network_view"]
+        namespace = map_network_view_to_namespace(value=network_view, direction="nv_to_ns")
+
+        new_ip = self.ipaddress(
+            address=_ip["ip_address"],
+            prefix=_ip["network"],
+            prefix_length=prefix_length,
+            namespace=namespace,
+            status=self.conn.get_ipaddr_status(_ip),
+            description="",
+            ip_addr_type="host",
+            ext_attrs=ext_attrs,
+            mac_address="" if not _ip["mac_address"] else _ip["mac_address"],
+            fixed_address_comment="",
+        )
+
+        # Record references to DNS Records linked to this IP Address.
+        # Field `comment` in IP Address records can come from linked fixed address or DNS record.
+        # We add extra logic to tell DNS record and fixed address comments apart.
+        a_record_ref, host_record_ref, ptr_record_ref = None, None, None
+        for ref in _ip["objects"]:
+            obj_type = ref.split("/")[0]
+            if obj_type == "record:host":
+                new_ip.has_host_record = True
+                host_record_ref = ref
+            elif obj_type == "record:a":
+                new_ip.has_a_record = True
+                a_record_ref = ref
+            elif obj_type == "record:ptr":
+                new_ip.has_ptr_record = True
+                ptr_record_ref = ref
+            # We currently only support RESERVED and MAC_ADDRESS types for fixed address objects.
+            elif obj_type == "fixedaddress":
+                if "RESERVATION" in _ip["types"]:
+                    new_ip.fixed_address_type = "RESERVED"
+                    new_ip.has_fixed_address = True
+                    new_ip.fixed_address_ref = ref
+                elif "FA" in _ip["types"]:
+                    new_ip.fixed_address_type = "MAC_ADDRESS"
+                    new_ip.has_fixed_address = True
+                    new_ip.fixed_address_ref = ref
+
+        # We use Nautobot IP Address description for Infoblox Fixed Address name
+        if new_ip.has_fixed_address:
+            fixed_address = self._get_ip_object(new_ip.fixed_address_ref, self.conn.get_fixed_address_by_ref)
+            new_ip.description = fixed_address.get("name") or ""
+            new_ip.fixed_address_comment = fixed_address.get("comment") or ""
+
+        # Default type is `host` but fixed address records must be `dhcp`
+        if new_ip.has_fixed_address and self.config.fixed_address_type != FixedAddressTypeChoices.DONT_CREATE_RECORD:
+            new_ip.ip_addr_type = "dhcp"
+
+        # Load individual DNS records
+        if new_ip.has_a_record and a_record_ref:
+            self._load_dns_a_record_for_ip(ref=a_record_ref, ip_record=new_ip, namespace=namespace)
+        if new_ip.has_host_record and host_record_ref:
+            self._load_dns_host_record_for_ip(ref=host_record_ref, ip_record=new_ip, namespace=namespace)
+        if new_ip.has_ptr_record and ptr_record_ref:
+            self._load_dns_ptr_record_for_ip(ref=ptr_record_ref, ip_record=new_ip, namespace=namespace)
+
+        if new_ip.has_fixed_address or new_ip.has_a_record or new_ip.has_host_record:
+            self.add(new_ip)
 
     def _load_dns_host_record_for_ip(self, ref: str, ip_record: object, namespace: str):
         """Load the DNS Host record.
@@ -297,7 +400,7 @@ class InfobloxAdapter(Adapter):
             ip_record (object): Parent IP Address record
             namespace (str): Namespace of this record
         """
-        host_record = self.conn.get_host_record_by_ref(ref)
+        host_record = self._get_ip_object(ref, self.conn.get_host_record_by_ref)
         record_ext_attrs = get_ext_attr_dict(
             extattrs=host_record.get("extattrs", {}), excluded_attrs=self.excluded_attrs
         )
@@ -325,7 +428,7 @@ class InfobloxAdapter(Adapter):
             ip_record (object): Parent IP Address record
             namespace (str): Namespace of this record
         """
-        a_record = self.conn.get_a_record_by_ref(ref)
+        a_record = self._get_ip_object(ref, self.conn.get_a_record_by_ref)
         record_ext_attrs = get_ext_attr_dict(extattrs=a_record.get("extattrs", {}), excluded_attrs=self.excluded_attrs)
 
         new_a_record = self.dnsarecord(
@@ -351,7 +454,7 @@ class InfobloxAdapter(Adapter):
             ip_record (object): Parent IP Address record
             namespace (str): Namespace of this record
         """
-        ptr_record = self.conn.get_ptr_record_by_ref(ref)
+        ptr_record = self._get_ip_object(ref, self.conn.get_ptr_record_by_ref)
         record_ext_attrs = get_ext_attr_dict(
             extattrs=ptr_record.get("extattrs", {}), excluded_attrs=self.excluded_attrs
         )
@@ -376,7 +479,7 @@ class InfobloxAdapter(Adapter):
         if self.job.debug:
             self.job.logger.debug("Loading VLAN Views from Infoblox.")
         try:
-            vlanviews = self.conn.get_vlanviews()
+            vlanviews = list(self.conn.get_vlanviews())
         except requests.exceptions.HTTPError as err:
             self.job.logger.error(f"Error while loading VLAN views: {str(err)}")
             raise AdapterLoadException(str(err)) from err
@@ -396,7 +499,7 @@ class InfobloxAdapter(Adapter):
         if self.job.debug:
             self.job.logger.debug("Loading VLANs from Infoblox.")
         try:
-            vlans = self.conn.get_vlans()
+            vlans = list(self.conn.get_vlans())
         except requests.exceptions.HTTPError as err:
             self.job.logger.error(f"Error while loading VLANs: {str(err)}")
             raise AdapterLoadException(str(err)) from err
@@ -434,6 +537,50 @@ class InfobloxAdapter(Adapter):
             if obj in self.dict():
                 self.job.logger.info(f"Loaded {len(self.dict()[obj])} {obj} from Infoblox.")
 
+    def claim_writes(self, model):
+        """Attribute the writes the Infoblox client queued since the last call to the model they were made for.
+
+        Called by the Infoblox models once they have been created, updated or deleted. Queued writes are sent as soon
+        as there are enough of them to fill a request.
+        """
+        queue = self.conn.write_queue if self.config.write_batch_size else None
+        if queue is None:
+            return
+        for write in reversed(queue):
+            if write.context is not None:
+                break
+            write.context = model
+        if len(queue) >= self.conn.write_batch_size:
+            self.flush_writes()
+
+    def flush_writes(self):
+        """Send the queued writes to Infoblox and mark the models of the writes that failed."""
+        if not self.config.write_batch_size:
+            return
+        for write in self.conn.flush_writes():
+            if not write.error:
+                continue
+            if write.context is not None:
+                write.context.set_status(DiffSyncStatus.ERROR, write.error)
+                self.job.logger.warning(
+                    f"Failed to {write.method} {write.context.get_type()} {write.context.get_unique_id()} "
+                    f"in Infoblox: {write.error}"
+                )
+            else:
+                self.job.logger.warning(f"Failed to {write.method} {write.object} in Infoblox: {write.error}")
+
+    def sync_from(self, source, *args, **kwargs):  # pylint: disable=arguments-differ
+        """Sync from another adapter, sending the changes to Infoblox in batches if `write_batch_size` is set."""
+        if not self.config.write_batch_size:
+            return super().sync_from(source, *args, **kwargs)
+        self.conn.queue_writes()
+        try:
+            return super().sync_from(source, *args, **kwargs)
+        finally:
+            self.flush_writes()
+            self.conn.write_queue = None
+
     def sync_complete(self, source, diff, flags=DiffSyncFlags.NONE, logger=None):
         """Add tags and custom fields to synced objects."""
+        self.flush_writes()
         source.tag_involved_objects(target=self)
@@ -5,8 +5,9 @@ import datetime
 from typing import Optional
 
 from diffsync import Adapter
-from diffsync.exceptions import ObjectAlreadyExists, ObjectNotFound
+from diffsync.exceptions import ObjectAlreadyExists
 from django.contrib.contenttypes.models import ContentType
+from django.db.models import Q
 from nautobot.dcim.models import Location
 from nautobot.extras.choices import CustomFieldTypeChoices
 from nautobot.extras.models import CustomField, Relationship, Role, Status, Tag
@@ -32,14 +33,16 @@ from nautobot_ssot.integrations.infoblox.utils.diffsync import (
     map_network_view_to_namespace,
     nautobot_vlan_status,
 )
-from nautobot_ssot.integrations.infoblox.utils.nautobot import build_vlan_map_from_relations, get_prefix_vlans
+from nautobot_ssot.integrations.infoblox.utils.nautobot import build_vlan_map_from_relations, get_vlans_by_prefix
+from nautobot_ssot.utils import bulk_tag_objects
 
 
 class NautobotMixin:
     """Add specific objects onto Nautobot objects to provide information on sync status with Infoblox."""
 
-    def tag_involved_objects(self, target):
-        """Tag all objects that were successfully synced to the target."""
+    @staticmethod
+    def get_synced_tag_and_custom_field():
+        """Return the tag and custom field marking objects synced to Infoblox, creating them if they are missing."""
         # The ssot_synced_to_infoblox tag *should* have been created automatically during app installation
         # (see nautobot_ssot/integrations/infoblox/signals.py) but maybe a user deleted it inadvertently, so be safe:
         tag, _ = Tag.objects.get_or_create(
@@ -62,39 +65,24 @@ class NautobotMixin:
         )
         for model in [IPAddress, Prefix, VLAN, VLANGroup]:
             custom_field.content_types.add(ContentType.objects.get_for_model(model))
+        return tag, custom_field
 
-        for modelname in ["ipaddress", "prefix", "vlan", "vlangroup"]:
+    def tag_involved_objects(self, target):
+        """Tag all objects that were successfully synced to the target."""
+        tag, custom_field = self.get_synced_tag_and_custom_field()
+        today = datetime.date.today().isoformat()
+        for modelname, model_class in [
+            ("ipaddress", IPAddress),
+            ("prefix", Prefix),
+            ("vlan", VLAN),
+            ("vlangroup", VLANGroup),
+        ]:
+            pks = []
             for local_instance in self.get_all(modelname):
-                unique_id = local_instance.get_unique_id()
                 # Verify that the object now has a counterpart in the target DiffSync
-                try:
-                    target.get(modelname, unique_id)
-                except ObjectNotFound:
-                    continue
-
-                self.tag_object(modelname, unique_id, tag, custom_field)
-
-    def tag_object(self, modelname, unique_id, tag, custom_field):
-        """Apply the given tag and custom field to the identified object."""
-        model_instance = self.get(modelname, unique_id)
-        today = datetime.date.today().isoformat()
-
-        def _tag_object(nautobot_object):
-            """Apply custom field and tag to object, if applicable."""
-            if hasattr(nautobot_object, "tags"):
-                nautobot_object.tags.add(tag)
-            if hasattr(nautobot_object, "cf"):
-                nautobot_object.cf[custom_field.key] = today
-            nautobot_object.validated_save()
-
-        if modelname == "ipaddress":
-            _tag_object(IPAddress.objects.get(pk=model_instance.pk))
-        elif modelname == "prefix":
-            _tag_object(Prefix.objects.get(pk=model_instance.pk))
-        elif modelname == "vlan":
-            _tag_object(VLAN.objects.get(pk=model_instance.pk))
-        elif modelname == "vlangroup":
-            _tag_object(VLANGroup.objects.get(pk=model_instance.pk))
+                if local_instance.pk is not None and target.get_or_none(modelname, local_instance.get_unique_id()):
+                    pks.append(local_instance.pk)
+            bulk_tag_objects(model_class, pks, tag=tag, custom_field_values={custom_field.key: today})
 
 
 class NautobotAdapter(NautobotMixin, Adapter):  # pylint: disable=too-many-instance-attributes
@@ -122,6 +110,8 @@ class NautobotAdapter(NautobotMixin, Adapter):  # pylint: disable=too-many-insta
     ipaddr_map = {}
     vlan_map = {}
     vlangroup_map = {}
+    # Pairs of Custom Field keys and content type IDs, see `_get_ext_attr_custom_field` in the Nautobot models.
+    ext_attr_custom_fields = None
 
     def __init__(self, *args, job=None, sync=None, config, **kwargs):
         """Initialize Nautobot.
@@ -193,6 +183,8 @@ class NautobotAdapter(NautobotMixin, Adapter):  # pylint: disable=too-many-insta
     def _load_all_prefixes_filtered(self, sync_filters: list, include_ipv4: bool, include_ipv6: bool):
         """Loads prefixes from Nautobot based on the provided sync filter.
 
+        All sync filters are combined into a single query.
+
         Args:
             sync_filter (dict): Sync filter containing sync rules
             include_ipv4 (bool): Whether to include IPv4 prefixes
@@ -201,7 +193,8 @@ class NautobotAdapter(NautobotMixin, Adapter):  # pylint: disable=too-many-insta
         Returns:
             (PrefixQuerySet): PrefixQuerySet with prefixes
         """
-        all_prefixes = Prefix.objects.none()
+        query = Q()
+        has_filters = False
         for sync_filter in sync_filters:
             query_filters = {}
             if "network_view" in sync_filter:
@@ -209,21 +202,24 @@ class NautobotAdapter(NautobotMixin, Adapter):  # pylint: disable=too-many-insta
                 query_filters["namespace__name"] = namespace
             if "prefixes_ipv4" in sync_filter and include_ipv4:
                 for pfx_ipv4 in sync_filter["prefixes_ipv4"]:
-                    query_filters["network__net_contained_or_equal"] = pfx_ipv4
-                    all_prefixes = all_prefixes.union(Prefix.objects.filter(**query_filters))
+                    query |= Q(**query_filters, network__net_contained_or_equal=pfx_ipv4)
+                    has_filters = True
             if "prefixes_ipv6" in sync_filter and include_ipv6:
                 for pfx_ipv6 in sync_filter["prefixes_ipv6"]:
-                    query_filters["network__net_contained_or_equal"] = pfx_ipv6
-                    all_prefixes = all_prefixes.union(Prefix.objects.filter(**query_filters))
+                    query |= Q(**query_filters, network__net_contained_or_equal=pfx_ipv6)
+                    has_filters = True
             # Filter on namespace name only
             if "prefixes_ipv4" not in sync_filter and "prefixes_ipv6" not in sync_filter:
                 if include_ipv4 and not include_ipv6:
                     query_filters["ip_version"] = 4
                 elif include_ipv6 and not include_ipv4:
                     query_filters["ip_version"] = 6
-                all_prefixes = all_prefixes.union(Prefix.objects.filter(**query_filters))
+                query |= Q(**query_filters)
+                has_filters = True
 
-        return all_prefixes
+        if not has_filters:
+            return Prefix.objects.none()
+        return Prefix.objects.filter(query).select_related("namespace")
 
     def load_prefixes(self, include_ipv4: bool, include_ipv6: bool, sync_filters: list):
         """Load Prefixes from Nautobot.
@@ -242,10 +238,11 @@ class NautobotAdapter(NautobotMixin, Adapter):  # pylint: disable=too-many-insta
         default_cfs = get_default_custom_fields(
             cf_contenttype=ContentType.objects.get_for_model(Prefix), excluded_cfs=self.excluded_cfs
         )
+        vlans_by_prefix = get_vlans_by_prefix()
         for prefix in all_prefixes:
             self.prefix_map[(prefix.namespace.name), str(prefix.prefix)] = prefix.id
             dhcp_ranges = prefix.cf.get("dhcp_ranges")
-            current_vlans = get_prefix_vlans(prefix=prefix)
+            current_vlans = vlans_by_prefix.get(prefix.id, [])
             custom_fields = get_valid_custom_fields(prefix.custom_field_data, excluded_cfs=self.excluded_cfs)
             _prefix = self.prefix(
                 network=str(prefix.prefix),
@@ -266,6 +263,8 @@ class NautobotAdapter(NautobotMixin, Adapter):  # pylint: disable=too-many-insta
     def _load_all_ipaddresses_filtered(self, sync_filters: list, include_ipv4: bool, include_ipv6: bool):
         """Loads ip addresses from Nautobot based on the provided sync filter.
 
+        All sync filters are combined into a single query.
+
         Args:
             sync_filter (dict): Sync filter containing sync rules
             include_ipv4 (bool): Whether to include IPv4 addresses
@@ -274,27 +273,31 @@ class NautobotAdapter(NautobotMixin, Adapter):  # pylint: disable=too-many-insta
         Returns:
             (IPAddressQuerySet): IPAddressQuerySet with ip addresses
         """
-        all_ipaddresses = IPAddress.objects.none()
+        query = Q()
+        has_filters = False
         for sync_filter in sync_filters:
             query_filters = {}
             if "network_view" in sync_filter:
                 namespace = map_network_view_to_namespace(sync_filter["network_view"], direction="nv_to_ns")
                 query_filters["parent__namespace__name"] = namespace
             if "prefixes_ipv4" in sync_filter and include_ipv4:
-                query_filters["host__net_in"] = sync_filter["prefixes_ipv4"]
-                all_ipaddresses = all_ipaddresses.union(IPAddress.objects.filter(**query_filters))
+                query |= Q(**query_filters, host__net_in=sync_filter["prefixes_ipv4"])
+                has_filters = True
             if "prefixes_ipv6" in sync_filter and include_ipv6:
-                query_filters["host__net_in"] = sync_filter["prefixes_ipv6"]
-                all_ipaddresses = all_ipaddresses.union(IPAddress.objects.filter(**query_filters))
+                query |= Q(**query_filters, host__net_in=sync_filter["prefixes_ipv6"])
+                has_filters = True
             # Filter on namespace name only
             if "prefixes_ipv4" not in sync_filter and "prefixes_ipv6" not in sync_filter:
                 if include_ipv4 and not include_ipv6:
                     query_filters["ip_version"] = 4
                 elif include_ipv6 and not include_ipv4:
                     query_filters["ip_version"] = 6
-                all_ipaddresses = all_ipaddresses.union(IPAddress.objects.filter(**query_filters))
+                query |= Q(**query_filters)
+                has_filters = True
 
-        return all_ipaddresses
+        if not has_filters:
+            return IPAddress.objects.none()
+        return IPAddress.objects.filter(query).select_related("parent__namespace", "status")
 
     def load_ipaddresses(self, include_ipv4: bool, include_ipv6: bool, sync_filters: list):  # pylint: disable=too-many-branches
         """Load IP Addresses from Nautobot.
@@ -20,7 +20,33 @@ from nautobot_ssot.integrations.infoblox.diffsync.models.base import (
 from nautobot_ssot.integrations.infoblox.utils.diffsync import map_network_view_to_namespace, validate_dns_name
 
 
-class InfobloxNetwork(Network):
+class InfobloxWriteMixin:
+    """Mixin for Infoblox models, attributing writes queued by the Infoblox client to the model they were made for.
+
+    Must be listed before the base model, so that it runs after the create, update or delete of the Infoblox model.
+    """
+
+    @classmethod
+    def create(cls, adapter, ids, attrs):
+        """Create the model and claim the writes queued for it."""
+        model = super().create(adapter=adapter, ids=ids, attrs=attrs)
+        adapter.claim_writes(model)
+        return model
+
+    def update(self, attrs):
+        """Update the model and claim the writes queued for it."""
+        model = super().update(attrs)
+        self.adapter.claim_writes(self)
+        return model
+
+    def delete(self):
+        """Delete the model and claim the writes queued for it."""
+        model = super().delete()
+        self.adapter.claim_writes(self)
+        return model
+
+
+class InfobloxNetwork(InfobloxWriteMixin, Network):
     """Infoblox implementation of the Network Model."""
 
     @classmethod
@@ -81,7 +107,7 @@ class InfobloxVLAN(Vlan):
     """Infoblox implementation of the VLAN Model."""
 
 
-class InfobloxIPAddress(IPAddress):  # pylint: disable=too-many-instance-attributes
+class InfobloxIPAddress(InfobloxWriteMixin, IPAddress):  # pylint: disable=too-many-instance-attributes
     """Infoblox implementation of the VLAN Model."""
 
     @classmethod
@@ -272,7 +298,7 @@ class InfobloxNamespace(Namespace):
         raise NotImplementedError
 
 
-class InfobloxDnsARecord(DnsARecord):
+class InfobloxDnsARecord(InfobloxWriteMixin, DnsARecord):
     """Infoblox implementation of the DnsARecord Model."""
 
     @classmethod
@@ -369,7 +395,7 @@ class InfobloxDnsARecord(DnsARecord):
         return super().delete()
 
 
-class InfobloxDnsHostRecord(DnsHostRecord):
+class InfobloxDnsHostRecord(InfobloxWriteMixin, DnsHostRecord):
     """Infoblox implementation of the DnsHostRecord Model."""
 
     @classmethod
@@ -457,7 +483,7 @@ class InfobloxDnsHostRecord(DnsHostRecord):
         return super().delete()
 
 
-class InfobloxDnsPTRRecord(DnsPTRRecord):
+class InfobloxDnsPTRRecord(InfobloxWriteMixin, DnsPTRRecord):
     """Infoblox implementation of the DnsPTRRecord Model."""
 
     @classmethod
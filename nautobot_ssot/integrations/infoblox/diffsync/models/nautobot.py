@@ -2,7 +2,6 @@
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
-from django.utils.text import slugify
 from nautobot.extras.choices import CustomFieldTypeChoices
 from nautobot.extras.models import CustomField as OrmCF
 from nautobot.extras.models import RelationshipAssociation as OrmRelationshipAssociation
@@ -30,11 +29,41 @@ from nautobot_ssot.integrations.infoblox.diffsync.models.base import (
 )
 from nautobot_ssot.integrations.infoblox.utils.diffsync import (
     create_tag_sync_from_infoblox,
+    get_ext_attr_key,
     map_network_view_to_namespace,
 )
 from nautobot_ssot.integrations.infoblox.utils.nautobot import get_prefix_vlans
 
 
+def _get_ext_attr_custom_field(adapter, attr: str, model: type) -> str:
+    """Return the key of the Custom Field for an Extensibility Attribute, creating the Custom Field if needed.
+
+    The Custom Fields and content types that already exist are loaded once per adapter, so that processing the
+    Extensibility Attributes of an object doesn't query the database, unless a new Custom Field is required.
+
+    Args:
+        adapter (object): DiffSync Adapter
+        attr (str): Name of the Extensibility Attribute.
+        model (type): Model class of the object the Extensibility Attribute is set on.
+    """
+    if adapter.ext_attr_custom_fields is None:
+        adapter.ext_attr_custom_fields = set(
+            OrmCF.content_types.through.objects.values_list("customfield__key", "contenttype_id")
+        )
+    cf_key = get_ext_attr_key(attr)
+    content_type_id = ContentType.objects.get_for_model(model).id
+    if (cf_key, content_type_id) not in adapter.ext_attr_custom_fields:
+        _cf_dict = {
+            "key": cf_key,
+            "type": CustomFieldTypeChoices.TYPE_TEXT,
+            "label": attr,
+        }
+        field, _ = OrmCF.objects.get_or_create(key=_cf_dict["key"], defaults=_cf_dict)
+        field.content_types.add(content_type_id)
+        adapter.ext_attr_custom_fields.add((cf_key, content_type_id))
+    return cf_key
+
+
 def process_ext_attrs(adapter, obj: object, extattrs: dict):  # pylint: disable=too-many-branches
     """Process Extensibility Attributes into Custom Fields or link to found objects.
 
@@ -103,14 +132,8 @@ def process_ext_attrs(adapter, obj: object, extattrs: dict):  # pylint: disable=
                         f"in Extensibility Attributes '{attr}', but multiple tenant assignments are not "
                         f"supported by Nautobot. {err}"
                     )
-            _cf_dict = {
-                "key": slugify(attr).replace("-", "_"),
-                "type": CustomFieldTypeChoices.TYPE_TEXT,
-                "label": attr,
-            }
-            field, _ = OrmCF.objects.get_or_create(key=_cf_dict["key"], defaults=_cf_dict)
-            field.content_types.add(ContentType.objects.get_for_model(type(obj)).id)
-            obj.custom_field_data.update({_cf_dict["key"]: str(attr_value)})
+            cf_key = _get_ext_attr_custom_field(adapter=adapter, attr=attr, model=type(obj))
+            obj.custom_field_data.update({cf_key: str(attr_value)})
 
 
 def _create_ip_address_common(adapter: object, ids: dict, attrs: dict) -> IPAddress:
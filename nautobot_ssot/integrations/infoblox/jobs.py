@@ -1,9 +1,14 @@
 """Jobs for Infoblox integration with SSoT app."""
 
+import copy
+from concurrent.futures import ThreadPoolExecutor
+
 from diffsync.enum import DiffSyncFlags
+from diffsync.exceptions import ObjectAlreadyExists
+from django.db import connections
 from django.templatetags.static import static
 from django.urls import reverse
-from nautobot.apps.jobs import ObjectVar
+from nautobot.apps.jobs import IntegerVar, ObjectVar
 from nautobot.extras.choices import SecretsGroupAccessTypeChoices, SecretsGroupSecretTypeChoices
 from nautobot.extras.jobs import BooleanVar
 
@@ -35,15 +40,158 @@ def _get_infoblox_client_config(app_config, debug):
         "timeout": app_config.infoblox_instance.timeout,
         "debug": debug,
         "network_view_to_dns_map": app_config.infoblox_dns_view_mapping,
+        "max_concurrent_requests": app_config.max_concurrent_requests,
+        "write_batch_size": app_config.write_batch_size,
+        "cache_timeout": app_config.cache_timeout,
+        "cache_namespace": str(app_config.pk),
     }
 
     return infoblox_client_config
 
 
-class InfobloxDataSource(DataSource):
+class InfobloxSyncMixin:
+    """Adapter handling shared by the Infoblox jobs, including syncing each network view on its own.
+
+    With more than one network view worker, the sync is partitioned by the network views of the sync filters. Each
+    partition has its own pair of adapters, and the partitions are loaded in parallel in worker threads. The objects of
+    all partitions are then combined into `self.source_adapter` and `self.target_adapter`, so that the diff is
+    calculated and stored as for any other sync. The changes are synced partition by partition, in parallel if the
+    target is Infoblox.
+    """
+
+    def get_infoblox_adapter(self, config):
+        """Return an Infoblox adapter for a config, with a client of its own."""
+        client_config = _get_infoblox_client_config(config, self.debug)
+        client = InfobloxApi(**client_config)
+        if self.clear_cache:
+            client.invalidate_cache()
+            # All clients of a config share the cached data, so it only needs to be cleared once.
+            self.clear_cache = False
+        return infoblox.InfobloxAdapter(job=self, sync=self.sync, conn=client, config=config)
+
+    def get_network_view_sync_filters(self) -> dict:
+        """Return the sync filters of the config grouped by network view, in the order the network views appear in."""
+        sync_filters = {}
+        for sync_filter in self.config.infoblox_sync_filters:
+            sync_filters.setdefault(sync_filter["network_view"], []).append(sync_filter)
+        return sync_filters
+
+    def is_partitioned(self) -> bool:
+        """Return whether the sync is partitioned by network view."""
+        return self.network_view_workers > 1 and len(self.get_network_view_sync_filters()) > 1
+
+    def get_partition_configs(self) -> list:
+        """Return a copy of the config for each network view in its sync filters, with the filters of that view.
+
+        VLAN views and VLANs don't belong to a network view, so they are only loaded in the first partition.
+        """
+        configs = []
+        for index, sync_filters in enumerate(self.get_network_view_sync_filters().values()):
+            config = copy.copy(self.config)
+            config.infoblox_sync_filters = sync_filters
+            if index:
+                config.import_vlan_views = False
+                config.import_vlans = False
+            configs.append(config)
+        return configs
+
+    def _run_in_workers(self, function, partitions):
+        """Call `function` with each partition, using up to `network_view_workers` threads."""
+
+        def run_in_worker(partition):
+            try:
+                return function(*partition)
+            finally:
+                connections.close_all()
+
+        with ThreadPoolExecutor(max_workers=self.network_view_workers, thread_name_prefix="infoblox-sync") as executor:
+            # Consume the results, so that exceptions raised in the workers are raised here.
+            list(executor.map(run_in_worker, partitions))
+
+    def load_partitions(self):
+        """Load the source and target adapters of each network view, and combine them into one of each."""
+        self.partitions = []
+        for config in self.get_partition_configs():
+            infoblox_adapter = self.get_infoblox_adapter(config)
+            nautobot_adapter = nautobot.NautobotAdapter(job=self, sync=self.sync, config=config)
+            if self.data_source == "Infoblox":
+                self.partitions.append((infoblox_adapter, nautobot_adapter))
+            else:
+                self.partitions.append((nautobot_adapter, infoblox_adapter))
+        self.logger.info(
+            f"Loading {len(self.partitions)} network views with {self.network_view_workers} workers in parallel..."
+        )
+
+        def load_partition(source_adapter, target_adapter):
+            source_adapter.load()
+            target_adapter.load()
+
+        self._run_in_workers(load_partition, self.partitions)
+
+        source_adapter, target_adapter = self.partitions[0]
+        self.source_adapter = self._combine_adapters(
+            type(source_adapter)(
+                job=self, sync=self.sync, config=self.config, **self._get_adapter_kwargs(source_adapter)
+            ),
+            [source for source, _ in self.partitions],
+        )
+        self.target_adapter = self._combine_adapters(
+            type(target_adapter)(
+                job=self, sync=self.sync, config=self.config, **self._get_adapter_kwargs(target_adapter)
+            ),
+            [target for _, target in self.partitions],
+        )
+
+    @staticmethod
+    def _get_adapter_kwargs(adapter) -> dict:
+        return {"conn": adapter.conn} if isinstance(adapter, infoblox.InfobloxAdapter) else {}
+
+    def _combine_adapters(self, combined_adapter, adapters):
+        """Add the objects of the adapters of all partitions to `combined_adapter`."""
+        for adapter in adapters:
+            for modelname in adapter.get_all_model_names():
+                for obj in adapter.get_all(modelname):
+                    try:
+                        combined_adapter.add(obj)
+                    except ObjectAlreadyExists:
+                        self.logger.warning(f"Found {modelname} {obj.get_unique_id()} in multiple network views.")
+        return combined_adapter
+
+    def execute_sync(self):
+        """Sync each partition on its own if the sync is partitioned, see `load_partitions`.
+
+        Partitions are synced in parallel if the target is Infoblox. The tag and custom field marking the synced
+        objects are created up front, so that the workers don't race to create them. Syncing to Nautobot creates shared
+        objects such as Custom Fields and Tags on the fly, so the partitions are synced one after the other.
+        """
+        if not self.partitions:
+            super().execute_sync()
+            return
+
+        def sync_partition(source_adapter, target_adapter):
+            source_adapter.sync_to(target_adapter, flags=self.diffsync_flags)
+
+        if self.data_target == "Infoblox":
+            nautobot.NautobotAdapter.get_synced_tag_and_custom_field()
+            self._run_in_workers(sync_partition, self.partitions)
+        else:
+            for partition in self.partitions:
+                sync_partition(*partition)
+
+
+class InfobloxDataSource(InfobloxSyncMixin, DataSource):
     """Infoblox SSoT Data Source."""
 
     debug = BooleanVar(description="Enable for verbose debug logging.")
+    clear_cache = BooleanVar(
+        default=False, description="Reload reference data, such as network views, cached by previous runs."
+    )
+    network_view_workers = IntegerVar(
+        default=1,
+        min_value=1,
+        max_value=16,
+        description="Number of network views loaded and synced at a time, 1 to sync all network views together.",
+    )
     config = ObjectVar(
         model=SSOTInfobloxConfig,
         display_field="SSOT Infoblox config",
@@ -58,6 +206,8 @@ class InfobloxDataSource(DataSource):
         """Initialize InfobloxDataSource."""
         super().__init__()
         self.diffsync_flags = DiffSyncFlags.CONTINUE_ON_FAILURE
+        # Pairs of source and target adapters per network view, see `load_partitions`.
+        self.partitions = []
 
     class Meta:  # pylint: disable=too-few-public-methods
         """Information about the Job."""
@@ -80,15 +230,19 @@ class InfobloxDataSource(DataSource):
 
     def load_source_adapter(self):
         """Load Infoblox data."""
+        if self.is_partitioned():
+            self.load_partitions()
+            return
         self.logger.info("Connecting to Infoblox")
-        client_config = _get_infoblox_client_config(self.config, self.debug)
-        client = InfobloxApi(**client_config)
-        self.source_adapter = infoblox.InfobloxAdapter(job=self, sync=self.sync, conn=client, config=self.config)
+        self.source_adapter = self.get_infoblox_adapter(self.config)
         self.logger.info("Loading data from Infoblox...")
         self.source_adapter.load()
 
     def load_target_adapter(self):
         """Load Nautobot data."""
+        if self.partitions:
+            # Loaded together with the source adapters of the partitions.
+            return
         self.logger.info("Connecting to Nautobot...")
         self.target_adapter = nautobot.NautobotAdapter(job=self, sync=self.sync, config=self.config)
         self.logger.info("Loading data from Nautobot...")
@@ -98,6 +252,8 @@ class InfobloxDataSource(DataSource):
         """Perform data synchronization."""
         self.debug = debug
         self.dryrun = dryrun
+        self.clear_cache = kwargs.get("clear_cache", False)
+        self.network_view_workers = kwargs.get("network_view_workers") or 1
         self.config = kwargs.get("config")
         if not self.config.enable_sync_to_nautobot:
             self.logger.error("Can't run sync to Nautobot, provided config doesn't have it enabled...")
@@ -106,10 +262,19 @@ class InfobloxDataSource(DataSource):
         super().run(dryrun=self.dryrun, memory_profiling=self.memory_profiling, *args, **kwargs)
 
 
-class InfobloxDataTarget(DataTarget):
+class InfobloxDataTarget(InfobloxSyncMixin, DataTarget):
     """Infoblox SSoT Data Target."""
 
     debug = BooleanVar(description="Enable for verbose debug logging.")
+    clear_cache = BooleanVar(
+        default=False, description="Reload reference data, such as network views, cached by previous runs."
+    )
+    network_view_workers = IntegerVar(
+        default=1,
+        min_value=1,
+        max_value=16,
+        description="Number of network views loaded and synced at a time, 1 to sync all network views together.",
+    )
     config = ObjectVar(
         model=SSOTInfobloxConfig,
         display_field="SSOT Infoblox config",
@@ -124,6 +289,8 @@ class InfobloxDataTarget(DataTarget):
         """Initialize InfobloxDataTarget."""
         super().__init__()
         self.diffsync_flags = DiffSyncFlags.CONTINUE_ON_FAILURE
+        # Pairs of source and target adapters per network view, see `load_partitions`.
+        self.partitions = []
 
     class Meta:  # pylint: disable=too-few-public-methods
         """Information about the Job."""
@@ -146,6 +313,9 @@ class InfobloxDataTarget(DataTarget):
 
     def load_source_adapter(self):
         """Load Nautobot data."""
+        if self.is_partitioned():
+            self.load_partitions()
+            return
         self.logger.info("Connecting to Nautobot...")
         self.source_adapter = nautobot.NautobotAdapter(job=self, sync=self.sync, config=self.config)
         self.logger.info("Loading data from Nautobot...")
@@ -153,10 +323,11 @@ class InfobloxDataTarget(DataTarget):
 
     def load_target_adapter(self):
         """Load Infoblox data."""
+        if self.partitions:
+            # Loaded together with the source adapters of the partitions.
+            return
         self.logger.info("Connecting to Infoblox")
-        client_config = _get_infoblox_client_config(self.config, self.debug)
-        client = InfobloxApi(**client_config)
-        self.target_adapter = infoblox.InfobloxAdapter(job=self, sync=self.sync, conn=client, config=self.config)
+        self.target_adapter = self.get_infoblox_adapter(self.config)
         self.logger.info("Loading data from Infoblox...")
         self.target_adapter.load()
 
@@ -164,6 +335,8 @@ class InfobloxDataTarget(DataTarget):
         """Perform data synchronization."""
         self.debug = debug
         self.dryrun = dryrun
+        self.clear_cache = kwargs.get("clear_cache", False)
+        self.network_view_workers = kwargs.get("network_view_workers") or 1
         self.config = kwargs.get("config")
         # Additional guard against launching sync to Infoblox with config that doesn't allow it
         if not self.config.enable_sync_to_infoblox:
@@ -4,6 +4,7 @@ import ipaddress
 
 from django.core.exceptions import ValidationError
 from django.core.serializers.json import DjangoJSONEncoder
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.db import models
 
 try:
@@ -60,6 +61,26 @@ class SSOTInfobloxConfig(PrimaryModel):  # pylint: disable=too-many-ancestors
         default="v2.12",
         verbose_name="Infoblox WAPI version",
     )
+    max_concurrent_requests = models.PositiveSmallIntegerField(
+        default=1,
+        validators=[MinValueValidator(1), MaxValueValidator(32)],
+        verbose_name="Max concurrent requests",
+        help_text="Maximum number of WAPI requests sent to Infoblox at a time while loading data.",
+    )
+    write_batch_size = models.PositiveSmallIntegerField(
+        default=0,
+        validators=[MaxValueValidator(1000)],
+        verbose_name="Write batch size",
+        help_text="Number of changes sent to Infoblox per request when syncing to Infoblox, 0 to send them one by one.",
+    )
+    cache_timeout = models.PositiveIntegerField(
+        default=0,
+        verbose_name="Cache timeout",
+        help_text=(
+            "Number of seconds reference data, such as network views and DNS zones, is cached for across job runs, "
+            "0 to disable caching."
+        ),
+    )
     enable_sync_to_infoblox = models.BooleanField(
         default=False, verbose_name="Sync to Infoblox", help_text="Enable syncing of data from Nautobot to Infoblox."
     )
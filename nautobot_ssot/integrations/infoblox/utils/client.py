@@ -2,26 +2,95 @@
 
 from __future__ import annotations
 
+import hashlib
 import ipaddress
 import json
 import logging
 import re
 import urllib.parse
 from collections import defaultdict
-from functools import lru_cache
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache, partial, wraps
+from http import HTTPStatus
+from typing import Any, Callable, Iterable, Iterator, List, Optional, TypeVar
 
 import requests
+from django.core.cache import cache
 from dns import reversename
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 from requests.compat import urljoin
 from requests.exceptions import HTTPError
+from urllib3.util.retry import Retry
 
 from nautobot_ssot.exceptions import InvalidUrlScheme
 from nautobot_ssot.integrations.infoblox.utils.diffsync import get_ext_attr_dict
 
 logger = logging.getLogger("nautobot.ssot.infoblox")
 
+T = TypeVar("T")
+
+
+class WapiRetry(Retry):
+    """Retry policy for WAPI requests.
+
+    Requests that were throttled with a 429 response were not processed by the Grid Master and are therefore retried
+    regardless of the HTTP method. Other retryable responses (502, 503, 504) are only retried for idempotent methods, as
+    a POST may have created the object before the error occurred.
+    """
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        """Return whether a request should be retried based on its method and response status."""
+        if status_code == HTTPStatus.TOO_MANY_REQUESTS:
+            return bool(self.total)
+        return super().is_retry(method, status_code, has_retry_after=has_retry_after)
+
+
+@dataclass
+class QueuedWrite:
+    """A write to Infoblox that is queued to be sent through the WAPI `request` endpoint.
+
+    Once sent, either `result` holds the result returned by Infoblox or `error` holds the error message.
+    """
+
+    method: str
+    object: str
+    data: dict = field(default_factory=dict)
+    args: dict = field(default_factory=dict)
+    # What the write was made for, e.g. a DiffSync model.
+    context: Any = None
+    result: Any = None
+    error: Optional[str] = None
+
+    def as_request(self) -> dict:
+        """Return the write as an item of a WAPI `request` body."""
+        return {"method": self.method, "object": self.object, "data": self.data, "args": self.args}
+
+
+def cached_reference_data(method: Callable) -> Callable:
+    """Cache the results of a getter of rarely changing data in the Django cache, see `InfobloxApi.cache_timeout`.
+
+    The results of getters returning iterators are cached, and returned, as lists. Empty results and results that
+    couldn't be parsed aren't cached, as they are often caused by errors.
+    """
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not self.cache_timeout:
+            return method(self, *args, **kwargs)
+        key = self._get_cache_key(method.__name__, *args, *sorted(kwargs.items()))  # pylint: disable=protected-access
+        results = cache.get(key)
+        if results is None:
+            results = method(self, *args, **kwargs)
+            if isinstance(results, Iterator):
+                results = list(results)
+            if results and not isinstance(results, str):
+                cache.set(key, results, self.cache_timeout)
+        return results
+
+    return wrapper
+
 
 def parse_url(address):
     """Handle outside case where protocol isn't included in URL address.
@@ -101,8 +170,26 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
         debug=False,
         network_view_to_dns_map=None,
         cookie=None,
+        max_concurrent_requests=1,
+        max_retries=3,
+        page_size=1000,
+        write_batch_size=0,
+        cache_timeout=0,
+        cache_namespace=None,
     ):  # pylint: disable=too-many-arguments
-        """Initialize Infoblox class."""
+        """Initialize Infoblox class.
+
+        Args:
+            max_concurrent_requests (int): Maximum number of requests `execute_concurrently` sends at a time.
+            max_retries (int): Number of times a request is retried on throttling or gateway errors, with exponential
+                back-off.
+            page_size (int): Number of objects requested per page by the bulk getters.
+            write_batch_size (int): Number of writes sent per request by `flush_writes`, see `queue_writes`.
+            cache_timeout (int): Number of seconds reference data, such as network views, is cached for in the Django
+                cache, 0 to disable caching.
+            cache_namespace (str): Identifies the cached data of this client, e.g. the ID of the Infoblox config.
+                Defaults to the URL of Infoblox.
+        """
         parsed_url = parse_url(url.strip())
         if parsed_url.scheme != "https":
             if parsed_url.scheme == "http":
@@ -114,6 +201,14 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
         self.auth = HTTPBasicAuth(username, password)
         self.wapi_version = wapi_version
         self.timeout = timeout
+        self.max_concurrent_requests = max(1, max_concurrent_requests)
+        self.max_retries = max_retries
+        self.page_size = page_size
+        self.write_batch_size = write_batch_size
+        # Writes waiting for `flush_writes`, or None if writes are sent immediately.
+        self.write_queue: Optional[List[QueuedWrite]] = None
+        self.cache_timeout = cache_timeout
+        self.cache_namespace = cache_namespace or self.url
         self.session = self._init_session(verify_ssl=verify_ssl, cookie=cookie)
         # Used to select correct DNS View when creating DNS records
         self.network_view_to_dns_map = {}
@@ -146,9 +241,123 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
         session.verify = verify_ssl
         session.headers.update(self.headers)
         session.auth = self.auth
+        # Size the connection pool to the number of concurrent requests, so that connections are reused.
+        adapter = HTTPAdapter(
+            pool_connections=1,
+            pool_maxsize=self.max_concurrent_requests,
+            max_retries=WapiRetry(
+                total=self.max_retries,
+                backoff_factor=0.5,
+                status_forcelist=(HTTPStatus.BAD_GATEWAY, HTTPStatus.SERVICE_UNAVAILABLE, HTTPStatus.GATEWAY_TIMEOUT),
+                # Return the last response once retries are exhausted, so that `_request` can report the WAPI error.
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
 
         return session
 
+    def _get_cache_key(self, *parts) -> str:
+        """Return the Django cache key for reference data identified by `parts`, such as a method name and view."""
+        # The generation changes on `invalidate_cache`, which orphans all keys of the previous generation.
+        generation = cache.get_or_set(f"nautobot_ssot.infoblox.{self.cache_namespace}.generation", 0, timeout=None)
+        key = ".".join(str(part) for part in (self.cache_namespace, generation, *parts))
+        return f"nautobot_ssot.infoblox.{hashlib.sha256(key.encode()).hexdigest()}"
+
+    def invalidate_cache(self):
+        """Remove all reference data of this client from the Django cache, so that it is loaded from Infoblox again."""
+        generation_key = f"nautobot_ssot.infoblox.{self.cache_namespace}.generation"
+        cache.set(generation_key, cache.get(generation_key, 0) + 1, timeout=None)
+
+    def execute_concurrently(self, calls: Iterable[Callable[[], T]]) -> List[T]:
+        """Execute API calls using up to `max_concurrent_requests` threads.
+
+        Args:
+            calls (Iterable[Callable]): Functions to call without arguments, e.g. `functools.partial` objects wrapping
+                methods of this class.
+
+        Returns:
+            (list): Return values of the calls, in the order of the calls.
+
+        Raises:
+            Exception: The first exception raised by a call, in the order of the calls. Calls that haven't started yet
+                are cancelled.
+        """
+        calls = list(calls)
+        if self.max_concurrent_requests == 1 or len(calls) <= 1:
+            return [call() for call in calls]
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrent_requests, len(calls)), thread_name_prefix="infoblox"
+        ) as executor:
+            futures = [executor.submit(call) for call in calls]
+            try:
+                return [future.result() for future in futures]
+            except Exception:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    def queue_writes(self):
+        """Queue writes made through this client instead of sending them immediately.
+
+        Creating, updating and deleting objects then returns None rather than the response of Infoblox. The queued
+        writes are sent by `flush_writes`. This has no effect if `write_batch_size` is 0.
+        """
+        if self.write_batch_size and self.write_queue is None:
+            self.write_queue = []
+
+    def _queue_write(self, method: str, path: str, data: Optional[dict] = None, args: Optional[dict] = None) -> bool:
+        """Queue a write if writes are being queued, see `queue_writes`.
+
+        Args:
+            method (str): HTTP method of the write.
+            path (str): Object type for creating objects, or reference of the object to update or delete.
+            data (dict): Fields of the object to create or update.
+            args (dict): Arguments of the write, e.g. `_return_fields`.
+
+        Returns:
+            (bool): Whether the write was queued.
+        """
+        if self.write_queue is None:
+            return False
+        # As with query parameters, fields without a value are left out.
+        data = {key: value for key, value in (data or {}).items() if value is not None}
+        self.write_queue.append(QueuedWrite(method=method, object=path, data=data, args=args or {}))
+        return True
+
+    def flush_writes(self) -> List[QueuedWrite]:
+        """Send all queued writes through the WAPI `request` endpoint, `write_batch_size` writes per request.
+
+        Infoblox processes all writes of a request in a single transaction, so one failing write prevents all other
+        writes of its request. The writes of a failed request are therefore sent again one by one, so that the
+        remaining writes are made and only the failing writes have an `error`.
+
+        Returns:
+            (List[QueuedWrite]): The writes that were sent, in the order they were queued.
+        """
+        if not self.write_queue:
+            return []
+        writes, self.write_queue = self.write_queue, []
+        for i in range(0, len(writes), self.write_batch_size):
+            chunk = writes[i : i + self.write_batch_size]
+            try:
+                response = self._request("POST", "request", json=[write.as_request() for write in chunk])
+            except HTTPError:
+                for write in chunk:
+                    try:
+                        response = self._request(write.method, write.object, params=write.args, json=write.data)
+                    except HTTPError as err:
+                        write.error = str(err)
+                        continue
+                    try:
+                        write.result = response.json()
+                    except json.decoder.JSONDecodeError:
+                        write.result = response.text
+                continue
+            for write, result in zip(chunk, response.json()):
+                write.result = result
+        return writes
+
     def _request(self, method, path, **kwargs):
         """Return a response object after making a request by a specified method.
 
@@ -185,6 +394,27 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
             raise HTTPError(exc_msg, response=err.response) from err
         return resp
 
+    def _get_paged(self, url_path: str, params: dict) -> Iterator[dict]:
+        """Yield all objects matching a query, requesting them page by page.
+
+        The next page is only requested once the objects of the previous page have been consumed, so the number of
+        objects held in memory doesn't depend on the number of objects matching the query.
+
+        Args:
+            url_path (str): Object type to query, e.g. 'record:host'.
+            params (dict): Search and `_return_fields` parameters of the query.
+
+        Returns:
+            (Iterator[dict]): Objects matching the query.
+        """
+        params = {**params, "_paging": 1, "_return_as_object": 1, "_max_results": self.page_size}
+        while True:
+            response = self._request("GET", url_path, params=params).json()
+            yield from response.get("result", [])
+            if not response.get("next_page_id"):
+                return
+            params["_page_id"] = response["next_page_id"]
+
     def _delete(self, resource):
         """Delete a resource from Infoblox.
 
@@ -197,6 +427,8 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
         Returns Response:
             "network/ZG5zLm5ldHdvcmskMTkyLjAuMi4wLzI0LzA:192.0.2.0/24/default"
         """
+        if self._queue_write("DELETE", resource):
+            return None
         response = self._request("DELETE", resource)
         try:
             logger.debug(response.json())
@@ -218,6 +450,8 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
         Returns Response:
             "network/ZG5zLm5ldHdvcmskMTkyLjAuMi4wLzI0LzA:192.0.2.0/24/default"
         """
+        if self._queue_write("PUT", resource, data=params):
+            return None
         response = self._request("PUT", path=resource, params=params)
         try:
             logger.debug(response.json())
@@ -289,7 +523,7 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
             prefixes (List[tuple]): List of Network prefixes and associated network view - ('10.220.0.0/22', 'default')
 
         Returns:
-            (list): IPv4 dict objects
+            (Iterator[dict]): IPv4 dict objects
 
         Return Response:
         [
@@ -387,34 +621,55 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
             }
             return query
 
+        def get_paged_ipaddrs(data: dict) -> Iterator[dict]:
+            """Retrieve the IP addresses of a large prefix page by page.
+
+            Args:
+                data (dict): The query of IP Addresses as created by `create_payload`.
+
+            Returns:
+                Iterator[dict]: IP Addresses for the prefix.
+            """
+            try:
+                yield from self._get_paged(data["object"], {**data["data"], **data["args"]})
+            except HTTPError as err:
+                logger.error(err.response.text)
+
         url_path = "request"
-        payload, ipaddrs = [], []
+        batches, payload = [], []
         num_hosts = 0
+
+        def flush_batches():
+            # Send the queued batches concurrently, but no more than can be sent at a time, to limit memory usage.
+            for i in range(0, len(batches), self.max_concurrent_requests):
+                window = batches[i : i + self.max_concurrent_requests]
+                for result in self.execute_concurrently(
+                    partial(get_ipaddrs, url_path=url_path, data=batch) for batch in window
+                ):
+                    yield from result
+            batches.clear()
+
         for prefix in prefixes:
             view = prefix[1]
             network = ipaddress.ip_network(prefix[0])
-            # Due to default of 1000 max_results from Infoblox we must specify a max result limit or limit response to 1000.
-            # Make individual request if it's larger than 1000 hosts and specify max result limit to be number of hosts in prefix.
+            # Due to default of 1000 max_results from Infoblox, prefixes with more than 1000 hosts are queried page by
+            # page. Smaller prefixes are batched into requests of up to 1000 hosts.
             if network.num_addresses > 1000:
-                pf_payload = create_payload(prefix=prefix[0], view=view)
-                pf_payload["args"]["_max_results"] = network.num_addresses
-                ipaddrs += get_ipaddrs(url_path=url_path, data=[pf_payload])
+                yield from flush_batches()
+                yield from get_paged_ipaddrs(create_payload(prefix=prefix[0], view=view))
             # append payloads to list until number of hosts is 1000
             elif network.num_addresses + num_hosts <= 1000:
                 num_hosts += network.num_addresses
                 payload.append(create_payload(prefix=prefix[0], view=view))
             else:
-                # if we can't add more hosts, make call to get IP addresses with existing payload
-                ipaddrs += get_ipaddrs(url_path=url_path, data=payload)
+                # if we can't add more hosts, queue the existing payload as a request
+                batches.append(payload)
                 # reset payload as all addresses are processed
-                payload = []
-                payload.append(create_payload(prefix=prefix[0], view=view))
+                payload = [create_payload(prefix=prefix[0], view=view)]
                 num_hosts = network.num_addresses
-            # check if last prefix in list, if it is, send payload otherwise keep processing
-            if prefixes[-1] == prefix and payload:
-                ipaddrs += get_ipaddrs(url_path=url_path, data=payload)
-
-        return ipaddrs
+        if payload:
+            batches.append(payload)
+        yield from flush_batches()
 
     def create_network(self, prefix, comment=None, network_view: Optional[str] = None):
         """Create a network.
@@ -433,6 +688,8 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
         if network_view:
             params["network_view"] = network_view
         api_path = "network"
+        if self._queue_write("POST", api_path, data=params):
+            return None
         response = self._request("POST", api_path, params=params)
         logger.debug(response.text)
         return response.text
@@ -503,6 +760,8 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
         if network_view:
             params["network_view"] = network_view
         api_path = "networkcontainer"
+        if self._queue_write("POST", api_path, data=params):
+            return None
         response = self._request("POST", api_path, params=params)
         logger.debug(response.text)
         return response.text
@@ -577,6 +836,8 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
         if network_view:
             params["network_view"] = network_view
         api_path = "range"
+        if self._queue_write("POST", api_path, data=params):
+            return None
         response = self._request("POST", api_path, params=params)
         logger.debug(response.text)
         return response.text
@@ -701,6 +962,20 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
             logger.error(response.text)
             return response.text
 
+    def get_all_host_records(self, dns_view: Optional[str] = None):
+        """Get all Host records, with the same fields as `get_host_record_by_ref`.
+
+        Args:
+            dns_view (str): Name of the DNS view, e.g. 'default.dev'
+
+        Returns:
+            (Iterator[dict]) of Host records
+        """
+        params = {"_return_fields": "name,view,ipv4addrs,comment"}
+        if dns_view:
+            params["view"] = dns_view
+        return self._get_paged("record:host", params)
+
     def get_a_record_by_name(self, fqdn, network_view: Optional[str] = None):
         """Get the A record for a FQDN.
 
@@ -807,6 +1082,20 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
             logger.error(response.text)
             return response.text
 
+    def get_all_a_records(self, dns_view: Optional[str] = None):
+        """Get all A records, with the same fields as `get_a_record_by_ref`.
+
+        Args:
+            dns_view (str): Name of the DNS view, e.g. 'default.dev'
+
+        Returns:
+            (Iterator[dict]) of A records
+        """
+        params = {"_return_fields": "name,view,ipv4addr,comment,extattrs"}
+        if dns_view:
+            params["view"] = dns_view
+        return self._get_paged("record:a", params)
+
     def delete_a_record_by_ref(self, ref):
         """Delete DNS A record by ref.
 
@@ -856,6 +1145,20 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
             logger.error(response.text)
             return response.text
 
+    def get_all_ptr_records(self, dns_view: Optional[str] = None):
+        """Get all PTR records, with the same fields as `get_ptr_record_by_ref`.
+
+        Args:
+            dns_view (str): Name of the DNS view, e.g. 'default.dev'
+
+        Returns:
+            (Iterator[dict]) of PTR records
+        """
+        params = {"_return_fields": "name,ptrdname,ipv4addr,ipv6addr,view,comment"}
+        if dns_view:
+            params["view"] = dns_view
+        return self._get_paged("record:ptr", params)
+
     def get_ptr_record_by_ip(self, ip_address, network_view: Optional[str] = None):  # pylint: disable=inconsistent-return-statements
         """Get the PTR record by FQDN.
 
@@ -955,6 +1258,7 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
         logger.debug(response)
         return response
 
+    @cached_reference_data
     def get_all_dns_views(self):
         """Get all dns views.
 
@@ -1009,6 +1313,8 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
             payload["view"] = dns_view
         if comment:
             payload["comment"] = comment
+        if self._queue_write("POST", url_path, data=payload, args=params):
+            return None
         response = self._request("POST", url_path, params=params, json=payload)
         try:
             logger.debug(response.json())
@@ -1138,27 +1444,19 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
         }
         """
         url_path = "range"
-        params = {"_return_fields": "network,network_view,start_addr,end_addr", "_max_results": 10000}
+        params = {"_return_fields": "network,network_view,start_addr,end_addr"}
         if network_view:
             params["network_view"] = network_view
         if prefix:
             params["network"] = prefix
+        data = defaultdict(lambda: defaultdict(list))
         try:
-            response = self._request("GET", url_path, params=params)
+            for prefix_range in self._get_paged(url_path, params):
+                str_range = f"{prefix_range['start_addr']}-{prefix_range['end_addr']}"
+                data[prefix_range["network_view"]][prefix_range["network"]].append(str_range)
         except HTTPError as err:
             logger.error(err.response.text)
             return {}
-        try:
-            json_response = response.json()
-            logger.debug(json_response)
-        except json.decoder.JSONDecodeError:
-            logger.error(response.text)
-            return response.text
-
-        data = defaultdict(lambda: defaultdict(list))
-        for prefix_range in json_response:
-            str_range = f"{prefix_range['start_addr']}-{prefix_range['end_addr']}"
-            data[prefix_range["network_view"]][prefix_range["network"]].append(str_range)
         return data
 
     def get_all_subnets(self, prefix: str = None, ipv6: bool = False, network_view: Optional[str] = None):
@@ -1170,7 +1468,7 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
             network_view (str): Name of the network view, e.g. 'dev'
 
         Returns:
-            (list) of record dicts
+            (Iterator[dict]) of record dicts
 
         Return Response:
         [
@@ -1193,53 +1491,31 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
             },
         ]
         """
-        results = []
         if ipv6:
             url_path = "ipv6network"
         else:
             url_path = "network"
 
-        params = {
-            "_paging": 1,
-            "_return_as_object": 1,
-            "_return_fields": "network,network_view,comment,extattrs,rir_organization,rir,vlans",
-            "_max_results": 10000,
-        }
+        params = {"_return_fields": "network,network_view,comment,extattrs,rir_organization,rir,vlans"}
         if network_view:
             params.update({"network_view": network_view})
         if prefix:
             params.update({"network": prefix})
+        if ipv6:
+            logger.info("Support for DHCP Ranges is not currently supported for IPv6 Networks.")
+        ranges = None
         try:
-            response = self._request("GET", url_path, params=params)
-        except HTTPError as err:
-            logger.error(err.response.text)
-            return []
-        try:
-            logger.debug(response.json())
-        except json.decoder.JSONDecodeError:
-            logger.error(response.text)
-            return response.text
-        results.extend(response.json().get("result"))
-        counter = 1
-
-        while response.json().get("next_page_id"):
-            logger.info(f"Call {counter} for 'get_all_subnets()'.")
-            params["_page_id"] = response.json().get("next_page_id")
-            response = self._request("GET", url_path, params=params)
-            results.extend(response.json().get("result"))
-            counter += 1
-        # In-place update json_response containing prefixes with DHCP ranges, if found.
-        # This should be an opt-in
-        if not ipv6:
-            ranges = self.get_all_ranges(prefix=prefix, network_view=network_view)
-            for returned_prefix in results:
-                network_view_ranges = ranges.get(returned_prefix["network_view"], {})
-                prefix_ranges = network_view_ranges.get(returned_prefix["network"])
+            for returned_prefix in self._get_paged(url_path, params):
+                # Prefixes with DHCP ranges, if found, are updated in-place with the ranges.
+                # This should be an opt-in
+                if ranges is None:
+                    ranges = {} if ipv6 else self.get_all_ranges(prefix=prefix, network_view=network_view)
+                prefix_ranges = ranges.get(returned_prefix["network_view"], {}).get(returned_prefix["network"])
                 if prefix_ranges:
                     returned_prefix["ranges"] = prefix_ranges
-        else:
-            logger.info("Support for DHCP Ranges is not currently supported for IPv6 Networks.")
-        return results
+                yield returned_prefix
+        except HTTPError as err:
+            logger.error(err.response.text)
 
     def get_authoritative_zone(self, network_view: Optional[str] = None):
         """Get authoritative zones.
@@ -1279,6 +1555,7 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
             return response.text
 
     @lru_cache(maxsize=1024)
+    @cached_reference_data
     def get_authoritative_zones_for_dns_view(self, view: str):
         """Get authoritative zone list for given DNS view.
 
@@ -1420,6 +1697,20 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
             logger.error(response.text)
             return response.text
 
+    def get_all_fixed_addresses(self, network_view: Optional[str] = None):
+        """Get all Fixed Address objects, with the same fields as `get_fixed_address_by_ref`.
+
+        Args:
+            network_view (str): Name of the network view, e.g. 'dev'
+
+        Returns:
+            (Iterator[dict]) of Fixed Address objects
+        """
+        params = {"_return_fields": "mac,network,network_view,comment,extattrs,name"}
+        if network_view:
+            params["network_view"] = network_view
+        return self._get_paged("fixedaddress", params)
+
     def delete_fixed_address_record_by_ref(self, ref):
         """Delete Fixed Address record by ref.
 
@@ -1503,6 +1794,8 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
             payload["name"] = name
         if comment:
             payload["comment"] = comment
+        if self._queue_write("POST", url_path, data=payload, args=params):
+            return None
         response = self._request("POST", url_path, params=params, json=payload)
         try:
             logger.debug(response.json())
@@ -1528,6 +1821,8 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
         }
         """
         params = {}
+        if self._queue_write("PUT", ref, data=data):
+            return None
         try:
             response = self._request("PUT", path=ref, params=params, json=data)
         except HTTPError as err:
@@ -1564,6 +1859,8 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
             payload["network_view"] = network_view
         if comment:
             payload["comment"] = comment
+        if self._queue_write("POST", url_path, data=payload, args=params):
+            return None
         try:
             response = self._request("POST", url_path, params=params, json=payload)
         except HTTPError as err:
@@ -1594,6 +1891,8 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
         }
         """
         params = {}
+        if self._queue_write("PUT", ref, data=data):
+            return None
         try:
             response = self._request("PUT", path=ref, params=params, json=data)
         except HTTPError as err:
@@ -1671,6 +1970,8 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
             payload["view"] = dns_view
         if comment:
             payload["comment"] = comment
+        if self._queue_write("POST", url_path, data=payload, args=params):
+            return None
         response = self._request("POST", url_path, params=params, json=payload)
         try:
             logger.debug("Infoblox PTR record created: %s", response.json())
@@ -1774,11 +2075,12 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
             logger.error(response.text)
             return response.text
 
+    @cached_reference_data
     def get_vlanviews(self):
         """Retrieve all VLANViews from Infoblox.
 
         Returns:
-            List: list of dictionaries
+            Iterator[dict]: VLAN View dictionaries
 
         Return Response:
         [
@@ -1800,20 +2102,13 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
         """
         url_path = "vlanview"
         params = {"_return_fields": "name,comment,start_vlan_id,end_vlan_id,extattrs"}
-        response = self._request("GET", url_path, params=params)
-        try:
-            logger.debug(response.json())
-            results = response.json()
-            return results
-        except json.decoder.JSONDecodeError:
-            logger.error(response.text)
-            return response.text
+        return self._get_paged(url_path, params)
 
     def get_vlans(self):
         """Retrieve all VLANs from Infoblox.
 
         Returns:
-            List: list of dictionaries
+            Iterator[dict]: VLAN dictionaries
 
         Return Response:
         [
@@ -1840,31 +2135,11 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
             }
         ]
         """
-        url_path = "request"
-        payload = json.dumps(
-            [
-                {
-                    "method": "GET",
-                    "object": "vlan",
-                    "data": {},
-                    "args": {
-                        "_max_results": 100000000,
-                        "_return_fields": "assigned_to,id,name,comment,contact,department,description,reserved,status,extattrs",
-                    },
-                }
-            ]
-        )
-        response = self._request("POST", url_path, data=payload)
-        try:
-            logger.debug(response.json())
-        except json.decoder.JSONDecodeError:
-            logger.error(response.text)
-            return response.text
-
-        if len(response.json()):
-            return response.json()[0]
-
-        return []
+        url_path = "vlan"
+        params = {
+            "_return_fields": "assigned_to,id,name,comment,contact,department,description,reserved,status,extattrs",
+        }
+        return self._get_paged(url_path, params)
 
     def create_vlan(self, vlan_id, vlan_name, vlan_view):
         """Create a VLAN in Infoblox.
@@ -1952,6 +2227,8 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
         }
         """
         params = {}
+        if self._queue_write("PUT", ref, data=data):
+            return None
         try:
             logger.debug(data)
             response = self._request("PUT", path=ref, params=params, json=data)
@@ -1985,6 +2262,8 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
         }
         """
         params = {}
+        if self._queue_write("PUT", ref, data=data):
+            return None
         try:
             logger.debug(data)
             response = self._request("PUT", path=ref, params=params, json=data)
@@ -2059,13 +2338,13 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
         """Returns the list of all child containers from a given root container."""
         flattened_tree = []
         stack = []
-        root_containers = self.get_network_containers(prefix=root_container)
         if network_view:
             root_containers = self.get_network_containers(prefix=root_container, network_view=network_view)
         else:
             root_containers = self.get_network_containers(prefix=root_container)
-        if root_containers:
-            stack = [root_containers[0]]
+        root = next(iter(root_containers), None)
+        if root:
+            stack = [root]
 
         get_child_network_containers_kwargs = {}
         if network_view:
@@ -2089,7 +2368,7 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
             network_view (str): Name of the network view, e.g. 'dev'
 
         Returns:
-            (list) of record dicts
+            (Iterator[dict]) of record dicts
 
         Return Response:
         [
@@ -2108,25 +2387,14 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
         else:
             url_path = "networkcontainer"
 
-        params = {
-            "_return_as_object": 1,
-            "_return_fields": "network,comment,network_view,extattrs,rir_organization,rir",
-            "_max_results": 100000,
-        }
+        params = {"_return_fields": "network,comment,network_view,extattrs,rir_organization,rir"}
         if network_view:
             params.update({"network_view": network_view})
         if prefix:
             params.update({"network": prefix})
-        response = self._request("GET", url_path, params=params)
-        try:
-            logger.debug(response.json())
-            results = response.json().get("result", [])
-        except json.decoder.JSONDecodeError:
-            logger.error(response.text)
-            return response.text
-        for res in results:
+        for res in self._get_paged(url_path, params):
             res.update({"status": "container"})
-        return results
+            yield res
 
     def get_child_network_containers(self, prefix: str, network_view: Optional[str] = None):
         """Get all Child Network Containers for Container.
@@ -2135,7 +2403,7 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
             network_view (str): Name of the network view, e.g. 'dev'
 
         Returns:
-            (list) of record dicts
+            (Iterator[dict]) of record dicts
 
         Return Response:
         [
@@ -2158,24 +2426,13 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
         ]
         """
         url_path = "networkcontainer"
-        params = {
-            "_return_as_object": 1,
-            "_return_fields": "network,comment,network_view,extattrs,rir_organization,rir",
-            "_max_results": 100000,
-        }
+        params = {"_return_fields": "network,comment,network_view,extattrs,rir_organization,rir"}
         if network_view:
             params.update({"network_view": network_view})
         params.update({"network_container": prefix})
-        response = self._request("GET", url_path, params=params)
-        try:
-            logger.debug(response.json())
-            results = response.json().get("result", [])
-        except json.decoder.JSONDecodeError:
-            logger.error(response.text)
-            return response.text
-        for res in results:
+        for res in self._get_paged(url_path, params):
             res.update({"status": "container"})
-        return results
+            yield res
 
     def get_child_subnets_from_container(self, prefix: str, network_view: Optional[str] = None):
         """Get child subnets from container.
@@ -2185,7 +2442,7 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
             network_view (str): Name of the network view, e.g. 'dev'
 
         Returns:
-            (list) of record dicts
+            (Iterator[dict]) of record dicts
 
         Return Response:
         [
@@ -2210,33 +2467,21 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
         ]
         """
         url_path = "network"
-        params = {
-            "_return_as_object": 1,
-            "_return_fields": "network,network_view,comment,extattrs,rir_organization,rir,vlans",
-            "_max_results": 10000,
-        }
+        params = {"_return_fields": "network,network_view,comment,extattrs,rir_organization,rir,vlans"}
         if network_view:
             params.update({"network_view": network_view})
         params.update({"network_container": prefix})
-
         try:
-            response = self._request("GET", url_path, params=params)
+            yield from self._get_paged(url_path, params)
         except HTTPError as err:
             logger.error(err.response.text)
-            return []
-        try:
-            logger.debug(response.json())
-            results = response.json().get("result")
-            return results
-        except json.decoder.JSONDecodeError:
-            logger.error(response.text)
-            return response.text
 
+    @cached_reference_data
     def get_network_views(self):
         """Get all network views.
 
         Returns:
-            (list) of record dicts
+            (Iterator[dict]) of record dicts
 
         Return Response:
         [
@@ -2280,18 +2525,11 @@ class InfobloxApi:  # pylint: disable=too-many-public-methods,  too-many-instanc
             "_return_fields": "name,associated_dns_views,extattrs,comment,is_default",
         }
         try:
-            response = self._request("GET", url_path, params=params)
+            yield from self._get_paged(url_path, params)
         except HTTPError as err:
             logger.error(err.response.text)
-            return []
-        try:
-            logger.debug(response.json())
-            results = response.json()
-            return results
-        except json.decoder.JSONDecodeError:
-            logger.error(response.text)
-            return response.text
 
+    @cached_reference_data
     def get_network_view(self, name: str):
         """Get network view object for given name.
 
@@ -1,5 +1,6 @@
 """Utilities for DiffSync related stuff."""
 
+from functools import lru_cache
 from typing import Optional
 
 from django.contrib.contenttypes.models import ContentType
@@ -50,6 +51,22 @@ def nautobot_vlan_status(status: str) -> str:
     return statuses[status]
 
 
+@lru_cache(maxsize=None)
+def get_ext_attr_key(name: str) -> str:
+    """Translate the name of an Extensibility Attribute to the key of the matching Custom Field, e.g. `Site-Loc` to `site_loc`.
+
+    The number of Extensibility Attributes is small, so the translations are cached rather than slugifying the names of
+    the attributes of every record.
+
+    Args:
+        name (str): Name of the Extensibility Attribute.
+
+    Returns:
+        str: Key of the Custom Field.
+    """
+    return slugify(name).replace("-", "_")
+
+
 def get_ext_attr_dict(extattrs: dict, excluded_attrs: Optional[list] = None):
     """Rebuild Extensibility Attributes dict into standard k/v pattern.
 
@@ -64,14 +81,9 @@ def get_ext_attr_dict(extattrs: dict, excluded_attrs: Optional[list] = None):
     Returns:
         dict: Standardized dictionary for Extensibility Attributes.
     """
-    if excluded_attrs is None:
-        excluded_attrs = []
-    fixed_dict = {}
-    for key, value in extattrs.items():
-        if key in excluded_attrs:
-            continue
-        fixed_dict[slugify(key).replace("-", "_")] = value["value"]
-    return fixed_dict
+    if not excluded_attrs:
+        return {get_ext_attr_key(key): value["value"] for key, value in extattrs.items()}
+    return {get_ext_attr_key(key): value["value"] for key, value in extattrs.items() if key not in excluded_attrs}
 
 
 def build_vlan_map(vlans: list):
@@ -1,7 +1,9 @@
 """Utility functions for working with Nautobot."""
 
-from nautobot.extras.models import Relationship
-from nautobot.ipam.models import Prefix
+from collections import defaultdict
+
+from nautobot.extras.models import Relationship, RelationshipAssociation
+from nautobot.ipam.models import VLAN, Prefix
 
 
 def build_vlan_map_from_relations(vlans: list):
@@ -34,3 +36,21 @@ def get_prefix_vlans(prefix: Prefix) -> list:
     pf_relations = prefix.get_relationships()
     pf_vlan_relationship = Relationship.objects.get(label="Prefix -> VLAN")
     return [x.destination for x in pf_relations["source"][pf_vlan_relationship]]
+
+
+def get_vlans_by_prefix() -> dict:
+    """Get lists of current VLANs with RelationshipAssociation to Prefixes, for all Prefixes at once.
+
+    Returns:
+        dict: Map of Prefix IDs to lists of VLAN objects with RelationshipAssociation to the Prefix.
+    """
+    associations = RelationshipAssociation.objects.filter(relationship__label="Prefix -> VLAN").values_list(
+        "source_id", "destination_id"
+    )
+    vlans = VLAN.objects.filter(pk__in=[vlan_id for _, vlan_id in associations]).select_related("vlan_group")
+    vlans_by_id = {vlan.id: vlan for vlan in vlans}
+    vlans_by_prefix = defaultdict(list)
+    for prefix_id, vlan_id in associations:
+        if vlan_id in vlans_by_id:
+            vlans_by_prefix[prefix_id].append(vlans_by_id[vlan_id])
+    return vlans_by_prefix
@@ -0,0 +1,49 @@
+"""In-memory index of networks for answering containment queries without calling Infoblox."""
+
+import bisect
+import ipaddress
+from typing import Any, Iterator, List, Optional, Tuple
+
+
+class PrefixTree:
+    """Index of the networks of a single address family, such as those of a network view.
+
+    Networks are kept sorted by their first address, so that the networks contained in another network form a
+    contiguous range that can be found by bisection.
+    """
+
+    def __init__(self):
+        """Initialize an empty tree."""
+        self._networks = {}
+        # Sorted (first address, last address, prefix length) tuples, rebuilt on the first query after an insert.
+        self._sorted: Optional[List[Tuple[int, int, int]]] = None
+
+    def __len__(self) -> int:
+        """Return the number of networks in the tree."""
+        return len(self._networks)
+
+    @staticmethod
+    def _key(network: str) -> Tuple[int, int, int]:
+        net = ipaddress.ip_network(network, strict=False)
+        return int(net.network_address), int(net.broadcast_address), net.prefixlen
+
+    def add(self, network: str, value: Any):
+        """Add a network with an associated value, such as the Infoblox object of the network."""
+        self._networks[self._key(network)] = value
+        self._sorted = None
+
+    def get(self, network: str) -> Optional[Any]:
+        """Return the value of a network, or `None` if the tree doesn't hold it."""
+        return self._networks.get(self._key(network))
+
+    def subnets(self, network: str) -> Iterator[Any]:
+        """Yield the values of the networks contained in or equal to `network`, in address order."""
+        if self._sorted is None:
+            self._sorted = sorted(self._networks)
+        first, last, prefixlen = self._key(network)
+        start = bisect.bisect_left(self._sorted, (first, first, prefixlen))
+        for key in self._sorted[start:]:
+            if key[0] > last:
+                break
+            if key[1] <= last:
+                yield self._networks[key]
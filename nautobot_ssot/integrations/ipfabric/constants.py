@@ -11,6 +11,7 @@ IPFABRIC_SSL_VERIFY = CONFIG.get("ipfabric_ssl_verify")
 NAUTOBOT_HOST = CONFIG.get("nautobot_host")
 # Optional Settings
 IPFABRIC_TIMEOUT = int(CONFIG.get("ipfabric_timeout", 15))
+IPFABRIC_PAGE_SIZE = int(CONFIG.get("ipfabric_page_size", 1000))
 ALLOW_DUPLICATE_ADDRESSES = CONFIG.get("ipfabric_allow_duplicate_addresses", True)
 DEFAULT_DEVICE_ROLE = CONFIG.get("ipfabric_default_device_role", "Network Device")
 DEFAULT_DEVICE_ROLE_COLOR = CONFIG.get("ipfabric_default_device_role_color", "ff0000")
@@ -1,6 +1,7 @@
 # pylint: disable=duplicate-code
 """DiffSync adapter class for Ip Fabric."""
 
+import functools
 import ipaddress
 import logging
 from collections import defaultdict
@@ -17,15 +18,22 @@ from nautobot_ssot.integrations.ipfabric.constants import (
     DEFAULT_INTERFACE_MAC,
     DEFAULT_INTERFACE_MTU,
     IP_FABRIC_USE_CANONICAL_INTERFACE_NAME,
+    IPFABRIC_PAGE_SIZE,
 )
 from nautobot_ssot.integrations.ipfabric.diffsync import DiffSyncModelAdapters
 from nautobot_ssot.integrations.ipfabric.utilities import utils as ipfabric_utils
+from nautobot_ssot.integrations.ipfabric.utilities.networks import ManagedNetworks
 
 logger = logging.getLogger("nautobot.jobs")
 
 device_serial_max_length = Device._meta.get_field("serial").max_length
 name_max_length = VLAN._meta.get_field("name").max_length
 
+# Columns of the IP Fabric tables used by the DiffSync models, all other columns aren't requested.
+DEVICE_COLUMNS = ["hostname", "siteName", "sn", "vendor", "model", "devType", "family", "loginIp"]
+INTERFACE_COLUMNS = ["hostname", "intName", "dscr", "mac", "mtu", "media", "primaryIp"]
+VLAN_COLUMNS = ["siteName", "vlanId", "vlanName", "dscr"]
+
 
 # pylint: disable=too-many-locals,too-many-nested-blocks,too-many-branches
 class IPFabricDiffSync(DiffSyncModelAdapters):
@@ -49,8 +57,15 @@ class IPFabricDiffSync(DiffSyncModelAdapters):
                 logger.warning(f"Duplicate Location discovered, {site}")
 
     def load_device_interfaces(self, device_model, interfaces, device_primary_ip, networks):
-        """Create and load DiffSync Interface model objects for a specific device."""
-        device_interfaces = [iface for iface in interfaces if iface.get("hostname") == device_model.name]
+        """Create and load DiffSync Interface model objects for a specific device.
+
+        Args:
+            device_model: The DiffSync Device model of the device.
+            interfaces: The IP Fabric interfaces of the device, see `group_by`.
+            device_primary_ip: The login IP address of the device.
+            networks: The managed networks of all sites.
+        """
+        device_interfaces = list(interfaces)
         pseudo_interface = pseudo_management_interface(device_model.name, device_interfaces, device_primary_ip)
 
         if pseudo_interface:
@@ -61,26 +76,9 @@ class IPFabricDiffSync(DiffSyncModelAdapters):
             subnet_mask = None
             ip_address = iface.get("primaryIp")
             if ip_address:
-                ip_network = ipaddress.ip_network(ip_address)
-                for network in networks[device_model.location_name]:
-                    if network.supernet_of(ip_network):
-                        subnet_mask = str(network.netmask)
-                        break
-                else:
-                    subnet_mask = None
-                    for site_name, site_networks in networks.items():
-                        # Already checked networks for the site
-                        if site_name == device_model.location_name:
-                            continue
-                        for network in site_networks:
-                            if network.supernet_of(ip_network):
-                                subnet_mask = str(network.netmask)
-                                break
-                        if subnet_mask:
-                            break
-                    else:
-                        # TODO: why is only IPv4?
-                        subnet_mask = "255.255.255.255"
+                network = networks.lookup(device_model.location_name, ipaddress.ip_interface(ip_address).ip)
+                # TODO: why is only IPv4?
+                subnet_mask = str(network.netmask) if network is not None else "255.255.255.255"
 
             iface_name = iface["intName"]
             if IP_FABRIC_USE_CANONICAL_INTERFACE_NAME:
@@ -112,21 +110,29 @@ class IPFabricDiffSync(DiffSyncModelAdapters):
     def load(self):  # pylint: disable=too-many-locals,too-many-statements
         """Load data from IP Fabric."""
         self.load_sites()
-        devices = self.client.inventory.devices.all()
-        interfaces = self.client.inventory.interfaces.all()
-        vlans = self.client.fetch_all("tables/vlan/site-summary")
-        networks = defaultdict(list)
+        # Index the inventory once, so that the objects of a site or device are looked up rather than filtered.
+        devices = group_by(iter_table(self.client.inventory.devices.fetch, DEVICE_COLUMNS), "siteName")
+        interfaces = group_by(iter_table(self.client.inventory.interfaces.fetch, INTERFACE_COLUMNS), "hostname")
+        vlans = group_by(
+            iter_table(functools.partial(self.client.fetch, "tables/vlan/site-summary"), VLAN_COLUMNS), "siteName"
+        )
+        # Fetch the members of all stacks at once rather than per device, keyed by the site and the master's hostname.
+        stacks_members = defaultdict(list)
+        for member in self.client.technology.platforms.stacks_members.all(
+            columns=["master", "member", "memberSn", "pn", "siteName"],
+        ):
+            stacks_members[(member.get("siteName"), member.get("master"))].append(member)
+        networks = ManagedNetworks()
         for network in self.client.technology.managed_networks.networks.all(
             filters={"net": ["empty", False], "siteName": ["empty", False]},
             columns=["net", "siteName"],
         ):
             # IPF bug NIM-15635 Fix Version 7.0: 'net' column has host bits set.
-            networks[network["siteName"]].append(ipaddress.ip_network(network["net"], strict=False))
+            networks.add(network["siteName"], ipaddress.ip_network(network["net"], strict=False))
         for location in self.get_all(self.location):
             if location.name is None:
                 continue
-            location_vlans = [vlan for vlan in vlans if vlan["siteName"] == location.name]
-            for vlan in location_vlans:
+            for vlan in vlans.get(location.name, []):
                 if not vlan["vlanId"] or (vlan["vlanId"] < 1 or vlan["vlanId"] > 4094):
                     logger.warning(
                         f"Not syncing VLAN, NAME: {vlan.get('vlanName')} due to invalid VLAN ID: {vlan.get('vlanId')}."
@@ -149,13 +155,9 @@ class IPFabricDiffSync(DiffSyncModelAdapters):
                     location.add_child(vlan)
                 except ObjectAlreadyExists:
                     logger.warning(f"Duplicate VLAN discovered, {vlan}")
-            location_devices = [device for device in devices if device["siteName"] == location.name]
-            for device in location_devices:
+            for device in devices.get(location.name, []):
                 device_name = device["hostname"]
-                stack_members = self.client.technology.platforms.stacks_members.all(
-                    filters={"master": ["eq", device_name], "siteName": ["eq", location.name]},
-                    columns=["master", "member", "memberSn", "pn"],
-                )
+                stack_members = stacks_members.get((location.name, device_name), [])
                 base_args = {
                     "diffsync": self,
                     "location_name": device["siteName"],
@@ -211,11 +213,38 @@ class IPFabricDiffSync(DiffSyncModelAdapters):
                         self.add(device_model)
                         location.add_child(device_model)
                         if index == 0:
-                            self.load_device_interfaces(device_model, interfaces, device_primary_ip, networks)
+                            self.load_device_interfaces(
+                                device_model, interfaces.get(device_name, []), device_primary_ip, networks
+                            )
                     except ObjectAlreadyExists:
                         logger.warning(f"Duplicate Device discovered, {device}")
 
 
+def iter_table(fetch, columns, page_size=IPFABRIC_PAGE_SIZE):
+    """Yield the rows of an IP Fabric table page by page, limited to the given columns.
+
+    Args:
+        fetch: The `fetch` method of the table, which takes the columns and the `limit` and `start` of a page.
+        columns: The columns to request.
+        page_size: The number of rows to request at a time.
+    """
+    start = 0
+    while True:
+        rows = fetch(columns=columns, limit=page_size, start=start)
+        yield from rows
+        if len(rows) < page_size:
+            return
+        start += page_size
+
+
+def group_by(rows, key):
+    """Return a dict of lists of the rows of an IP Fabric table, keyed by the value of the `key` column."""
+    groups = defaultdict(list)
+    for row in rows:
+        groups[row.get(key)].append(row)
+    return groups
+
+
 def pseudo_management_interface(hostname, device_interfaces, device_primary_ip):
     """Return a dict for an non-existing interface for NAT management addresses."""
     if any(iface for iface in device_interfaces if iface.get("primaryIp", "") == device_primary_ip):
@@ -5,24 +5,25 @@
 
 import logging
 from collections import defaultdict
-from typing import Any, ClassVar, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Type
 
 from diffsync import Adapter
 from diffsync.exceptions import ObjectAlreadyExists
 from django.db import IntegrityError, transaction
-from django.db.models import ProtectedError, Q
-from nautobot.core.choices import ColorChoices
+from django.db.models import Model, ProtectedError, Q
 from nautobot.dcim.models import Device, Location
 from nautobot.extras.models import Tag
 from nautobot.ipam.models import VLAN, Interface
 from netutils.ip import cidr_to_netmask
 from netutils.mac import mac_to_format
 
+from nautobot_ssot.contrib.cache import ORMCache
 from nautobot_ssot.integrations.ipfabric.constants import (
     DEFAULT_INTERFACE_MAC,
     DEFAULT_INTERFACE_MTU,
 )
 from nautobot_ssot.integrations.ipfabric.diffsync import DiffSyncModelAdapters
+from nautobot_ssot.integrations.ipfabric.utilities import nbutils
 
 logger = logging.getLogger("nautobot.ssot.ipfabric")
 
@@ -43,15 +44,80 @@ class NautobotDiffSync(DiffSyncModelAdapters):
         sync,
         sync_ipfabric_tagged_only: bool,
         location_filter: Optional[Location],
+        batched_writes: bool = False,
         *args,
         **kwargs,
     ):
-        """Initialize the NautobotDiffSync."""
+        """Initialize the NautobotDiffSync.
+
+        Args:
+            job: The job running the sync.
+            sync: The Sync the adapter is used for.
+            sync_ipfabric_tagged_only: Whether to only load objects tagged as synced from IP Fabric.
+            location_filter: The only Location to load objects from, if any.
+            batched_writes: Whether new interfaces are created in bulk once the sync is complete, rather than one by
+                one, see `write_pending_interfaces`.
+        """
         super().__init__(*args, **kwargs)
         self.job = job
         self.sync = sync
         self.sync_ipfabric_tagged_only = sync_ipfabric_tagged_only
         self.location_filter = location_filter
+        self.batched_writes = batched_writes
+        # Reference objects looked up while syncing, such as tags, statuses and roles, are cached for the whole sync.
+        self.orm_cache = ORMCache()
+        # Devices and the details of new interfaces on them, queued by `Interface.create` if `batched_writes` is set.
+        self.pending_interfaces = []
+
+    def get_from_orm_cache(self, parameters: Dict, model_class: Type[Model]):
+        """Retrieve an object from the ORM or the cache.
+
+        As with `get`, this raises `DoesNotExist` or `MultipleObjectsReturned` unless exactly one object matches.
+        """
+        parameter_set = frozenset(parameters.items())
+        if cached_object := self.orm_cache.get(model_class, parameter_set):
+            return cached_object
+        database_object = model_class.objects.get(**parameters)
+        self.orm_cache.set(model_class, parameter_set, database_object)
+        return database_object
+
+    def get_tag(self, tag_name: str = "SSoT Synced from IPFabric", defaults: Optional[dict] = None) -> Tag:
+        """Return the tag with the given name, creating it with `defaults` if it doesn't exist."""
+        parameter_set = frozenset([("name", tag_name)])
+        if tag := self.orm_cache.get(Tag, parameter_set):
+            return tag
+        tag = nbutils.get_or_create_tag(tag_name, defaults=defaults)
+        self.orm_cache.set(Tag, parameter_set, tag)
+        return tag
+
+    def write_pending_interfaces(self):
+        """Create the interfaces queued by `Interface.create`, along with their IP addresses, in bulk.
+
+        Interfaces that turn out to exist already are updated one by one instead, as if `batched_writes` wasn't set.
+        The interfaces were already counted as created in the diff when they were queued, so those that can't be
+        created are logged as errors here.
+        """
+        pending, self.pending_interfaces = self.pending_interfaces, []
+        existing_interfaces = set(
+            self._interface.objects.filter(device__in={device_obj.pk for device_obj, _, _ in pending}).values_list(
+                "device_id", "name"
+            )
+        )
+        new_interfaces = []
+        for device_obj, ids, attrs in pending:
+            if (device_obj.pk, ids["name"]) in existing_interfaces:
+                self.interface.create_in_nautobot(self, device_obj, ids, attrs)
+            else:
+                new_interfaces.append((device_obj, {**ids, **attrs}))
+        if new_interfaces:
+            created = nbutils.bulk_create_interfaces(new_interfaces, tag=self.get_tag(), logger=self.job.logger)
+            created_ids = {(interface_obj.device_id, interface_obj.name) for interface_obj in created}
+            for device_obj, details in new_interfaces:
+                if (device_obj.pk, details["name"]) not in created_ids:
+                    self.job.logger.error(
+                        f"Unable to create an Interface named {details['name']} on a Device named {device_obj.name}"
+                    )
+            self.job.logger.info(f"Created {len(created)} of {len(new_interfaces)} new Interfaces in bulk.")
 
     def sync_complete(self, source: Adapter, *args, **kwargs):
         """Clean up function for DiffSync sync.
@@ -62,6 +128,8 @@ class NautobotDiffSync(DiffSyncModelAdapters):
         Args:
             source (Adapter): DiffSync Adapter
         """
+        if self.pending_interfaces:
+            self.write_pending_interfaces()
         for grouping in (
             "_vlan",
             "_interface",
@@ -200,13 +268,7 @@ class NautobotDiffSync(DiffSyncModelAdapters):
     @transaction.atomic
     def load_data(self):
         """Add Nautobot Location objects as DiffSync Location models."""
-        ssot_tag, _ = Tag.objects.get_or_create(
-            name="SSoT Synced from IPFabric",
-            defaults={
-                "description": "Object synced at some point from IPFabric to Nautobot",
-                "color": ColorChoices.COLOR_LIGHT_GREEN,
-            },
-        )
+        ssot_tag = self.get_tag()
         location_objects = self.get_initial_location(ssot_tag)
         # The parent object that stores all children, is the Location.
         if self.job.debug:
@@ -10,7 +10,6 @@ from uuid import UUID
 from diffsync import DiffSyncModel
 from django.core.exceptions import ValidationError
 from django.db import Error as DjangoBaseDBError
-from django.db.models import Q
 from nautobot.core.choices import ColorChoices
 from nautobot.dcim.models import (
     Device as NautobotDevice,
@@ -26,7 +25,7 @@ from nautobot.dcim.models import (
 from nautobot.dcim.models import (
     Location as NautobotLocation,
 )
-from nautobot.extras.models import Role, Tag
+from nautobot.extras.models import Role
 from nautobot.extras.models.statuses import Status
 from nautobot.ipam.models import VLAN, IPAddress
 from netutils.ip import netmask_to_cidr
@@ -70,7 +69,7 @@ class DiffSyncExtras(DiffSyncModel):
             super().delete()
         else:
             if safe_delete_status:
-                safe_delete_status = Status.objects.get(name=safe_delete_status.capitalize())
+                safe_delete_status = self.adapter.get_from_orm_cache({"name": safe_delete_status.capitalize()}, Status)
                 if hasattr(nautobot_object, "status"):
                     if not nautobot_object.status == safe_delete_status:
                         nautobot_object.status = safe_delete_status
@@ -80,8 +79,8 @@ class DiffSyncExtras(DiffSyncModel):
                     # Not everything has a status. This may come in handy once more models are synced.
                     logger.warning(f"{nautobot_object} has no Status attribute.")
             if hasattr(nautobot_object, "tags"):
-                ssot_safe_tag, _ = Tag.objects.get_or_create(
-                    name="SSoT Safe Delete",
+                ssot_safe_tag = self.adapter.get_tag(
+                    "SSoT Safe Delete",
                     defaults={
                         "description": "Safe Delete Mode tag to flag an object, but not delete from Nautobot.",
                         "color": ColorChoices.COLOR_RED,
@@ -94,12 +93,31 @@ class DiffSyncExtras(DiffSyncModel):
                     logger.warning(f"Tagging {nautobot_object} with `SSoT Safe Delete`.")
                     update = True
             if update:
-                tonb_nbutils.tag_object(nautobot_object=nautobot_object, custom_field=LAST_SYNCHRONIZED_CF_NAME)
+                tonb_nbutils.tag_object(
+                    nautobot_object=nautobot_object, custom_field=LAST_SYNCHRONIZED_CF_NAME, tag=self.adapter.get_tag()
+                )
             else:
                 logger.warning(f"{nautobot_object} has previously been tagged with `SSoT Safe Delete`. Skipping...")
 
         return self
 
+    @staticmethod
+    def _get_first_from_orm_cache(adapter, parameters: dict, model_class):
+        """Return the first object matching the parameters, as cached by the adapter, or `None` if there is none."""
+        try:
+            return adapter.get_from_orm_cache(parameters, model_class)
+        except model_class.DoesNotExist:
+            return None
+        except model_class.MultipleObjectsReturned:
+            return model_class.objects.filter(**parameters).first()
+
+    @classmethod
+    def _get_synced_device(cls, adapter, device_name: str) -> Optional[NautobotDevice]:
+        """Return the Device synced from IP Fabric with the given name, or `None` if there is none."""
+        return cls._get_first_from_orm_cache(
+            adapter, {"name": device_name, "tags__name": "SSoT Synced from IPFabric"}, NautobotDevice
+        )
+
 
 class Location(DiffSyncExtras):
     """Location model."""
@@ -161,15 +179,17 @@ class Location(DiffSyncExtras):
                 location.custom_field_data["ipfabric_site_id"] = site_id
             active_status = attrs.get("status")
             if active_status == "Active":
-                safe_delete_tag, _ = Tag.objects.get_or_create(name="SSoT Safe Delete")
+                safe_delete_tag = self.adapter.get_tag("SSoT Safe Delete")
                 if not location.status == active_status:
-                    location.status = Status.objects.get(name=active_status)
+                    location.status = self.adapter.get_from_orm_cache({"name": active_status}, Status)
                 device_tags = location.tags.filter(pk=safe_delete_tag.pk)
                 if device_tags.exists():
                     location.tags.remove(safe_delete_tag)
             try:
                 # Calls validated_save() on the object
-                tonb_nbutils.tag_object(nautobot_object=location, custom_field=LAST_SYNCHRONIZED_CF_NAME)
+                tonb_nbutils.tag_object(
+                    nautobot_object=location, custom_field=LAST_SYNCHRONIZED_CF_NAME, tag=self.adapter.get_tag()
+                )
             except (DjangoBaseDBError, ValidationError):
                 self.adapter.job.logger.error(f"Unable to update the existing Location named {self.name} with {attrs}")
             else:
@@ -220,10 +240,8 @@ class Device(DiffSyncExtras):
         # Get DeviceType
         device_name = ids["name"]
         device_type_name = attrs["model"]
-        device_type_filter = DeviceType.objects.filter(model=device_type_name)
-        if device_type_filter.exists():
-            device_type_object = device_type_filter.first()
-        else:
+        device_type_object = cls._get_first_from_orm_cache(adapter, {"model": device_type_name}, DeviceType)
+        if not device_type_object:
             vendor_name = attrs["vendor"]
             device_type_object = tonb_nbutils.create_device_type_object(
                 device_type=device_type_name,
@@ -258,16 +276,17 @@ class Device(DiffSyncExtras):
 
         # Get Role, update if missing cf and create otherwise
         role_name = attrs.get("role", DEFAULT_DEVICE_ROLE)
-        device_role_filter = Role.objects.filter(name=role_name)
-        if device_role_filter.exists():
-            device_role_object = device_role_filter.first()
-            device_role_object.cf["ipfabric_type"] = role_name
-            try:
-                device_role_object.validated_save()
-            except (DjangoBaseDBError, ValidationError):
-                adapter.job.logger.error(
-                    f"Unable to perform a validated_save() on Role {role_name} with an ID of {device_role_object.id}"
-                )
+        device_role_object = cls._get_first_from_orm_cache(adapter, {"name": role_name}, Role)
+        if device_role_object:
+            # The role is cached for the rest of the sync, so it is only saved for the first of its devices.
+            if device_role_object.cf.get("ipfabric_type") != role_name:
+                device_role_object.cf["ipfabric_type"] = role_name
+                try:
+                    device_role_object.validated_save()
+                except (DjangoBaseDBError, ValidationError):
+                    adapter.job.logger.error(
+                        f"Unable to perform a validated_save() on Role {role_name} with an ID of {device_role_object.id}"
+                    )
         else:
             device_role_object = tonb_nbutils.get_or_create_device_role_object(
                 role_name=role_name,
@@ -280,10 +299,8 @@ class Device(DiffSyncExtras):
                     f"to get or create a Role named {role_name}"
                 )
         # Get Status
-        device_status_filter = Status.objects.filter(name=DEFAULT_DEVICE_STATUS)
-        if device_status_filter.exists():
-            device_status_object = device_status_filter.first()
-        else:
+        device_status_object = cls._get_first_from_orm_cache(adapter, {"name": DEFAULT_DEVICE_STATUS}, Status)
+        if not device_status_object:
             device_status_object = tonb_nbutils.create_status(
                 DEFAULT_DEVICE_STATUS,
                 DEFAULT_DEVICE_STATUS_COLOR,
@@ -296,10 +313,8 @@ class Device(DiffSyncExtras):
                 )
         # Get Location
         location_name = attrs["location_name"]
-        location_object_filter = NautobotLocation.objects.filter(name=location_name)
-        if location_object_filter.exists():
-            location_object = location_object_filter.first()
-        else:
+        location_object = cls._get_first_from_orm_cache(adapter, {"name": location_name}, NautobotLocation)
+        if not location_object:
             location_object = tonb_nbutils.create_location(location_name, logger=adapter.job.logger)
             if not location_object:
                 adapter.job.logger.warning(
@@ -329,7 +344,9 @@ class Device(DiffSyncExtras):
             else:
                 try:
                     # Validated save happens inside of tag_objet
-                    tonb_nbutils.tag_object(nautobot_object=new_device, custom_field=LAST_SYNCHRONIZED_CF_NAME)
+                    tonb_nbutils.tag_object(
+                        nautobot_object=new_device, custom_field=LAST_SYNCHRONIZED_CF_NAME, tag=adapter.get_tag()
+                    )
                 except (DjangoBaseDBError, ValidationError) as error:
                     adapter.job.logger.error(
                         f"Unable to perform a validated_save() on Device {device_name} with an ID of {new_device.id}"
@@ -387,9 +404,9 @@ class Device(DiffSyncExtras):
         else:
             return_super = True
             if attrs.get("status") == "Active":
-                safe_delete_tag, _ = Tag.objects.get_or_create(name="SSoT Safe Delete")
+                safe_delete_tag = self.adapter.get_tag("SSoT Safe Delete")
                 if not _device.status == "Active":
-                    _device.status = Status.objects.get(name="Active")
+                    _device.status = self.adapter.get_from_orm_cache({"name": "Active"}, Status)
                 device_tags = _device.tags.filter(pk=safe_delete_tag.pk)
                 if device_tags.exists():
                     _device.tags.remove(safe_delete_tag)
@@ -467,7 +484,9 @@ class Device(DiffSyncExtras):
                     return_super = False
             # tonb_nbutils.tag_object calls validated_save()
             try:
-                tonb_nbutils.tag_object(nautobot_object=_device, custom_field=LAST_SYNCHRONIZED_CF_NAME)
+                tonb_nbutils.tag_object(
+                    nautobot_object=_device, custom_field=LAST_SYNCHRONIZED_CF_NAME, tag=self.adapter.get_tag()
+                )
             except (DjangoBaseDBError, ValidationError):
                 self.adapter.job.logger.error(f"Unable to update the existing Device named {self.name} with {attrs}")
                 return_super = False
@@ -567,79 +586,96 @@ class Interface(DiffSyncExtras):
 
     @classmethod
     def create(cls, adapter, ids, attrs):
-        """Create interface in Nautobot under its parent device."""
+        """Create interface in Nautobot under its parent device.
+
+        If the adapter has `batched_writes` set, the interface is only queued here and created in bulk by
+        `write_pending_interfaces` once the sync is complete.
+        """
         device_name = ids["device_name"]
         interface_name = ids["name"]
-        ip_address = attrs["ip_address"]
-        subnet_mask = attrs["subnet_mask"]  # TODO: switch to cidr notation since both APIs use that format
-        ssot_tag, _ = Tag.objects.get_or_create(name="SSoT Synced from IPFabric")
-        device_obj = NautobotDevice.objects.filter(Q(name=device_name) & Q(tags__name=ssot_tag.name)).first()
+        device_obj = cls._get_synced_device(adapter, device_name)
 
         if device_obj:
-            return_super = True
             if not attrs.get("mac_address"):
                 attrs["mac_address"] = DEFAULT_INTERFACE_MAC
-            interface_obj = tonb_nbutils.create_interface(
-                device_obj=device_obj,
-                interface_details={**ids, **attrs},
+            if adapter.batched_writes:
+                adapter.pending_interfaces.append((device_obj, ids, attrs))
+                return super().create(ids=ids, adapter=adapter, attrs=attrs)
+            if cls.create_in_nautobot(adapter, device_obj, ids, attrs):
+                return super().create(ids=ids, adapter=adapter, attrs=attrs)
+        else:
+            adapter.job.logger.warning(
+                f"Unable to create an Interface with the name {interface_name} because of a failure "
+                f"to get a Device named {device_name}"
+            )
+        return None
+
+    @classmethod
+    def create_in_nautobot(cls, adapter, device_obj, ids, attrs) -> bool:
+        """Get or create an interface on a device in Nautobot, along with its IP address.
+
+        Returns:
+            bool: Whether the interface and its IP address were created or updated successfully.
+        """
+        device_name = ids["device_name"]
+        interface_name = ids["name"]
+        ip_address = attrs["ip_address"]
+        subnet_mask = attrs["subnet_mask"]  # TODO: switch to cidr notation since both APIs use that format
+        return_super = True
+        interface_obj = tonb_nbutils.create_interface(
+            device_obj=device_obj,
+            interface_details={**ids, **attrs},
+            logger=adapter.job.logger,
+        )
+        if interface_obj and ip_address:
+            if interface_obj.ip_addresses.exists():
+                interface_obj.ip_addresses.all().delete()
+            ip_address_obj = tonb_nbutils.create_ip(
+                ip_address=ip_address,
+                subnet_mask=subnet_mask,
+                status=attrs["status"],
+                object_pk=interface_obj,
                 logger=adapter.job.logger,
             )
-            if interface_obj and ip_address:
-                if interface_obj.ip_addresses.exists():
-                    interface_obj.ip_addresses.all().delete()
-                ip_address_obj = tonb_nbutils.create_ip(
-                    ip_address=ip_address,
-                    subnet_mask=subnet_mask,
-                    status=attrs["status"],
-                    object_pk=interface_obj,
-                    logger=adapter.job.logger,
-                )
-                if ip_address_obj:
-                    interface_obj.ip_addresses.add(ip_address_obj)
-                    if attrs.get("ip_is_primary"):
-                        if ip_address_obj.ip_version == 4:
-                            device_obj.primary_ip4 = ip_address_obj
-                            device_obj.save()
-                        if ip_address_obj.ip_version == 6:
-                            device_obj.primary_ip6 = ip_address_obj
-                            device_obj.save()
-                else:
-                    adapter.job.logger.warning(
-                        f"Unable to assign an IPAddress to an Interface named {interface_name} on a Device named {device_name} "
-                        f"because of a failure to get or create an IPAddress of {ip_address}/{subnet_mask}"
-                    )
-                    return_super = False
-                try:
-                    interface_obj.validated_save()
-                except (DjangoBaseDBError, ValidationError):
-                    adapter.job.logger.error(
-                        f"Unable to perform a validated_save() on an Interface named {interface_name} on a Device named {device_name}"
-                    )
-                    return_super = False
-            elif ip_address:
+            if ip_address_obj:
+                interface_obj.ip_addresses.add(ip_address_obj)
+                if attrs.get("ip_is_primary"):
+                    # The device is cached for the rest of the sync, so only the primary IP is saved.
+                    if ip_address_obj.ip_version == 4:
+                        device_obj.primary_ip4 = ip_address_obj
+                        device_obj.save(update_fields=["primary_ip4"])
+                    if ip_address_obj.ip_version == 6:
+                        device_obj.primary_ip6 = ip_address_obj
+                        device_obj.save(update_fields=["primary_ip6"])
+            else:
                 adapter.job.logger.warning(
-                    f"Unable to create an IPAddress {ip_address}/{subnet_mask} because of a failure "
-                    f"to get or create an Interface named {interface_name} on a Device named {device_name}"
+                    f"Unable to assign an IPAddress to an Interface named {interface_name} on a Device named {device_name} "
+                    f"because of a failure to get or create an IPAddress of {ip_address}/{subnet_mask}"
                 )
                 return_super = False
-            elif not interface_obj:
-                adapter.job.logger.warning(
-                    f"Unable to get or create an Interface named {interface_name} on a Device named {device_name}"
+            try:
+                interface_obj.validated_save()
+            except (DjangoBaseDBError, ValidationError):
+                adapter.job.logger.error(
+                    f"Unable to perform a validated_save() on an Interface named {interface_name} on a Device named {device_name}"
                 )
                 return_super = False
-            if return_super:
-                return super().create(ids=ids, adapter=adapter, attrs=attrs)
-        else:
+        elif ip_address:
             adapter.job.logger.warning(
-                f"Unable to create an Interface with the name {interface_name} because of a failure "
-                f"to get a Device named {device_name}"
+                f"Unable to create an IPAddress {ip_address}/{subnet_mask} because of a failure "
+                f"to get or create an Interface named {interface_name} on a Device named {device_name}"
             )
-        return None
+            return_super = False
+        elif not interface_obj:
+            adapter.job.logger.warning(
+                f"Unable to get or create an Interface named {interface_name} on a Device named {device_name}"
+            )
+            return_super = False
+        return return_super
 
     def delete(self) -> Optional["DiffSyncModel"]:
         """Delete Interface Object."""
-        ssot_tag, _ = Tag.objects.get_or_create(name="SSoT Synced from IPFabric")
-        device = NautobotDevice.objects.filter(Q(name=self.device_name) & Q(tags__name=ssot_tag.name)).first()
+        device = self._get_synced_device(self.adapter, self.device_name)
         if device:
             return_super = True
             try:
@@ -675,8 +711,7 @@ class Interface(DiffSyncExtras):
 
     def update(self, attrs):  # pylint: disable=too-many-branches
         """Update Interface object in Nautobot."""
-        ssot_tag, _ = Tag.objects.get_or_create(name="SSoT Synced from IPFabric")
-        device = NautobotDevice.objects.filter(Q(name=self.device_name) & Q(tags__name=ssot_tag.name)).first()
+        device = self._get_synced_device(self.adapter, self.device_name)
         if device:  # pylint: disable=too-many-nested-blocks
             return_super = True
             try:
@@ -762,10 +797,10 @@ class Interface(DiffSyncExtras):
                         try:
                             if interface_obj.ip_version == 4:
                                 device.primary_ip4 = interface_obj
-                                device.save()
+                                device.save(update_fields=["primary_ip4"])
                             if interface_obj.ip_version == 6:
                                 device.primary_ip6 = interface_obj
-                                device.save()
+                                device.save(update_fields=["primary_ip6"])
                         except (DjangoBaseDBError, ValidationError):
                             self.adapter.job.logger.error(
                                 f"Unable to update Primay IP for Device named {device.name} "
@@ -779,7 +814,9 @@ class Interface(DiffSyncExtras):
                         )
                         return_super = False
                 try:
-                    tonb_nbutils.tag_object(nautobot_object=interface, custom_field=LAST_SYNCHRONIZED_CF_NAME)
+                    tonb_nbutils.tag_object(
+                        nautobot_object=interface, custom_field=LAST_SYNCHRONIZED_CF_NAME, tag=self.adapter.get_tag()
+                    )
                 except (DjangoBaseDBError, ValidationError):
                     self.adapter.job.logger.error(
                         f"Unable to perform validated_save() on Interface named {self.name} "
@@ -821,7 +858,7 @@ class Vlan(DiffSyncExtras):
         vlan_id = attrs["vid"]
         vlan_name = ids["name"] if ids["name"] else f"VLAN{vlan_id}"
         try:
-            location = NautobotLocation.objects.get(name=ids["location"])
+            location = adapter.get_from_orm_cache({"name": ids["location"]}, NautobotLocation)
         except NautobotLocation.MultipleObjectsReturned:
             adapter.job.logger.error(
                 f"Multiple Locations returned with the name {location_name}, "
@@ -870,7 +907,7 @@ class Vlan(DiffSyncExtras):
     def update(self, attrs):
         """Update VLAN object in Nautobot."""
         try:
-            location_obj = NautobotLocation.objects.get(name=self.location)
+            location_obj = self.adapter.get_from_orm_cache({"name": self.location}, NautobotLocation)
         except NautobotLocation.MultipleObjectsReturned:
             self.adapter.job.logger.error(
                 f"Multiple Locations found with the name {self.location}, unable to "
@@ -899,16 +936,18 @@ class Vlan(DiffSyncExtras):
                 return_super = False
             else:
                 if attrs.get("status") == "Active":
-                    safe_delete_tag, _ = Tag.objects.get_or_create(name="SSoT Safe Delete")
+                    safe_delete_tag = self.adapter.get_tag("SSoT Safe Delete")
                     if not vlan.status == "Active":
-                        vlan.status = Status.objects.get(name="Active")
+                        vlan.status = self.adapter.get_from_orm_cache({"name": "Active"}, Status)
                     device_tags = vlan.tags.filter(pk=safe_delete_tag.pk)
                     if device_tags.exists():
                         vlan.tags.remove(safe_delete_tag)
                 if attrs.get("description"):
                     vlan.description = vlan.description
             try:
-                tonb_nbutils.tag_object(nautobot_object=vlan, custom_field=LAST_SYNCHRONIZED_CF_NAME)
+                tonb_nbutils.tag_object(
+                    nautobot_object=vlan, custom_field=LAST_SYNCHRONIZED_CF_NAME, tag=self.adapter.get_tag()
+                )
             except (DjangoBaseDBError, ValidationError):
                 self.adapter.job.logger.warning(
                     f"Unable to perform a validated_save() on VLAN {self.name} with an ID of {vlan.id}"
@@ -115,6 +115,12 @@ class IpFabricDataSource(DataSource):
         label="Sync Tagged Only",
         description="Only sync objects that have the 'SSoT Synced from IPFabric' Tag.",
     )
+    batched_writes = BooleanVar(
+        default=False,
+        label="Batch Interface Writes",
+        description="Create new Interfaces and their IP Addresses in bulk once the sync is complete. "
+        "Bulk writes don't create change log entries.",
+    )
     location_filter = OptionalObjectVar(
         description="Only sync Nautobot records belonging to a single Location. This does not filter IPFabric data.",
         model=Location,
@@ -134,6 +140,7 @@ class IpFabricDataSource(DataSource):
             "snapshot",
             "safe_delete_mode",
             "sync_ipfabric_tagged_only",
+            "batched_writes",
             "dryrun",
         )
 
@@ -223,6 +230,7 @@ class IpFabricDataSource(DataSource):
         safe_delete_mode=True,
         sync_ipfabric_tagged_only=True,
         location_filter=None,
+        batched_writes=False,
         *args,
         **kwargs,
     ):
@@ -233,6 +241,7 @@ class IpFabricDataSource(DataSource):
             "safe_delete_mode": safe_delete_mode,
             "sync_ipfabric_tagged_only": sync_ipfabric_tagged_only,
             "location_filter": location_filter,
+            "batched_writes": batched_writes,
             "debug": debug,
         }
 
@@ -258,12 +267,13 @@ class IpFabricDataSource(DataSource):
         tagged_only = self.kwargs["sync_ipfabric_tagged_only"]
         location_filter = self.kwargs["location_filter"]
         debug_mode = self.kwargs["debug"]
+        batched_writes = self.kwargs.get("batched_writes", False)
 
         if location_filter:
             location_filter_object = Location.objects.get(pk=location_filter)
         else:
             location_filter_object = None
-        options = f"`Snapshot_id`: {self.client.snapshot_id}.`Debug`: {debug_mode}, `Dry Run`: {dryrun}, `Safe Delete Mode`: {safe_mode}, `Sync Tagged Only`: {tagged_only}, `Location Filter`: {location_filter_object}"
+        options = f"`Snapshot_id`: {self.client.snapshot_id}.`Debug`: {debug_mode}, `Dry Run`: {dryrun}, `Safe Delete Mode`: {safe_mode}, `Sync Tagged Only`: {tagged_only}, `Location Filter`: {location_filter_object}, `Batch Interface Writes`: {batched_writes}"
         self.logger.info(f"Starting job with the following options: {options}")
 
         ipfabric_source = IPFabricDiffSync(job=self, sync=self.sync, client=self.client)
@@ -279,6 +289,7 @@ class IpFabricDataSource(DataSource):
             sync=self.sync,
             sync_ipfabric_tagged_only=tagged_only,
             location_filter=location_filter_object,
+            batched_writes=batched_writes,
         )
 
         self.logger.info("Loading current data from Nautobot...")
@@ -290,8 +301,7 @@ class IpFabricDataSource(DataSource):
         if debug_mode:
             self.logger.debug("Diff: %s", diff.dict())
 
-        self.sync.diff = diff.dict()
-        self.sync.save()
+        self.save_diff(diff)
         create = diff.summary().get("create")
         update = diff.summary().get("update")
         delete = diff.summary().get("delete")
@@ -1,6 +1,7 @@
 """Utilities."""
 
 from .nbutils import (
+    bulk_create_interfaces,
     create_device_type_object,
     create_interface,
     create_ip,
@@ -22,6 +23,7 @@ __all__ = (
     "create_status",
     "create_ip",
     "create_interface",
+    "bulk_create_interfaces",
     "json_fixture",
     "create_vlan",
     "clean_slate",
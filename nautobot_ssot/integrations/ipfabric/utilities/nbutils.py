@@ -2,12 +2,15 @@
 """Utility functions for Nautobot ORM."""
 
 import datetime
+import ipaddress
 import logging
-from typing import Any, Optional
+from collections import defaultdict
+from typing import Any, Iterable, List, Optional, Tuple
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db import Error as DjangoBaseDBError
+from django.db import transaction
 from nautobot.core.choices import ColorChoices
 from nautobot.dcim.models import (
     Device,
@@ -27,9 +30,21 @@ from netutils.ip import netmask_to_cidr
 from netutils.lib_mapper import NAPALM_LIB_MAPPER
 
 from nautobot_ssot.integrations.ipfabric.constants import LAST_SYNCHRONIZED_CF_NAME
+from nautobot_ssot.integrations.ipfabric.utilities.networks import NetworkIndex
+from nautobot_ssot.utils import bulk_tag_objects
 
 # pylint: disable=too-many-branches
 
+# Fields of the interfaces synced from IP Fabric, set when an interface is created.
+INTERFACE_FIELDS = (
+    "description",
+    "enabled",
+    "mac_address",
+    "mtu",
+    "type",
+    "mgmt_only",
+)
+
 
 def create_location(
     location_name: str,
@@ -426,15 +441,7 @@ def create_interface(
                 f"and therefore cannot create an Interface named {interface_name}"
             )
     else:
-        interface_fields = (
-            "description",
-            "enabled",
-            "mac_address",
-            "mtu",
-            "type",
-            "mgmt_only",
-        )
-        defaults = {k: v for k, v in interface_details.items() if k in interface_fields and v}
+        defaults = {k: v for k, v in interface_details.items() if k in INTERFACE_FIELDS and v}
         try:
             interface_obj, _ = device_obj.interfaces.get_or_create(
                 name=interface_name, status=status_obj, defaults=defaults
@@ -461,6 +468,181 @@ def create_interface(
     return None
 
 
+@transaction.atomic
+def bulk_create_interfaces(  # pylint: disable=too-many-locals,too-many-statements
+    pending: List[Tuple[Device, dict]],
+    tag: Tag,
+    logger: Optional[logging.Logger] = None,
+    batch_size: int = 1000,
+) -> List[Interface]:
+    """Create new interfaces along with their IP addresses in bulk.
+
+    This is the bulk equivalent of `create_interface` followed by `create_ip` for interfaces that don't exist yet.
+    IP addresses are reused if an address with the same mask and status exists, and otherwise created in the "Global"
+    namespace under their closest parent prefix. The interfaces and IP addresses are tagged with `tag` and have their
+    custom fields updated as by `tag_object`. As the objects are created with bulk queries, no change log entries are
+    created and no signals are sent for them. The objects are created in a single transaction, so that a failure
+    doesn't leave interfaces without their IP addresses or tags.
+
+    Args:
+        pending: Tuples of a device and the details of a new interface on it, such as the `name`, `status` and
+            `INTERFACE_FIELDS` of the interface, and its `ip_address`, `subnet_mask` and `ip_is_primary`.
+        tag: Tag to apply to the created interfaces and IP addresses.
+        logger: Logger to use for messaging.
+        batch_size: Number of objects created per query.
+
+    Returns:
+        List[Interface]: The created interfaces.
+    """
+    interface_statuses = {status.name: status for status in Status.objects.get_for_model(Interface)}
+    interfaces = []
+    interface_details = []
+    for device_obj, details in pending:
+        status = details.get("status", "Active")
+        if status not in interface_statuses:
+            if logger:
+                logger.error(
+                    f"Unable to find a Status with the name {status}, and therefore cannot create an Interface "
+                    f"named {details['name']} on Device named {device_obj.name}"
+                )
+            continue
+        interface_obj = Interface(
+            device=device_obj,
+            name=details["name"],
+            status=interface_statuses[status],
+            **{k: v for k, v in details.items() if k in INTERFACE_FIELDS and v},
+        )
+        try:
+            # The device and status are known to be valid and the interface to be new, which is what `full_clean`
+            # would otherwise query the database for, once per interface.
+            interface_obj.clean_fields(exclude=["device", "status"])
+            interface_obj.clean()
+        except ValidationError:
+            if logger:
+                logger.error(
+                    f"Unable to create a new Interface named {details['name']} on Device named {device_obj.name}"
+                )
+            continue
+        interfaces.append(interface_obj)
+        interface_details.append(details)
+    Interface.objects.bulk_create(interfaces, batch_size=batch_size)
+
+    ip_addresses = _bulk_get_or_create_ips(zip(interfaces, interface_details), logger=logger, batch_size=batch_size)
+    if logger:
+        assigned = {interface_obj.pk for interface_obj, _, _ in ip_addresses}
+        for interface_obj, details in zip(interfaces, interface_details):
+            if details.get("ip_address") and interface_obj.pk not in assigned:
+                logger.error(
+                    f"Unable to assign an IPAddress to an Interface named {interface_obj.name} on a Device named "
+                    f"{interface_obj.device.name} because of a failure to get or create an IPAddress of "
+                    f"{details['ip_address']}/{details['subnet_mask']}"
+                )
+    IPAddressToInterface.objects.bulk_create(
+        [IPAddressToInterface(ip_address=ip_obj, interface=interface_obj) for interface_obj, ip_obj, _ in ip_addresses],
+        batch_size=batch_size,
+    )
+
+    primary_ip_devices = {}
+    for interface_obj, ip_obj, details in ip_addresses:
+        if details.get("ip_is_primary"):
+            device_obj = interface_obj.device
+            setattr(device_obj, f"primary_ip{ip_obj.ip_version}", ip_obj)
+            primary_ip_devices[device_obj.pk] = device_obj
+    Device.objects.bulk_update(primary_ip_devices.values(), ["primary_ip4", "primary_ip6"], batch_size=batch_size)
+
+    custom_field_values = {"system_of_record": "IPFabric", LAST_SYNCHRONIZED_CF_NAME: datetime.date.today().isoformat()}
+    bulk_tag_objects(Interface, [obj.pk for obj in interfaces], tag=tag, custom_field_values=custom_field_values)
+    bulk_tag_objects(
+        IPAddress, {ip_obj.pk for _, ip_obj, _ in ip_addresses}, tag=tag, custom_field_values=custom_field_values
+    )
+    return interfaces
+
+
+def _bulk_get_or_create_ips(  # pylint: disable=too-many-locals
+    interfaces: Iterable[Tuple[Interface, dict]],
+    logger: Optional[logging.Logger] = None,
+    batch_size: int = 1000,
+) -> List[Tuple[Interface, IPAddress, dict]]:
+    """Get or create the IP addresses of interfaces in bulk, see `bulk_create_interfaces`.
+
+    Returns:
+        List[Tuple[Interface, IPAddress, dict]]: The interfaces with an IP address, their IP address and their details.
+    """
+    interfaces = [(interface_obj, details) for interface_obj, details in interfaces if details.get("ip_address")]
+    if not interfaces:
+        return []
+    ip_statuses = {status.name: status for status in Status.objects.get_for_model(IPAddress)}
+    existing_ips = defaultdict(list)
+    for ip_obj in IPAddress.objects.filter(host__in={details["ip_address"] for _, details in interfaces}):
+        existing_ips[ip_obj.host].append(ip_obj)
+
+    namespace_obj = Namespace.objects.get(name="Global")
+    # IP addresses are created under the most specific prefix containing them, as determined by `IPAddress.clean`.
+    prefixes = {}
+    prefix_index = NetworkIndex()
+    for pk, network, prefix_length in Prefix.objects.filter(namespace=namespace_obj).values_list(
+        "pk", "network", "prefix_length"
+    ):
+        prefix = ipaddress.ip_network(f"{network}/{prefix_length}")
+        prefixes[prefix] = pk
+        prefix_index.add(prefix)
+
+    new_ips = {}
+    result = []
+    for interface_obj, details in interfaces:
+        address = f"{details['ip_address']}/{netmask_to_cidr(details['subnet_mask'])}"
+        status = details.get("status", "Active")
+        if status not in ip_statuses:
+            if logger:
+                logger.error(
+                    f"Unable to find a Status with the name {status}, "
+                    f"and therefore cannot create an IPAddress of {address}"
+                )
+            continue
+        ip_obj = IPAddress(address=address, status=ip_statuses[status])
+        matches = [
+            existing
+            for existing in existing_ips[ip_obj.host]
+            if existing.mask_length == ip_obj.mask_length and existing.status_id == ip_obj.status_id
+        ]
+        if len(matches) > 1:
+            if logger:
+                logger.error(f"Multiple IPAddresses returned with the address of {address}")
+            continue
+        if matches:
+            result.append((interface_obj, matches[0], details))
+            continue
+        parent = prefix_index.lookup(ip_obj.host)
+        if parent is None and ip_obj.ip_version == 4:
+            # As in `create_ip`, IPv4 addresses without a parent prefix are created under 0.0.0.0/0.
+            parent_obj, _ = Prefix.objects.get_or_create(
+                network="0.0.0.0",  # noqa: S104
+                prefix_length=0,
+                type=PrefixTypeChoices.TYPE_NETWORK,
+                status=Status.objects.get_for_model(Prefix).get(name="Active"),
+                namespace=namespace_obj,
+            )
+            parent = ipaddress.ip_network("0.0.0.0/0")
+            prefixes[parent] = parent_obj.pk
+            prefix_index.add(parent)
+        if parent is None or any(existing.parent_id == prefixes[parent] for existing in existing_ips[ip_obj.host]):
+            if logger:
+                logger.error(f"Unable to create a new IPAddress of {address}")
+            continue
+        ip_obj.parent_id = prefixes[parent]
+        # IP addresses are unique per parent and host, so an address created for another interface is only reused if
+        # its mask and status match as well.
+        new_ip = new_ips.setdefault((ip_obj.parent_id, ip_obj.host), ip_obj)
+        if new_ip.mask_length != ip_obj.mask_length or new_ip.status_id != ip_obj.status_id:
+            if logger:
+                logger.error(f"Unable to create a new IPAddress of {address}")
+            continue
+        result.append((interface_obj, new_ip, details))
+
+    IPAddress.objects.bulk_create(new_ips.values(), batch_size=batch_size)
+    return result
+
+
 def create_vlan(  # pylint: disable=too-many-arguments
     vlan_name: str,
     vlan_id: int,
@@ -505,13 +687,12 @@ def create_vlan(  # pylint: disable=too-many-arguments
     return None
 
 
-def tag_object(nautobot_object: Any, custom_field: str, tag_name: Optional[str] = "SSoT Synced from IPFabric"):
-    """Apply the given tag and custom field to the identified object.
+def get_or_create_tag(tag_name: str = "SSoT Synced from IPFabric", defaults: Optional[dict] = None) -> Tag:
+    """Return the tag with the given name, creating it if it doesn't exist.
 
     Args:
-        nautobot_object (Any): Nautobot ORM Object
-        custom_field (str): Name of custom field to update
-        tag_name (Optional[str], optional): Tag name. Defaults to "SSoT Synced From IPFabric".
+        tag_name (str): Tag name. Defaults to "SSoT Synced From IPFabric".
+        defaults (Optional[dict], optional): Field values used if the tag is created, other than the name.
     """
     if tag_name == "SSoT Synced from IPFabric":
         tag, _ = Tag.objects.get_or_create(
@@ -522,7 +703,26 @@ def tag_object(nautobot_object: Any, custom_field: str, tag_name: Optional[str]
             },
         )
     else:
-        tag, _ = Tag.objects.get_or_create(name=tag_name)
+        tag, _ = Tag.objects.get_or_create(name=tag_name, defaults=defaults)
+    return tag
+
+
+def tag_object(
+    nautobot_object: Any,
+    custom_field: str,
+    tag_name: Optional[str] = "SSoT Synced from IPFabric",
+    tag: Optional[Tag] = None,
+):
+    """Apply the given tag and custom field to the identified object.
+
+    Args:
+        nautobot_object (Any): Nautobot ORM Object
+        custom_field (str): Name of custom field to update
+        tag_name (Optional[str], optional): Tag name. Defaults to "SSoT Synced From IPFabric".
+        tag (Optional[Tag], optional): The tag itself, if it has already been retrieved. Takes precedence over `tag_name`.
+    """
+    if tag is None:
+        tag = get_or_create_tag(tag_name)
 
     today = datetime.date.today().isoformat()
 
@@ -0,0 +1,69 @@
+"""Longest prefix match lookups of the networks managed by IP Fabric."""
+
+import ipaddress
+from collections import defaultdict
+from typing import Dict, Optional, Union
+
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+class NetworkIndex:
+    """Index of networks that finds the most specific network containing an IP address.
+
+    Networks are held in a hash table per address family and prefix length, keyed by their network address. A lookup
+    masks the address with each prefix length in use, from the longest to the shortest, so it takes at most as many
+    steps as the address has bits.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self._tables: Dict[int, Dict[int, Dict[int, IPNetwork]]] = {4: defaultdict(dict), 6: defaultdict(dict)}
+        # Prefix lengths in use per address family, longest first, rebuilt on the first lookup after an insert.
+        self._prefixlens: Dict[int, Optional[list]] = {4: None, 6: None}
+
+    def __len__(self) -> int:
+        """Return the number of networks in the index."""
+        return sum(len(networks) for table in self._tables.values() for networks in table.values())
+
+    def add(self, network: IPNetwork):
+        """Add a network to the index, unless it already holds an equal one."""
+        self._tables[network.version][network.prefixlen].setdefault(int(network.network_address), network)
+        self._prefixlens[network.version] = None
+
+    def lookup(self, address: Union[str, ipaddress.IPv4Address, ipaddress.IPv6Address]) -> Optional[IPNetwork]:
+        """Return the longest network containing `address`, or `None` if there is none."""
+        if isinstance(address, str):
+            address = ipaddress.ip_address(address)
+        table = self._tables[address.version]
+        prefixlens = self._prefixlens[address.version]
+        if prefixlens is None:
+            prefixlens = self._prefixlens[address.version] = sorted(table, reverse=True)
+        value = int(address)
+        max_prefixlen = address.max_prefixlen
+        for prefixlen in prefixlens:
+            network = table[prefixlen].get(value >> (max_prefixlen - prefixlen) << (max_prefixlen - prefixlen))
+            if network is not None:
+                return network
+        return None
+
+
+class ManagedNetworks:
+    """The managed networks of all sites, looked up in the site of an address first."""
+
+    def __init__(self):
+        """Initialize without any networks."""
+        self.sites: Dict[str, NetworkIndex] = defaultdict(NetworkIndex)
+        self.all = NetworkIndex()
+
+    def add(self, site_name: str, network: IPNetwork):
+        """Add a network of a site."""
+        self.sites[site_name].add(network)
+        self.all.add(network)
+
+    def lookup(self, site_name: str, address: Union[str, ipaddress.IPv4Address, ipaddress.IPv6Address]):
+        """Return the longest network of the site containing `address`, falling back to the networks of all sites."""
+        if isinstance(address, str):
+            address = ipaddress.ip_address(address)
+        site_networks = self.sites.get(site_name)
+        network = site_networks.lookup(address) if site_networks is not None else None
+        return network if network is not None else self.all.lookup(address)
@@ -4,13 +4,14 @@
 import datetime
 
 from diffsync import Adapter
-from diffsync.exceptions import ObjectNotFound
 from django.contrib.contenttypes.models import ContentType
 from nautobot.core.choices import ColorChoices
 from nautobot.dcim.models import Device, DeviceType, Interface, Location, Manufacturer
 from nautobot.extras.choices import CustomFieldTypeChoices
 from nautobot.extras.models import CustomField, Tag
 
+from nautobot_ssot.utils import bulk_tag_objects
+
 from . import models
 
 
@@ -143,44 +144,17 @@ class NautobotDiffSync(Adapter):
         for model in [Device, DeviceType, Interface, Manufacturer, Location]:
             custom_field.content_types.add(ContentType.objects.get_for_model(model))
 
-        for modelname in [
-            "company",
-            "device",
-            "interface",
-            "location",
-            "product_model",
+        today = datetime.date.today().isoformat()
+        for modelname, model_class in [
+            ("company", Manufacturer),
+            ("device", Device),
+            ("interface", Interface),
+            ("location", Location),
+            ("product_model", DeviceType),
         ]:
+            pks = []
             for local_instance in self.get_all(modelname):
-                unique_id = local_instance.get_unique_id()
                 # Verify that the object now has a counterpart in the target DiffSync
-                try:
-                    target.get(modelname, unique_id)
-                except ObjectNotFound:
-                    continue
-
-                self.tag_object(modelname, unique_id, tag, custom_field)
-
-    def tag_object(self, modelname, unique_id, tag, custom_field):
-        """Apply the given tag and custom field to the identified object."""
-        model_instance = self.get(modelname, unique_id)
-        today = datetime.date.today().isoformat()
-
-        def _tag_object(nautobot_object):
-            """Apply custom field and tag to object, if applicable."""
-            if hasattr(nautobot_object, "tags"):
-                nautobot_object.tags.add(tag)
-            if hasattr(nautobot_object, "cf"):
-                nautobot_object.cf[custom_field.key] = today
-            nautobot_object.validated_save()
-
-        if modelname == "company":
-            _tag_object(Manufacturer.objects.get(pk=model_instance.pk))
-        elif modelname == "device":
-            _tag_object(Device.objects.get(pk=model_instance.pk))
-        elif modelname == "interface":
-            _tag_object(Interface.objects.get(pk=model_instance.pk))
-        elif modelname == "location":
-            if model_instance.pk is not None:
-                _tag_object(Location.objects.get(pk=model_instance.pk))
-        elif modelname == "product_model":
-            _tag_object(DeviceType.objects.get(pk=model_instance.pk))
+                if local_instance.pk is not None and target.get_or_none(modelname, local_instance.get_unique_id()):
+                    pks.append(local_instance.pk)
+            bulk_tag_objects(model_class, pks, tag=tag, custom_field_values={custom_field.key: today})
@@ -25,7 +25,8 @@ class NautobotDiffSyncAdapter(NautobotAdapter):
     def _load_objects(self, diffsync_model):
         """Given a diffsync model class, load a list of models from the database and return them. Passing in job kwargs for model filtering."""
         parameter_names = self._get_parameter_names(diffsync_model)
-        for database_object in diffsync_model._get_queryset(data=self.job.kwargs):  # pylint: disable=W0212
+        queryset = diffsync_model._get_queryset(data=self.job.kwargs)  # pylint: disable=W0212
+        for database_object in self._optimize_queryset(diffsync_model, queryset):
             self._load_single_object(database_object, diffsync_model, parameter_names)
 
     location = LocationModel
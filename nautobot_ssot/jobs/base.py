@@ -1,8 +1,10 @@
 """Base Job classes for sync workers."""
 
+import threading
 import tracemalloc
 from collections import namedtuple
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from typing import Iterable, Optional
 
 import structlog
@@ -10,14 +12,19 @@ import structlog
 # pylint-django doesn't understand classproperty, and complains unnecessarily. We disable this specific warning:
 # pylint: disable=no-self-argument
 from diffsync.enum import DiffSyncFlags
+from django.core.exceptions import ValidationError
+from django.db import connections, transaction
 from django.db.utils import OperationalError
 from django.templatetags.static import static
 from django.utils import timezone
 from django.utils.functional import classproperty
-from nautobot.extras.jobs import BooleanVar, DryRunVar, Job
+from django.utils.module_loading import import_string
+from nautobot.extras.choices import JobResultStatusChoices
+from nautobot.extras.jobs import BooleanVar, DryRunVar, Job, StringVar
 
-from nautobot_ssot.choices import SyncLogEntryActionChoices
-from nautobot_ssot.models import BaseModel, Sync, SyncLogEntry
+from nautobot_ssot.choices import SyncAdapterSnapshotSideChoices, SyncLogEntryActionChoices
+from nautobot_ssot.models import BaseModel, Sync, SyncAdapterSnapshot, SyncDiffChunk, SyncLogEntry
+from nautobot_ssot.snapshots import dump_adapter, get_snapshot_adapter_class, restore_adapter
 
 DataMapping = namedtuple("DataMapping", ["source_name", "source_url", "target_name", "target_url"])
 """Entry in the list returned by a job's data_mappings() API.
@@ -33,6 +40,50 @@ and the other system acting as data source/target.
 """
 
 
+class SyncLogEntryBuffer:
+    """Collect SyncLogEntry records in memory and write them to the database in batches.
+
+    Writing a row per DiffSync log event quickly dominates the runtime of large syncs, so entries are
+    queued here and persisted with `bulk_create` whenever `batch_size` entries are pending, or when
+    `flush()` is called explicitly (at each phase boundary of the sync and when the job ends).
+    """
+
+    def __init__(self, sync: Sync, batch_size: int = 1000):
+        """Initialize the buffer for the given Sync record."""
+        self.sync = sync
+        self.batch_size = batch_size
+        self.entries = []
+        self.flush_count = 0
+        self.flush_time = timedelta()
+        self.total_written = 0
+        # Entries may be added from a worker thread when the adapters are loaded in parallel.
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        """Number of entries pending a flush."""
+        return len(self.entries)
+
+    def add(self, entry: SyncLogEntry):
+        """Queue a (not yet saved) SyncLogEntry, flushing the buffer if it is full."""
+        entry.sync = self.sync
+        with self._lock:
+            self.entries.append(entry)
+            if len(self.entries) >= self.batch_size:
+                self.flush()
+
+    def flush(self):
+        """Write all pending entries to the database."""
+        with self._lock:
+            if not self.entries:
+                return
+            entries, self.entries = self.entries, []
+            start_time = datetime.now()
+            SyncLogEntry.objects.bulk_create(entries, batch_size=self.batch_size)
+            self.flush_time += datetime.now() - start_time
+            self.flush_count += 1
+            self.total_written += len(entries)
+
+
 class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
     """Common base class for data synchronization jobs.
 
@@ -50,6 +101,17 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         default=True,
     )
     memory_profiling = BooleanVar(description="Perform a memory profiling analysis.", default=False)
+    save_snapshots = BooleanVar(
+        description="Store a snapshot of the loaded source and target data on the data sync.", default=False
+    )
+    source_snapshot = StringVar(
+        required=False,
+        description="ID of an earlier data sync to load the source data from its snapshot, implies a dry-run.",
+    )
+    target_snapshot = StringVar(
+        required=False,
+        description="ID of an earlier data sync to load the target data from its snapshot, implies a dry-run.",
+    )
 
     def load_source_adapter(self):
         """Method to instantiate and load the SOURCE adapter into `self.source_adapter`.
@@ -79,16 +141,43 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
             self.sync.diff = {}
             self.sync.summary = self.diff.summary()
             self.sync.save()
-            try:
-                self.sync.diff = self.diff.dict()
-                self.sync.save()
-            except OperationalError:
-                self.logger.warning("Unable to save JSON diff to the database; likely the diff is too large.")
-                self.sync.refresh_from_db()
+            self.save_diff(self.diff)
             self.logger.info(self.diff.summary())
         else:
             self.logger.warning("Not both adapters were properly initialized prior to diff calculation.")
 
+    def save_diff(self, diff):
+        """Store a diff on `self.sync` as SyncDiffChunk records.
+
+        Rather than building the dictionary representation of the whole diff at once, the diff elements are converted
+        and written one chunk of at most `self.diff_chunk_size` elements at a time, which keeps memory usage bounded.
+        """
+        chunk = None
+        chunk_count = 0
+        for element in diff.get_children():
+            if not element.has_diffs(include_children=True):
+                continue
+            if chunk is None or chunk.model_type != element.type or chunk.element_count >= self.diff_chunk_size:
+                if chunk is not None:
+                    self._save_diff_chunk(chunk)
+                chunk = SyncDiffChunk(sync=self.sync, index=chunk_count, model_type=element.type, diff={})
+                chunk_count += 1
+            chunk.diff[element.name] = element.dict()
+            chunk.element_count += 1
+        if chunk is not None:
+            self._save_diff_chunk(chunk)
+
+    def _save_diff_chunk(self, chunk):
+        try:
+            with transaction.atomic():
+                chunk.save()
+        except OperationalError:
+            self.logger.warning(
+                "Unable to save chunk %s of the JSON diff (%s) to the database; likely the chunk is too large.",
+                chunk.index,
+                chunk.model_type,
+            )
+
     def execute_sync(self):
         """Method to synchronize the difference from `self.diff`, from SOURCE to TARGET adapter.
 
@@ -154,36 +243,62 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
 
         start_time = datetime.now()
 
-        self.logger.info("Loading current data from source adapter...")
-        self.load_source_adapter()
-        load_source_adapter_time = datetime.now()
-        self.sync.source_load_time = load_source_adapter_time - start_time
-        self.sync.save()
-        self.logger.info(
-            "Source Load Time from %s: %s",
-            self.source_adapter,
-            self.sync.source_load_time,
-        )
-        if memory_profiling:
-            record_memory_trace("source_load")
+        if self.parallel_loading and memory_profiling:
+            # tracemalloc traces the whole process, so memory usage can only be attributed to each adapter if they are
+            # loaded one after the other.
+            self.logger.warning("Memory profiling is enabled, loading the source and target adapters sequentially.")
+        if self.parallel_loading and not memory_profiling:
+            self.load_adapters_in_parallel()
+            self.flush_sync_log()
+            load_target_adapter_time = datetime.now()
+            self.logger.info(
+                "Source Load Time from %s: %s",
+                self.source_adapter,
+                self.sync.source_load_time,
+            )
+            self.logger.info(
+                "Target Load Time from %s: %s",
+                self.target_adapter,
+                self.sync.target_load_time,
+            )
+            self.logger.info("Parallel Load Time: %s", load_target_adapter_time - start_time)
+        else:
+            self.logger.info("Loading current data from source adapter...")
+            self._load_source_adapter()
+            self.flush_sync_log()
+            load_source_adapter_time = datetime.now()
+            self.sync.source_load_time = load_source_adapter_time - start_time
+            self.sync.save()
+            self.logger.info(
+                "Source Load Time from %s: %s",
+                self.source_adapter,
+                self.sync.source_load_time,
+            )
+            if memory_profiling:
+                record_memory_trace("source_load")
 
-        self.logger.info("Loading current data from target adapter...")
-        self.load_target_adapter()
-        load_target_adapter_time = datetime.now()
-        self.sync.target_load_time = load_target_adapter_time - load_source_adapter_time
-        self.sync.save()
-        self.logger.info(
-            "Target Load Time from %s: %s",
-            self.target_adapter,
-            self.sync.target_load_time,
-        )
-        if memory_profiling:
-            record_memory_trace("target_load")
+            self.logger.info("Loading current data from target adapter...")
+            self._load_target_adapter()
+            self.flush_sync_log()
+            load_target_adapter_time = datetime.now()
+            self.sync.target_load_time = load_target_adapter_time - load_source_adapter_time
+            self.sync.save()
+            self.logger.info(
+                "Target Load Time from %s: %s",
+                self.target_adapter,
+                self.sync.target_load_time,
+            )
+            if memory_profiling:
+                record_memory_trace("target_load")
+
+        self.save_adapter_snapshots()
 
         self.logger.info("Calculating diffs...")
+        calculate_diff_start_time = datetime.now()
         self.calculate_diff()
+        self.flush_sync_log()
         calculate_diff_time = datetime.now()
-        self.sync.diff_time = calculate_diff_time - load_target_adapter_time
+        self.sync.diff_time = calculate_diff_time - calculate_diff_start_time
         self.sync.save()
         self.logger.info("Diff Calculation Time: %s", self.sync.diff_time)
         if memory_profiling:
@@ -194,6 +309,7 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         else:
             self.logger.info("Syncing from %s to %s...", self.source_adapter, self.target_adapter)
             self.execute_sync()
+            self.flush_sync_log()
             execute_sync_time = datetime.now()
             self.sync.sync_time = execute_sync_time - calculate_diff_time
             self.sync.save()
@@ -202,6 +318,130 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
             if memory_profiling:
                 record_memory_trace("sync")
 
+    def load_adapters_in_parallel(self):
+        """Load the source and target adapters at the same time, recording the load time of each on `self.sync`.
+
+        The adapter for the remote system is loaded in a worker thread, with its own database connection(s) that are
+        closed once it is done, while the Nautobot adapter is loaded on the main thread. For a sync between two
+        systems other than Nautobot, the source adapter is loaded in the worker thread.
+        """
+
+        def timed_load(load):
+            start_time = datetime.now()
+            load()
+            return datetime.now() - start_time
+
+        def timed_load_in_worker(load):
+            try:
+                return timed_load(load)
+            finally:
+                connections.close_all()
+
+        source_is_local = self.data_source == "Nautobot"
+        local_load = self._load_source_adapter if source_is_local else self._load_target_adapter
+        remote_load = self._load_target_adapter if source_is_local else self._load_source_adapter
+
+        self.logger.info("Loading current data from source and target adapters in parallel...")
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="ssot-load") as executor:
+            remote_future = executor.submit(timed_load_in_worker, remote_load)
+            local_load_time = timed_load(local_load)
+            remote_load_time = remote_future.result()
+
+        if source_is_local:
+            self.sync.source_load_time, self.sync.target_load_time = local_load_time, remote_load_time
+        else:
+            self.sync.source_load_time, self.sync.target_load_time = remote_load_time, local_load_time
+        self.sync.save()
+
+    def get_incremental_snapshot(self, adapter) -> Optional[SyncAdapterSnapshot]:
+        """Return the most recent snapshot of the given adapter from a successful Sync of this job.
+
+        Adapters that support incremental loading call this from their `load()` method. If it returns a snapshot, they
+        only load the objects that changed since `snapshot.watermark` and restore all others from `snapshot.data`,
+        using `nautobot_ssot.snapshots.restore_adapter`. Returns `None` unless `self.incremental` is set.
+        """
+        if not self.incremental:
+            return None
+        snapshot = (
+            SyncAdapterSnapshot.objects.filter(
+                sync__source=self.sync.source,
+                sync__target=self.sync.target,
+                sync__job_result__job_model=self.job_result.job_model,
+                sync__job_result__status=JobResultStatusChoices.STATUS_SUCCESS,
+                adapter=self._get_adapter_path(adapter),
+            )
+            .exclude(sync=self.sync)
+            .order_by("-sync__start_time")
+            .first()
+        )
+        if snapshot is None:
+            self.logger.info("No snapshot of %s found, performing a full load.", adapter)
+        else:
+            self.logger.info("Loading changes to %s since %s.", adapter, snapshot.watermark)
+        return snapshot
+
+    @staticmethod
+    def _get_adapter_path(adapter):
+        return f"{type(adapter).__module__}.{type(adapter).__qualname__}"
+
+    def save_adapter_snapshots(self):
+        """Store a snapshot of the loaded adapters on `self.sync`, as a SyncAdapterSnapshot per adapter.
+
+        Snapshots of both adapters are stored if `self.save_snapshots` is set. Otherwise, if `self.incremental` is set,
+        snapshots are stored of the adapters that support incremental loading, by setting `incremental_load = True`.
+        The watermark of a snapshot is the start time of the sync, unless the adapter provides its own through a
+        `get_incremental_watermark()` method, i.e. based on the change timestamps of the remote system.
+        """
+        for side, adapter, loaded_from_snapshot in (
+            (SyncAdapterSnapshotSideChoices.SIDE_SOURCE, self.source_adapter, self.source_snapshot),
+            (SyncAdapterSnapshotSideChoices.SIDE_TARGET, self.target_adapter, self.target_snapshot),
+        ):
+            if adapter is None or loaded_from_snapshot is not None:
+                continue
+            if not self.save_snapshots and not (self.incremental and getattr(adapter, "incremental_load", False)):
+                continue
+            if hasattr(adapter, "get_incremental_watermark"):
+                watermark = adapter.get_incremental_watermark()
+            else:
+                watermark = self.sync.start_time
+            snapshot = SyncAdapterSnapshot(
+                sync=self.sync, side=side, adapter=self._get_adapter_path(adapter), watermark=watermark
+            )
+            snapshot.write(dump_adapter(adapter))
+            self.logger.info("Stored a snapshot of %s %s objects from %s.", snapshot.object_count, side, adapter)
+
+    def get_snapshot(self, sync_id, side) -> Optional[SyncAdapterSnapshot]:
+        """Return the snapshot of the given side of an earlier data sync, as selected through the job options."""
+        if not sync_id:
+            return None
+        try:
+            return SyncAdapterSnapshot.objects.select_related("sync").get(sync__pk=sync_id, side=side)
+        except (SyncAdapterSnapshot.DoesNotExist, ValidationError) as error:
+            raise ValueError(f"Data sync {sync_id} has no {side} snapshot.") from error
+
+    def load_adapter_from_snapshot(self, snapshot: SyncAdapterSnapshot):
+        """Return an adapter holding the objects of a snapshot.
+
+        The adapter has the same name and models as the adapter the snapshot was taken from, but isn't connected to
+        any system, so it can be diffed against but not synced to.
+        """
+        adapter = get_snapshot_adapter_class(import_string(snapshot.adapter))()
+        restore_adapter(adapter, snapshot.data)
+        self.logger.info("Loaded %s objects from %s.", snapshot.object_count, snapshot)
+        return adapter
+
+    def _load_source_adapter(self):
+        if self.source_snapshot is None:
+            self.load_source_adapter()
+        else:
+            self.source_adapter = self.load_adapter_from_snapshot(self.source_snapshot)
+
+    def _load_target_adapter(self):
+        if self.target_snapshot is None:
+            self.load_target_adapter()
+        else:
+            self.target_adapter = self.load_adapter_from_snapshot(self.target_snapshot)
+
     def lookup_object(  # pylint: disable=unused-argument
         self,
         model_name,
@@ -243,11 +483,15 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         synced_object=None,
         object_repr="",
     ):
-        """Log a action message as a SyncLogEntry."""
+        """Log a action message as a SyncLogEntry.
+
+        While the job is running, entries are queued in `self.sync_log_buffer` and written in batches;
+        outside of a job run they are saved immediately.
+        """
         if synced_object and not object_repr:
             object_repr = repr(synced_object)
 
-        SyncLogEntry.objects.create(
+        entry = SyncLogEntry(
             sync=self.sync,
             action=action,
             status=status,
@@ -256,6 +500,39 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
             synced_object=synced_object,
             object_repr=object_repr,
         )
+        if self.sync_log_buffer is not None:
+            self.sync_log_buffer.add(entry)
+        else:
+            entry.save()
+
+    def flush_sync_log(self):
+        """Write any SyncLogEntry records still pending in `self.sync_log_buffer` to the database."""
+        if self.sync_log_buffer is not None:
+            self.sync_log_buffer.flush()
+
+    def record_orm_cache_statistics(self):
+        """Record the ORM cache statistics of the source and target adapters on the Sync, if they provide any.
+
+        Adapters provide these through a `get_orm_cache_statistics()` method, as `contrib.NautobotAdapter` does.
+        """
+        statistics = {}
+        for adapter in (self.source_adapter, self.target_adapter):
+            if not hasattr(adapter, "get_orm_cache_statistics"):
+                continue
+            for model_label, counters in adapter.get_orm_cache_statistics().items():
+                model_statistics = statistics.setdefault(model_label, dict.fromkeys(counters, 0))
+                for counter, value in counters.items():
+                    model_statistics[counter] = model_statistics.get(counter, 0) + value
+        if not statistics:
+            return
+        self.sync.orm_cache_statistics = statistics
+        self.sync.save()
+        self.logger.info(
+            "ORM cache: %s hits, %s misses, %s evictions",
+            sum(counters["hits"] for counters in statistics.values()),
+            sum(counters["misses"] for counters in statistics.values()),
+            sum(counters["evictions"] for counters in statistics.values()),
+        )
 
     def _structlog_to_sync_log_entry(self, _logger, _log_method, event_dict):
         """Capture certain structlog messages from DiffSync into the Nautobot database."""
@@ -289,6 +566,10 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
 
         if hasattr(cls, "memory_profiling"):
             got_vars["memory_profiling"] = cls.memory_profiling
+
+        for name in ("save_snapshots", "source_snapshot", "target_snapshot"):
+            if hasattr(cls, name):
+                got_vars[name] = getattr(cls, name)
         return got_vars
 
     def __init__(self):
@@ -300,6 +581,20 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         self.target_adapter = None
         # Default diffsync flags. You can overwrite them at any time.
         self.diffsync_flags = DiffSyncFlags.CONTINUE_ON_FAILURE | DiffSyncFlags.LOG_UNCHANGED_RECORDS
+        # Number of SyncLogEntry records written per bulk insert. You can overwrite it at any time before `run()`.
+        self.sync_log_batch_size = 1000
+        # Maximum number of top-level diff elements stored per SyncDiffChunk record.
+        self.diff_chunk_size = 500
+        # Load the source and target adapters at the same time, see `load_adapters_in_parallel()`.
+        self.parallel_loading = False
+        # Only load the records that changed since the last successful sync, from adapters that support this. See
+        # `get_incremental_snapshot()`.
+        self.incremental = False
+        # Store snapshots of both adapters, and load the adapters from the snapshots of an earlier sync instead.
+        self.save_snapshots = False
+        self.source_snapshot = None
+        self.target_snapshot = None
+        self.sync_log_buffer = None
 
     @classmethod
     def as_form(cls, data=None, files=None, initial=None, approval_view=False):
@@ -329,8 +624,24 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
         """Icon corresponding to the data_target."""
         return getattr(cls.Meta, "data_target_icon", None)
 
-    def run(self, dryrun, memory_profiling, *args, **kwargs):  # pylint:disable=arguments-differ
+    def run(  # pylint:disable=arguments-differ
+        self,
+        dryrun,
+        memory_profiling,
+        *args,
+        save_snapshots=False,
+        source_snapshot=None,
+        target_snapshot=None,
+        **kwargs,
+    ):
         """Job entry point from Nautobot - do not override!"""
+        self.save_snapshots = self.save_snapshots or save_snapshots
+        self.source_snapshot = self.get_snapshot(source_snapshot, SyncAdapterSnapshotSideChoices.SIDE_SOURCE)
+        self.target_snapshot = self.get_snapshot(target_snapshot, SyncAdapterSnapshotSideChoices.SIDE_TARGET)
+        if (self.source_snapshot or self.target_snapshot) and not dryrun:
+            self.logger.warning("Data is loaded from a snapshot, performing a dry-run.")
+            dryrun = True
+
         self.sync = Sync.objects.create(
             source=self.data_source,
             target=self.data_target,
@@ -351,7 +662,19 @@ class DataSyncBaseJob(Job):  # pylint: disable=too-many-instance-attributes
             wrapper_class=structlog.stdlib.BoundLogger,
             cache_logger_on_first_use=True,
         )
-        self.sync_data(memory_profiling)
+        self.sync_log_buffer = SyncLogEntryBuffer(self.sync, batch_size=self.sync_log_batch_size)
+        try:
+            self.sync_data(memory_profiling)
+        finally:
+            self.flush_sync_log()
+            self.record_orm_cache_statistics()
+            self.logger.info(
+                "Sync log: %s entries written in %s batches, flush time %s",
+                self.sync_log_buffer.total_written,
+                self.sync_log_buffer.flush_count,
+                self.sync_log_buffer.flush_time,
+            )
+            self.sync_log_buffer = None
 
 
 # pylint: disable=abstract-method
@@ -0,0 +1,419 @@
+"""Django management command to benchmark the contrib NautobotAdapter/NautobotModel with synthetic data."""
+
+import json
+import logging
+import random
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from importlib.metadata import version
+from ipaddress import IPv4Address
+from typing import List, Optional
+
+import structlog
+from django.contrib.contenttypes.models import ContentType
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from nautobot.dcim.models import Device, DeviceType, Interface, Location, LocationType, Manufacturer
+from nautobot.extras.choices import RelationshipTypeChoices
+from nautobot.extras.models import Relationship, RelationshipAssociation, Role, Status, Tag
+from nautobot.ipam.models import IPAddress, IPAddressToInterface, Namespace, Prefix
+from nautobot.tenancy.models import Tenant
+from typing_extensions import Annotated, TypedDict
+
+from nautobot_ssot.contrib import CustomRelationshipAnnotation, NautobotAdapter, NautobotModel, RelationshipSideEnum
+from nautobot_ssot.snapshots import dump_adapter, get_snapshot_adapter_class, restore_adapter
+
+OWNER_RELATIONSHIP = "Benchmark Device Owner"
+SCENARIOS = ("load", "diff", "sync")
+MIXES = ("create", "update", "delete", "mixed")
+
+
+class BenchmarkLocation(NautobotModel):
+    """Location model for benchmarking."""
+
+    _model = Location
+    _modelname = "location"
+    _identifiers = ("name",)
+    _attributes = ("location_type__name", "status__name", "description")
+
+    name: str
+    location_type__name: str
+    status__name: str
+    description: str = ""
+
+
+class BenchmarkIPAddress(NautobotModel):
+    """IP address model for benchmarking."""
+
+    _model = IPAddress
+    _modelname = "ip_address"
+    _identifiers = ("host", "mask_length")
+    _attributes = ("status__name", "parent__network", "parent__prefix_length", "description")
+
+    host: str
+    mask_length: int
+    status__name: str
+    parent__network: str
+    parent__prefix_length: int
+    description: str = ""
+
+
+class IPAddressDict(TypedDict):
+    """IP address assigned to an interface."""
+
+    host: str
+    mask_length: int
+
+
+class BenchmarkInterface(NautobotModel):
+    """Interface model for benchmarking."""
+
+    _model = Interface
+    _modelname = "interface"
+    _identifiers = ("device__name", "name")
+    _attributes = ("type", "status__name", "description", "ip_addresses")
+
+    device__name: str
+    name: str
+    type: str
+    status__name: str
+    description: str = ""
+    ip_addresses: List[IPAddressDict] = []
+
+
+class TagDict(TypedDict):
+    """Tag assigned to a device."""
+
+    name: str
+
+
+class BenchmarkDevice(NautobotModel):
+    """Device model for benchmarking."""
+
+    _model = Device
+    _modelname = "device"
+    _identifiers = ("name",)
+    _attributes = (
+        "location__name",
+        "device_type__model",
+        "role__name",
+        "status__name",
+        "serial",
+        "tags",
+        "owner__name",
+    )
+    _children = {"interface": "interfaces"}
+
+    name: str
+    location__name: str
+    device_type__model: str
+    role__name: str
+    status__name: str
+    serial: str = ""
+    tags: List[TagDict] = []
+    owner__name: Annotated[
+        Optional[str], CustomRelationshipAnnotation(name=OWNER_RELATIONSHIP, side=RelationshipSideEnum.DESTINATION)
+    ] = None
+    interfaces: List[BenchmarkInterface] = []
+
+
+class BenchmarkAdapter(NautobotAdapter):
+    """Adapter for benchmarking."""
+
+    top_level = ("location", "ip_address", "device")
+    location = BenchmarkLocation
+    ip_address = BenchmarkIPAddress
+    device = BenchmarkDevice
+    interface = BenchmarkInterface
+
+
+class BatchedBenchmarkAdapter(BenchmarkAdapter):
+    """Adapter for benchmarking with batched writes."""
+
+    batched_writes = True
+
+
+class _BenchmarkJob:  # pylint: disable=too-few-public-methods
+    """Stand-in for the job the adapters log to."""
+
+    class _Logger:
+        def __getattr__(self, name):
+            return lambda *args, **kwargs: None
+
+    logger = _Logger()
+
+
+@contextmanager
+def measure(track_memory=True):
+    """Measure the wall time, number of database queries and (optionally) peak memory of the enclosed block."""
+    result = {}
+    queries = 0
+
+    def count_queries(execute, sql, params, many, context):
+        nonlocal queries
+        queries += 1
+        return execute(sql, params, many, context)
+
+    if track_memory:
+        tracemalloc.start()
+    start_time = time.perf_counter()
+    try:
+        with connection.execute_wrapper(count_queries):
+            yield result
+    finally:
+        result["duration_seconds"] = round(time.perf_counter() - start_time, 4)
+        result["queries"] = queries
+        if track_memory:
+            result["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+
+def generate_dataset(scale):  # pylint: disable=too-many-locals
+    """Create a synthetic dataset of `scale` interfaces and IP addresses, along with their devices and locations.
+
+    There is a device per 10 interfaces and a location per 10 devices. Every device is tagged and related to a tenant
+    through a custom relationship. Objects are created with `bulk_create` to keep the setup fast.
+    """
+    status = Status.objects.get(name="Active")
+    device_content_type = ContentType.objects.get_for_model(Device)
+    location_type, _ = LocationType.objects.get_or_create(name="Benchmark Location Type")
+    location_type.content_types.add(device_content_type)
+    manufacturer, _ = Manufacturer.objects.get_or_create(name="Benchmark Manufacturer")
+    device_type, _ = DeviceType.objects.get_or_create(model="Benchmark Device Type", manufacturer=manufacturer)
+    role, _ = Role.objects.get_or_create(name="Benchmark Role")
+    role.content_types.add(device_content_type)
+    namespace = Namespace.objects.get(name="Global")
+    prefix, _ = Prefix.objects.get_or_create(network="10.0.0.0", prefix_length=8, namespace=namespace, status=status)
+    tags = Tag.objects.bulk_create([Tag(name=f"Benchmark Tag {i}") for i in range(10)])
+    for tag in tags:
+        tag.content_types.add(device_content_type)
+    relationship, _ = Relationship.objects.get_or_create(
+        label=OWNER_RELATIONSHIP,
+        defaults={
+            "key": "benchmark_device_owner",
+            "type": RelationshipTypeChoices.TYPE_ONE_TO_MANY,
+            "source_type": ContentType.objects.get_for_model(Tenant),
+            "destination_type": device_content_type,
+        },
+    )
+
+    device_count = max(1, scale // 10)
+    location_count = max(1, device_count // 10)
+    tenants = Tenant.objects.bulk_create([Tenant(name=f"Benchmark Tenant {i}") for i in range(location_count)])
+    locations = Location.objects.bulk_create(
+        [
+            Location(name=f"Benchmark Location {i}", location_type=location_type, status=status)
+            for i in range(location_count)
+        ]
+    )
+    devices = Device.objects.bulk_create(
+        [
+            Device(
+                name=f"benchmark-device-{i}",
+                location=locations[i % location_count],
+                device_type=device_type,
+                role=role,
+                status=status,
+                serial=f"SN{i:08}",
+            )
+            for i in range(device_count)
+        ]
+    )
+    Device.tags.through.objects.bulk_create(
+        [
+            Device.tags.through(content_object=device, tag=tags[(i + j) % len(tags)])
+            for i, device in enumerate(devices)
+            for j in range(2)
+        ]
+    )
+    RelationshipAssociation.objects.bulk_create(
+        [
+            RelationshipAssociation(
+                relationship=relationship,
+                source=tenants[i % location_count],
+                destination=device,
+            )
+            for i, device in enumerate(devices)
+        ]
+    )
+    interfaces = Interface.objects.bulk_create(
+        [
+            Interface(device=devices[i // 10], name=f"eth{i % 10}", type="1000base-t", status=status)
+            for i in range(scale)
+        ]
+    )
+    first_host = IPv4Address("10.0.0.1")
+    ip_addresses = IPAddress.objects.bulk_create(
+        [IPAddress(address=f"{first_host + i}/8", parent=prefix, status=status) for i in range(scale)]
+    )
+    IPAddressToInterface.objects.bulk_create(
+        [
+            IPAddressToInterface(ip_address=ip_address, interface=interface)
+            for ip_address, interface in zip(ip_addresses, interfaces)
+        ]
+    )
+
+
+def mutate_dataset(data, mix, ratio, seed=0):
+    """Apply a mix of creates, updates and deletes to a snapshot of the dataset, in place.
+
+    :param data: The dataset as returned by `dump_adapter`.
+    :param mix: One of "create", "update", "delete" or "mixed".
+    :param ratio: The share of interfaces (and IP addresses) to change.
+    :return: The number of changed objects.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    interfaces = data["interface"]
+    count = max(1, int(len(interfaces) * ratio))
+    if mix == "mixed":
+        counts = {"create": count // 3, "update": count // 3, "delete": count - 2 * (count // 3)}
+    else:
+        counts = {mix: count}
+    changed = 0
+
+    for unique_id in rng.sample(sorted(interfaces), counts.get("update", 0)):
+        interfaces[unique_id]["description"] = "Updated by benchmark"
+        changed += 1
+    for unique_id in rng.sample(sorted(interfaces), counts.get("delete", 0)):
+        del interfaces[unique_id]
+        changed += 1
+    device_names = sorted(data["device"])
+    first_host = IPv4Address("10.128.0.1")
+    for i in range(counts.get("create", 0)):
+        device_name = device_names[i % len(device_names)]
+        interface = {
+            "device__name": device_name,
+            "name": f"new{i}",
+            "type": "1000base-t",
+            "status__name": "Active",
+            "ip_addresses": [{"host": str(first_host + i), "mask_length": 8}],
+        }
+        interfaces[BenchmarkInterface.create_unique_id(**interface)] = interface
+        data["device"][device_name].setdefault("interfaces", []).append(
+            BenchmarkInterface.create_unique_id(**interface)
+        )
+        ip_address = {
+            "host": str(first_host + i),
+            "mask_length": 8,
+            "status__name": "Active",
+            "parent__network": "10.0.0.0",
+            "parent__prefix_length": 8,
+        }
+        data["ip_address"][BenchmarkIPAddress.create_unique_id(**ip_address)] = ip_address
+        changed += 2
+    return changed
+
+
+class Command(BaseCommand):
+    """Benchmark loading, diffing and syncing through the contrib NautobotAdapter on synthetic datasets."""
+
+    help = (
+        "Benchmark the contrib NautobotAdapter/NautobotModel on synthetic datasets, reporting the duration, number of "
+        "queries and peak memory of each step as JSON. The datasets are created in a transaction that is rolled back "
+        "afterwards, but the command should nevertheless not be run against a production database."
+    )
+
+    def add_arguments(self, parser):  # noqa: D102
+        parser.add_argument(
+            "--scale",
+            nargs="+",
+            type=int,
+            default=[1000, 10000],
+            help="Number of interfaces and IP addresses per dataset (default: 1000 10000).",
+        )
+        parser.add_argument(
+            "--scenario",
+            nargs="+",
+            choices=SCENARIOS,
+            default=list(SCENARIOS),
+            help="Steps to benchmark (default: all).",
+        )
+        parser.add_argument(
+            "--mix",
+            nargs="+",
+            choices=MIXES,
+            default=list(MIXES),
+            help="Kinds of changes to diff and sync (default: all).",
+        )
+        parser.add_argument(
+            "--change-ratio",
+            type=float,
+            default=0.1,
+            help="Share of the interfaces to change for the diff and sync steps (default: 0.1).",
+        )
+        parser.add_argument("--batched-writes", action="store_true", help="Sync with batched writes enabled.")
+        parser.add_argument(
+            "--no-memory",
+            action="store_true",
+            help="Don't trace peak memory usage, which otherwise slows down all steps considerably.",
+        )
+        parser.add_argument("--output", default=None, help="File to write the JSON results to (default: stdout).")
+
+    def handle(self, *args, **options):  # noqa: D102
+        # DiffSync logs every created, updated and deleted object, which would distort the timings.
+        structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.WARNING))
+        results = []
+        for scale in options["scale"]:
+            with transaction.atomic():
+                start_time = time.perf_counter()
+                generate_dataset(scale)
+                self.stderr.write(f"Generated dataset of scale {scale} in {time.perf_counter() - start_time:.1f}s")
+                results.extend(self._benchmark(scale, options))
+                transaction.set_rollback(True)
+
+        report = {
+            "nautobot_ssot_version": version("nautobot-ssot"),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "options": {key: options[key] for key in ("change_ratio", "batched_writes", "no_memory")},
+            "results": results,
+        }
+        output = json.dumps(report, indent=2)
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8") as file:
+                file.write(output)
+        else:
+            self.stdout.write(output)
+
+    def _load(self, adapter_class, track_memory):
+        adapter = adapter_class(job=_BenchmarkJob())
+        with measure(track_memory) as result:
+            adapter.load()
+        result["objects"] = adapter.count()
+        return adapter, result
+
+    def _benchmark(self, scale, options):
+        track_memory = not options["no_memory"]
+        adapter_class = BatchedBenchmarkAdapter if options["batched_writes"] else BenchmarkAdapter
+        target, result = self._load(adapter_class, track_memory)
+        data = dump_adapter(target)
+        if "load" in options["scenario"]:
+            yield {"scale": scale, "step": "load", **result}
+            self.stderr.write(f"[{scale}] load: {result}")
+
+        for mix in options["mix"]:
+            if not {"diff", "sync"}.intersection(options["scenario"]):
+                break
+            source_data = json.loads(json.dumps(data, default=str))
+            changed = mutate_dataset(source_data, mix, options["change_ratio"])
+            source = get_snapshot_adapter_class(BenchmarkAdapter)()
+            restore_adapter(source, source_data)
+
+            with transaction.atomic():
+                target, _ = self._load(adapter_class, track_memory=False)
+                with measure(track_memory) as result:
+                    diff = source.diff_to(target)
+                result.update(objects=changed, summary=diff.summary())
+                if "diff" in options["scenario"]:
+                    yield {"scale": scale, "step": "diff", "mix": mix, **result}
+                    self.stderr.write(f"[{scale}] diff ({mix}): {result}")
+
+                if "sync" in options["scenario"]:
+                    with measure(track_memory) as result:
+                        source.sync_to(target, diff=diff)
+                    result.update(objects=changed)
+                    yield {"scale": scale, "step": "sync", "mix": mix, **result}
+                    self.stderr.write(f"[{scale}] sync ({mix}): {result}")
+                # Undo the sync, so that every mix starts from the same dataset.
+                transaction.set_rollback(True)
@@ -0,0 +1,19 @@
+# Generated by Django 4.2.16 on 2026-10-17 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0011_alter_sync_job_result"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sync",
+            name="orm_cache_statistics",
+            field=models.JSONField(
+                blank=True, help_text="ORM cache hits, misses and evictions per model class", null=True
+            ),
+        ),
+    ]
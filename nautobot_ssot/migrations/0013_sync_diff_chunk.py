@@ -0,0 +1,45 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:36
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+import nautobot_ssot.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0012_sync_orm_cache_statistics"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SyncDiffChunk",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("index", models.PositiveIntegerField()),
+                ("model_type", models.CharField(max_length=255)),
+                ("element_count", models.PositiveIntegerField(default=0)),
+                ("diff", models.JSONField(blank=True, encoder=nautobot_ssot.models.DiffJSONEncoder)),
+                (
+                    "sync",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="diff_chunks",
+                        related_query_name="diff_chunk",
+                        to="nautobot_ssot.sync",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["sync", "index"],
+                "unique_together": {("sync", "index")},
+            },
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 4.2.30 on 2026-10-17 06:47
+
+import uuid
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0013_sync_diff_chunk"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SyncAdapterSnapshot",
+            fields=[
+                (
+                    "id",
+                    models.UUIDField(
+                        default=uuid.uuid4, editable=False, primary_key=True, serialize=False, unique=True
+                    ),
+                ),
+                ("side", models.CharField(max_length=6)),
+                ("adapter", models.CharField(help_text="Import path of the adapter class", max_length=255)),
+                ("watermark", models.DateTimeField()),
+                ("object_count", models.PositiveIntegerField(default=0)),
+                ("file", models.FileField(upload_to="nautobot_ssot/snapshots/")),
+                (
+                    "sync",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="adapter_snapshots",
+                        related_query_name="adapter_snapshot",
+                        to="nautobot_ssot.sync",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ["sync", "side"],
+                "unique_together": {("sync", "side")},
+            },
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 4.2.30 on 2026-10-17 07:08
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0014_sync_adapter_snapshot"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ssotinfobloxconfig",
+            name="max_concurrent_requests",
+            field=models.PositiveSmallIntegerField(
+                default=1,
+                validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(32)],
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 4.2.30 on 2026-10-17 07:19
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0015_ssotinfobloxconfig_max_concurrent_requests"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ssotinfobloxconfig",
+            name="write_batch_size",
+            field=models.PositiveSmallIntegerField(
+                default=0, validators=[django.core.validators.MaxValueValidator(1000)]
+            ),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.30 on 2026-10-17 07:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("nautobot_ssot", "0016_ssotinfobloxconfig_write_batch_size"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="ssotinfobloxconfig",
+            name="cache_timeout",
+            field=models.PositiveIntegerField(default=0),
+        ),
+    ]
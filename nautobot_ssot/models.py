@@ -15,17 +15,24 @@ The interaction between these models and Nautobot's native JobResult model deser
     which have a different set of content requirements, but is used for high-level status reporting.
 
 JobResult 1<->1 Sync 1-->n SyncLogEntry
+                   Sync 1-->n SyncDiffChunk
+                   Sync 1-->n SyncAdapterSnapshot
 """
 
 from datetime import timedelta
+from io import BytesIO
 
 from django.conf import settings
 from django.contrib.contenttypes.fields import GenericForeignKey
 from django.contrib.contenttypes.models import ContentType
+from django.core.files.base import ContentFile
 from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
 from django.urls import reverse
 from django.utils.formats import date_format
+from django.utils.functional import cached_property
 from django.utils.timezone import now
 from nautobot.core.models import BaseModel
 from nautobot.extras.choices import JobResultStatusChoices
@@ -36,7 +43,8 @@ from nautobot_ssot.integrations.infoblox.models import SSOTInfobloxConfig
 from nautobot_ssot.integrations.itential.models import AutomationGatewayModel
 from nautobot_ssot.integrations.servicenow.models import SSOTServiceNowConfig
 
-from .choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
+from .choices import SyncAdapterSnapshotSideChoices, SyncLogEntryActionChoices, SyncLogEntryStatusChoices
+from .snapshots import read_snapshot, write_snapshot
 
 
 class DiffJSONEncoder(DjangoJSONEncoder):
@@ -81,6 +89,9 @@ class Sync(BaseModel):  # pylint: disable=nb-string-field-blank-null
     )
     diff = models.JSONField(blank=True, encoder=DiffJSONEncoder)
     summary = models.JSONField(blank=True, null=True)
+    orm_cache_statistics = models.JSONField(
+        blank=True, null=True, help_text="ORM cache hits, misses and evictions per model class"
+    )
 
     job_result = models.ForeignKey(to=JobResult, on_delete=models.CASCADE, blank=True, null=True)
 
@@ -207,6 +218,88 @@ class SyncLogEntry(BaseModel):  # pylint: disable=nb-string-field-blank-null
         }.get(self.status)
 
 
+class SyncDiffChunk(BaseModel):
+    """A chunk of the diff calculated during a data sync operation.
+
+    Storing the diff as a single JSON blob on the Sync means that it has to be built in memory in its entirety, and
+    large diffs may exceed what the database is able to store in one field. Instead, the diff is stored in chunks of a
+    bounded number of top-level diff elements of the same model type, in the order diffsync yields them.
+    """
+
+    sync = models.ForeignKey(
+        to=Sync, on_delete=models.CASCADE, related_name="diff_chunks", related_query_name="diff_chunk"
+    )
+    index = models.PositiveIntegerField()
+    model_type = models.CharField(max_length=255)
+    element_count = models.PositiveIntegerField(default=0)
+    diff = models.JSONField(blank=True, encoder=DiffJSONEncoder)
+
+    class Meta:
+        """Metaclass attributes of SyncDiffChunk."""
+
+        ordering = ["sync", "index"]
+        unique_together = [["sync", "index"]]
+
+    def __str__(self):
+        """String representation of a SyncDiffChunk instance."""
+        return f"{self.sync}: {self.model_type} diff chunk {self.index}"
+
+
+class SyncAdapterSnapshot(BaseModel):
+    """The objects loaded into an adapter during a data sync operation.
+
+    The objects are stored in a snapshot archive (see `nautobot_ssot.snapshots`), with one member per model type.
+    Incremental syncs restore the objects that haven't changed since the snapshot was taken from it, rather than
+    loading them from the source or target system again. Snapshots are taken right after loading, so that the changes
+    made by the sync itself are picked up as changes by the next incremental sync. Jobs can also be run against the
+    snapshots of an earlier sync, i.e. to repeat a dry-run without querying either system.
+    """
+
+    sync = models.ForeignKey(
+        to=Sync, on_delete=models.CASCADE, related_name="adapter_snapshots", related_query_name="adapter_snapshot"
+    )
+    side = models.CharField(max_length=6, choices=SyncAdapterSnapshotSideChoices)
+    adapter = models.CharField(max_length=255, help_text="Import path of the adapter class")
+    watermark = models.DateTimeField(help_text="Changes made after this point in time aren't part of the snapshot")
+    object_count = models.PositiveIntegerField(default=0)
+    file = models.FileField(upload_to="nautobot_ssot/snapshots/")
+
+    class Meta:
+        """Metaclass attributes of SyncAdapterSnapshot."""
+
+        ordering = ["sync", "side"]
+        unique_together = [["sync", "side"]]
+
+    def __str__(self):
+        """String representation of a SyncAdapterSnapshot instance."""
+        return f"{self.sync}: {self.side} snapshot"
+
+    @cached_property
+    def data(self):
+        """The objects in this snapshot, in the format of `Adapter.dict`."""
+        return self.read()
+
+    def read(self, modelnames=None):
+        """Read the objects in this snapshot, optionally limited to the given model types."""
+        with self.file.open("rb") as file:
+            return read_snapshot(file, modelnames)
+
+    def write(self, data):
+        """Write the objects in `data`, in the format of `Adapter.dict`, to the file of this snapshot and save it."""
+        buffer = BytesIO()
+        write_snapshot(data, buffer)
+        self.object_count = sum(len(objects) for objects in data.values())
+        self.file.save(f"{self.sync.pk}-{self.side}.zip", ContentFile(buffer.getvalue()), save=True)
+        self.__dict__.pop("data", None)
+
+
+@receiver(post_delete, sender=SyncAdapterSnapshot)
+def delete_sync_adapter_snapshot_file(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """Delete the file of a SyncAdapterSnapshot along with it."""
+    if instance.file:
+        instance.file.delete(save=False)
+
+
 class SSOTConfig(models.Model):  # pylint: disable=nb-incorrect-base-class
     """Non-db model providing user permission constraints."""
 
@@ -220,5 +313,6 @@ __all__ = (
     "AutomationGatewayModel",
     "SSOTServiceNowConfig",
     "Sync",
+    "SyncDiffChunk",
     "SyncLogEntry",
 )
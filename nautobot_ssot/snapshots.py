@@ -0,0 +1,104 @@
+"""Snapshots of the objects loaded into a DiffSync adapter, as used by incremental syncs and snapshot replays.
+
+A snapshot is stored as a zip archive with one compressed JSON member per model type, named after the model type.
+Each member maps the unique IDs of the objects to their fields, as in `Adapter.dict`.
+"""
+
+# pylint: disable=protected-access
+# Diffsync relies on underscore-prefixed attributes quite heavily, which is why we disable this here.
+
+import inspect
+import json
+import warnings
+import zipfile
+from typing import IO, Dict, Iterable, Mapping, Optional, Type
+
+from diffsync import Adapter, DiffSyncModel
+from django.core.serializers.json import DjangoJSONEncoder
+
+
+def dump_adapter(adapter: Adapter) -> Dict[str, Dict[str, Dict]]:
+    """Return the objects of an adapter in the format of `Adapter.dict`, i.e. `{modelname: {unique_id: fields}}`."""
+    with warnings.catch_warnings():
+        # Children are held as unique IDs rather than the model instances they are annotated with, which pydantic
+        # warns about for every object.
+        warnings.filterwarnings("ignore", message="Pydantic serializer warnings")
+        return adapter.dict()
+
+
+def write_snapshot(data: Mapping[str, Mapping[str, Dict]], file: IO[bytes]):
+    """Write the output of `dump_adapter` to a file as a snapshot archive."""
+    with zipfile.ZipFile(file, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for modelname, objects in data.items():
+            archive.writestr(f"{modelname}.json", json.dumps(objects, cls=DjangoJSONEncoder, separators=(",", ":")))
+
+
+def read_snapshot(file: IO[bytes], modelnames: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Dict]]:
+    """Read a snapshot archive, optionally limited to the given model types."""
+    data = {}
+    with zipfile.ZipFile(file) as archive:
+        for name in archive.namelist():
+            modelname = name.rsplit(".", 1)[0]
+            if modelnames is None or modelname in modelnames:
+                data[modelname] = json.loads(archive.read(name))
+    return data
+
+
+def get_snapshot_adapter_class(adapter_class: Type[Adapter]) -> Type[Adapter]:
+    """Return a plain adapter class with the same name and models as `adapter_class`.
+
+    Unlike most adapters, it can be instantiated without any arguments, i.e. without a connection to the system the
+    snapshot was taken from. As the models are the same, objects restored into it can be diffed with other adapters.
+    """
+    attributes = {
+        name: value
+        for name, value in inspect.getmembers(adapter_class)
+        if inspect.isclass(value) and issubclass(value, DiffSyncModel)
+    }
+    attributes["top_level"] = list(adapter_class.top_level)
+    return type(adapter_class.__name__, (Adapter,), attributes)
+
+
+def restore_adapter(
+    adapter: Adapter,
+    data: Mapping[str, Mapping[str, Dict]],
+    unique_ids: Optional[Mapping[str, Iterable[str]]] = None,
+):
+    """Add objects from a snapshot to an adapter, unless the adapter already holds them.
+
+    If `unique_ids` is given, only the objects listed in it are restored and any other objects in the snapshot are
+    considered to have been deleted since it was taken. The children of restored objects are limited to the objects
+    that are present in the adapter afterwards, for the same reason.
+
+    :param adapter: The adapter to restore the objects into.
+    :param data: The snapshot, as returned by `dump_adapter`.
+    :param unique_ids: The unique IDs of the objects that currently exist per model name, `None` to restore all.
+    :return: A tuple of the number of restored objects and a list of `(modelname, unique_id)` tuples of objects that
+        neither are in the adapter nor in the snapshot.
+    """
+    if unique_ids is None:
+        unique_ids = {modelname: objects.keys() for modelname, objects in data.items()}
+    restored = []
+    missing = []
+    for modelname, model_unique_ids in unique_ids.items():
+        model_class = getattr(adapter, modelname)
+        model_data = data.get(modelname, {})
+        for unique_id in model_unique_ids:
+            if adapter.get_or_none(modelname, unique_id) is not None:
+                continue
+            if unique_id not in model_data:
+                missing.append((modelname, unique_id))
+                continue
+            fields = dict(model_data[unique_id])
+            # Children are stored by their unique IDs, which are added once all objects are restored.
+            children = {field_name: fields.pop(field_name, []) for field_name in model_class._children.values()}
+            obj = model_class(**fields)
+            adapter.add(obj)
+            restored.append((obj, children))
+
+    for obj, children in restored:
+        for child_modelname, field_name in obj._children.items():
+            for child in children[field_name]:
+                if adapter.get_or_none(child_modelname, child) is not None:
+                    getattr(obj, field_name).append(child)
+    return len(restored), missing
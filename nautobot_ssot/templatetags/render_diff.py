@@ -1,4 +1,4 @@
-"""Template tag for rendering a DiffSync diff dictionary in a more human-readable form."""
+"""Template tags for rendering a DiffSync diff dictionary in a more human-readable form."""
 
 from django import template
 from django.utils.html import format_html
@@ -63,3 +63,9 @@ def render_diff(diff):
     """Render a DiffSync diff dict to HTML."""
     html_text = render_diff_recursive(diff)
     return format_html("<ul>{}</ul>", mark_safe(html_text))  # noqa: S308
+
+
+@register.simple_tag
+def render_diff_chunk(chunk):
+    """Render a SyncDiffChunk, i.e. a part of a DiffSync diff dict, to HTML."""
+    return render_diff({chunk.model_type: chunk.diff})
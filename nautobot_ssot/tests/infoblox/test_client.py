@@ -2,15 +2,18 @@
 
 # pylint: disable=protected-access
 # pylint: disable=too-many-public-methods
+import threading
 import unittest
 from collections import namedtuple
+from functools import partial
 from os import path
 from unittest.mock import patch
 
 import requests_mock
+from django.test import override_settings
 from requests.models import HTTPError
 
-from nautobot_ssot.integrations.infoblox.utils.client import InvalidUrlScheme, get_dns_name
+from nautobot_ssot.integrations.infoblox.utils.client import InvalidUrlScheme, WapiRetry, get_dns_name
 
 from .fixtures_infoblox import (
     LOCALHOST,
@@ -136,7 +139,7 @@ class TestInfobloxTest(unittest.TestCase):
 
         with requests_mock.Mocker() as req:
             req.post(f"{LOCALHOST}/{mock_uri}", json=mock_response, status_code=200)
-            resp = self.infoblox_client.get_all_ipv4address_networks(prefixes=[(mock_prefix, "default")])
+            resp = list(self.infoblox_client.get_all_ipv4address_networks(prefixes=[(mock_prefix, "default")]))
 
         self.assertEqual(resp, mock_response[0])
 
@@ -148,7 +151,7 @@ class TestInfobloxTest(unittest.TestCase):
 
         with requests_mock.Mocker() as req:
             req.post(f"{LOCALHOST}/{mock_uri}", json=mock_response, status_code=404)
-            response = self.infoblox_client.get_all_ipv4address_networks([(mock_prefix, "default")])
+            response = list(self.infoblox_client.get_all_ipv4address_networks([(mock_prefix, "default")]))
 
             self.assertEqual(response, [])
 
@@ -163,27 +166,53 @@ class TestInfobloxTest(unittest.TestCase):
                 json=response,
                 status_code=201,
             )
-            resp = self.infoblox_client.get_all_ipv4address_networks(prefixes=prefixes)
+            resp = list(self.infoblox_client.get_all_ipv4address_networks(prefixes=prefixes))
         expected = get_all_ipv4address_networks_medium()[0] + get_all_ipv4address_networks()[0]
         self.assertEqual(resp, expected)
 
     def test_get_all_ipv4_address_networks_large_data_success(self):
-        """Test get_all_ipv4_address_networks success with large data set."""
+        """Test get_all_ipv4_address_networks success with large data set, which is requested page by page."""
         prefixes = [("10.0.0.0/22", "default"), ("10.220.0.100/31", "default")]
-
-        mock_response = [
-            {"json": get_all_ipv4address_networks_large(), "status_code": 201},
-            {"json": get_all_ipv4address_networks(), "status_code": 201},
+        large_response = get_all_ipv4address_networks_large()[0]
+        pages = [
+            {"json": {"result": large_response[:2], "next_page_id": "page2"}, "status_code": 200},
+            {"json": {"result": large_response[2:]}, "status_code": 200},
         ]
-        mock_uri = "request"
 
         with requests_mock.Mocker() as req:
-            req.post(f"{LOCALHOST}/{mock_uri}", mock_response)
-            resp = self.infoblox_client.get_all_ipv4address_networks(prefixes=prefixes)
+            req.get(f"{LOCALHOST}/ipv4address", pages)
+            req.post(f"{LOCALHOST}/request", json=get_all_ipv4address_networks(), status_code=201)
+            resp = list(self.infoblox_client.get_all_ipv4address_networks(prefixes=prefixes))
+
+            self.assertEqual(req.request_history[0].qs["network"], ["10.0.0.0/22"])
+            self.assertEqual(req.request_history[0].qs["_max_results"], ["1000"])
+            self.assertEqual(req.request_history[1].qs["_page_id"], ["page2"])
 
         expected = get_all_ipv4address_networks_large()[0] + get_all_ipv4address_networks()[0]
         self.assertEqual(resp, expected)
 
+    def test_get_all_ipv4_address_networks_concurrent(self):
+        """Test get_all_ipv4_address_networks keeps the order of the prefixes when requests are sent concurrently."""
+        self.infoblox_client.max_concurrent_requests = 2
+        # Both prefixes are too large to share a request, so they are sent as separate, concurrent requests.
+        prefixes = [("10.0.0.0/23", "default"), ("172.16.0.0/23", "default")]
+        responses = {
+            "10.0.0.0/23": get_all_ipv4address_networks_large(),
+            "172.16.0.0/23": get_all_ipv4address_networks_medium(),
+        }
+
+        with requests_mock.Mocker() as req:
+            req.post(
+                f"{LOCALHOST}/request",
+                json=lambda request, context: responses[request.json()[0]["data"]["network"]],
+                status_code=201,
+            )
+            resp = list(self.infoblox_client.get_all_ipv4address_networks(prefixes=prefixes))
+
+            self.assertEqual(req.call_count, 2)
+        expected = get_all_ipv4address_networks_large()[0] + get_all_ipv4address_networks_medium()[0]
+        self.assertEqual(resp, expected)
+
     def test_get_all_ipv4_address_networks_bulk_data_success(self):
         """Test get_all_ipv4_address_networks success with a bulk data set that exceeds 1k results."""
         prefixes = [("192.168.0.0/23", "default"), ("192.168.2.0/23", "default")]
@@ -196,7 +225,7 @@ class TestInfobloxTest(unittest.TestCase):
                     {"json": [], "status_code": 201},
                 ],
             )
-            resp = self.infoblox_client.get_all_ipv4address_networks(prefixes=prefixes)
+            resp = list(self.infoblox_client.get_all_ipv4address_networks(prefixes=prefixes))
         self.assertEqual(resp, get_all_ipv4address_networks_bulk()[0])
 
     def test_get_fixed_address_by_ref_success(self):
@@ -458,7 +487,7 @@ class TestInfobloxTest(unittest.TestCase):
         }
 
         with requests_mock.Mocker() as req:
-            req.get(f"{LOCALHOST}/{mock_uri}", json=mock_response, status_code=200)
+            req.get(f"{LOCALHOST}/{mock_uri}", json={"result": mock_response}, status_code=200)
             resp = self.infoblox_client.get_all_ranges()
 
         self.assertEqual(resp, expected)
@@ -489,17 +518,17 @@ class TestInfobloxTest(unittest.TestCase):
         with requests_mock.Mocker() as req:
             req.register_uri("GET", "/_page_id=123456789")
             req.get(
-                f"{LOCALHOST}/{mock_uri}?_paging=1&_return_as_object=1&_return_fields=network,network_view,comment,extattrs,rir_organization,rir,vlans&_max_results=10000",
+                f"{LOCALHOST}/{mock_uri}?_paging=1&_return_as_object=1&_return_fields=network,network_view,comment,extattrs,rir_organization,rir,vlans&_max_results=1000",
                 json=mock_subnets_response_page_1,
                 status_code=200,
             )
             req.get(
-                f"{LOCALHOST}/{mock_uri}?_paging=1&_return_as_object=1&_return_fields=network,network_view,comment,extattrs,rir_organization,rir,vlans&_max_results=10000&_page_id=123456789",
+                f"{LOCALHOST}/{mock_uri}?_paging=1&_return_as_object=1&_return_fields=network,network_view,comment,extattrs,rir_organization,rir,vlans&_max_results=1000&_page_id=123456789",
                 json=mock_subnets_response_page_2,
                 status_code=200,
             )
-            req.get(f"{LOCALHOST}/range", json=mock_range_response, status_code=200)
-            resp = self.infoblox_client.get_all_subnets()
+            req.get(f"{LOCALHOST}/range", json={"result": mock_range_response}, status_code=200)
+            resp = list(self.infoblox_client.get_all_subnets())
 
         self.assertEqual(resp, expected)
 
@@ -510,7 +539,7 @@ class TestInfobloxTest(unittest.TestCase):
 
         with requests_mock.Mocker() as req:
             req.get(f"{LOCALHOST}/{mock_uri}", json=mock_response, status_code=404)
-            response = self.infoblox_client.get_all_subnets()
+            response = list(self.infoblox_client.get_all_subnets())
 
         self.assertEqual(response, [])
 
@@ -838,7 +867,7 @@ class TestInfobloxTest(unittest.TestCase):
 
         with requests_mock.Mocker() as req:
             req.get(f"{LOCALHOST}/{mock_uri}", json=mock_response, status_code=200)
-            resp = self.infoblox_client.get_network_containers()
+            resp = list(self.infoblox_client.get_network_containers())
 
         self.assertEqual(resp, mock_response["result"])
 
@@ -849,7 +878,7 @@ class TestInfobloxTest(unittest.TestCase):
 
         with requests_mock.Mocker() as req:
             req.get(f"{LOCALHOST}/{mock_uri}", json=mock_response, status_code=200)
-            resp = self.infoblox_client.get_network_containers(ipv6=True)
+            resp = list(self.infoblox_client.get_network_containers(ipv6=True))
 
         self.assertEqual(resp, mock_response["result"])
 
@@ -859,8 +888,8 @@ class TestInfobloxTest(unittest.TestCase):
         mock_uri = "networkview"
 
         with requests_mock.Mocker() as req:
-            req.get(f"{LOCALHOST}/{mock_uri}", json=mock_response, status_code=200)
-            resp = self.infoblox_client.get_network_views()
+            req.get(f"{LOCALHOST}/{mock_uri}", json={"result": mock_response}, status_code=200)
+            resp = list(self.infoblox_client.get_network_views())
 
         self.assertEqual(resp, mock_response)
 
@@ -939,3 +968,168 @@ class TestInfobloxTest(unittest.TestCase):
             resp = self.infoblox_client.get_authoritative_zones_for_dns_view(mock_view)
 
         self.assertEqual(resp, mock_response["result"])
+
+    def test_execute_concurrently(self):
+        """Test execute_concurrently runs the calls concurrently and returns the results in order."""
+        self.infoblox_client.max_concurrent_requests = 3
+        barrier = threading.Barrier(3, timeout=5)
+
+        def call(value):
+            # Only returns if all three calls are running at the same time.
+            barrier.wait()
+            return value
+
+        resp = self.infoblox_client.execute_concurrently(partial(call, value) for value in range(3))
+
+        self.assertEqual(resp, [0, 1, 2])
+
+    def test_execute_concurrently_failure(self):
+        """Test execute_concurrently raises the exception of a failed call."""
+        self.infoblox_client.max_concurrent_requests = 2
+
+        def call(value):
+            if value == 1:
+                raise HTTPError("Failed")
+            return value
+
+        with self.assertRaises(HTTPError):
+            self.infoblox_client.execute_concurrently(partial(call, value) for value in range(3))
+
+    def test_session_connection_pool_and_retries(self):
+        """Test the session's connection pool is sized to the concurrency limit and retries throttled requests."""
+        infoblox_client = localhost_client_infoblox(LOCALHOST)
+        infoblox_client.max_concurrent_requests = 8
+        session = infoblox_client._init_session(verify_ssl=False, cookie=None)
+        adapter = session.get_adapter(LOCALHOST)
+        self.assertEqual(adapter._pool_maxsize, 8)
+        self.assertIsInstance(adapter.max_retries, WapiRetry)
+        self.assertEqual(adapter.max_retries.total, 3)
+        self.assertTrue(adapter.max_retries.is_retry("POST", 429))
+        self.assertTrue(adapter.max_retries.is_retry("GET", 503))
+        self.assertFalse(adapter.max_retries.is_retry("POST", 503))
+        self.assertFalse(adapter.max_retries.is_retry("GET", 400))
+
+    def test_get_all_host_records_paged(self):
+        """Test get_all_host_records requests all pages of Host records in a DNS view."""
+        mock_uri = "record:host"
+        first_page = {"result": [{"_ref": "record:host/1", "name": "server1.test"}], "next_page_id": "page2"}
+        second_page = {"result": [{"_ref": "record:host/2", "name": "server2.test"}]}
+
+        with requests_mock.Mocker() as req:
+            req.get(f"{LOCALHOST}/{mock_uri}", [{"json": first_page}, {"json": second_page}])
+            resp = list(self.infoblox_client.get_all_host_records(dns_view="default.dev"))
+
+            self.assertEqual(req.call_count, 2)
+            self.assertEqual(req.request_history[0].qs["view"], ["default.dev"])
+            self.assertEqual(req.request_history[0].qs["_paging"], ["1"])
+            self.assertNotIn("_page_id", req.request_history[0].qs)
+            self.assertEqual(req.request_history[1].qs["_page_id"], ["page2"])
+        self.assertEqual(resp, first_page["result"] + second_page["result"])
+
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+    def test_reference_data_not_cached_by_default(self):
+        """Test reference data is requested from Infoblox on every call unless a cache timeout is set."""
+        with requests_mock.Mocker() as req:
+            req.get(f"{LOCALHOST}/networkview", json={"result": get_all_network_views()}, status_code=200)
+            list(self.infoblox_client.get_network_views())
+            list(self.infoblox_client.get_network_views())
+
+        self.assertEqual(req.call_count, 2)
+
+    @override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+    def test_reference_data_cached(self):
+        """Test reference data is cached across clients of the same namespace until the cache is invalidated."""
+        mock_response = get_all_network_views()
+        self.infoblox_client.cache_timeout = 60
+        other_client = localhost_client_infoblox(LOCALHOST)
+        other_client.cache_timeout = 60
+
+        with requests_mock.Mocker() as req:
+            req.get(f"{LOCALHOST}/networkview", json={"result": mock_response}, status_code=200)
+            self.assertEqual(self.infoblox_client.get_network_views(), mock_response)
+            self.assertEqual(other_client.get_network_views(), mock_response)
+            self.assertEqual(req.call_count, 1)
+            # Cached results are kept per arguments.
+            other_client.get_network_view("dev")
+            self.assertEqual(req.call_count, 2)
+
+            other_client.invalidate_cache()
+            self.assertEqual(self.infoblox_client.get_network_views(), mock_response)
+            self.assertEqual(req.call_count, 3)
+
+    def test_writes_not_queued_by_default(self):
+        """Test writes are sent immediately unless a write batch size is set."""
+        self.infoblox_client.queue_writes()
+        self.assertIsNone(self.infoblox_client.write_queue)
+
+        with requests_mock.Mocker() as req:
+            req.post(f"{LOCALHOST}/network", text="network/ZG5zLm5ldHdvcmskMTAuMC4wLjAvOC8w:10.0.0.0/8/default")
+            self.infoblox_client.create_network(prefix="10.0.0.0/8", network_view="default")
+
+        self.assertEqual(req.call_count, 1)
+
+    def test_flush_writes(self):
+        """Test queued writes are sent through the request endpoint in chunks of the write batch size."""
+        self.infoblox_client.write_batch_size = 2
+        self.infoblox_client.queue_writes()
+        self.infoblox_client.create_network(prefix="10.0.0.0/8", comment="test", network_view="default")
+        self.infoblox_client.create_range(prefix="10.0.0.0/8", start="10.0.0.10", end="10.0.0.20")
+        self.infoblox_client.update_fixed_address(ref="fixedaddress/ZG5z:10.0.0.2/default", data={"name": "fa"})
+        self.assertEqual(len(self.infoblox_client.write_queue), 3)
+
+        with requests_mock.Mocker() as req:
+            req.post(
+                f"{LOCALHOST}/request",
+                [
+                    {"json": ["network/ZG5z:10.0.0.0/8/default", "range/ZG5z:10.0.0.10/10.0.0.20/default"]},
+                    {"json": [{}]},
+                ],
+            )
+            writes = self.infoblox_client.flush_writes()
+
+            self.assertEqual(req.call_count, 2)
+            self.assertEqual(
+                req.request_history[0].json(),
+                [
+                    {
+                        "method": "POST",
+                        "object": "network",
+                        "data": {"network": "10.0.0.0/8", "comment": "test", "network_view": "default"},
+                        "args": {},
+                    },
+                    {
+                        "method": "POST",
+                        "object": "range",
+                        "data": {"network": "10.0.0.0/8", "start_addr": "10.0.0.10", "end_addr": "10.0.0.20"},
+                        "args": {},
+                    },
+                ],
+            )
+            self.assertEqual(
+                req.request_history[1].json(),
+                [{"method": "PUT", "object": "fixedaddress/ZG5z:10.0.0.2/default", "data": {"name": "fa"}, "args": {}}],
+            )
+        self.assertEqual(writes[0].result, "network/ZG5z:10.0.0.0/8/default")
+        self.assertEqual(writes[1].result, "range/ZG5z:10.0.0.10/10.0.0.20/default")
+        self.assertTrue(all(write.error is None for write in writes))
+        self.assertEqual(self.infoblox_client.write_queue, [])
+
+    def test_flush_writes_failure(self):
+        """Test the writes of a failed request are sent one by one, so that only the failing writes have an error."""
+        self.infoblox_client.write_batch_size = 10
+        self.infoblox_client.queue_writes()
+        self.infoblox_client.create_network(prefix="10.0.0.0/8", network_view="default")
+        self.infoblox_client.delete_a_record_by_ref(ref="record:a/ZG5z:server1.test/default")
+
+        with requests_mock.Mocker() as req:
+            req.post(f"{LOCALHOST}/request", json={"Error": "AdmConDataError"}, status_code=400)
+            req.post(f"{LOCALHOST}/network", json="network/ZG5z:10.0.0.0/8/default", status_code=201)
+            req.delete(f"{LOCALHOST}/record:a/ZG5z:server1.test/default", json={"Error": "Not found"}, status_code=404)
+            writes = self.infoblox_client.flush_writes()
+
+            self.assertEqual(req.call_count, 3)
+            self.assertEqual(req.request_history[1].json(), {"network": "10.0.0.0/8", "network_view": "default"})
+        self.assertEqual(writes[0].result, "network/ZG5z:10.0.0.0/8/default")
+        self.assertIsNone(writes[0].error)
+        self.assertIsNone(writes[1].result)
+        self.assertIn("404", writes[1].error)
@@ -22,6 +22,7 @@ class TestInfobloxAdapter(unittest.TestCase):
                 conn=mock_client,
                 config=self.config,
             )
+        mock_client.execute_concurrently.side_effect = lambda calls: [call() for call in calls]
 
     @unittest.mock.patch(
         "nautobot_ssot.integrations.infoblox.diffsync.adapters.infoblox.get_default_ext_attrs",
@@ -120,7 +121,7 @@ class TestInfobloxAdapter(unittest.TestCase):
         mock_extra_attr_dict,
         mock_default_extra_attrs,
     ):
-        ten_container = [
+        self.infoblox_adapter.conn.get_network_containers.return_value = [
             {
                 "_ref": "networkcontainer/ZG5zLm5ldHdvcmtfY29udGFpbmVyJDEwLjAuMC4wLzgvMA:10.0.0.0/8/default",
                 "extattrs": {},
@@ -137,51 +138,51 @@ class TestInfobloxAdapter(unittest.TestCase):
                 "rir": "NONE",
                 "status": "container",
             },
+            {
+                "_ref": "networkcontainer/ZG5zLm5ldHdvcmtfY29udGFpbmVyJDE3Mi4xNi4wLjAvMTIvMA:172.16.0.0/12/default",
+                "extattrs": {},
+                "network": "172.16.0.0/12",
+                "network_view": "default",
+                "rir": "NONE",
+                "status": "container",
+            },
         ]
-        self.infoblox_adapter.conn.get_tree_from_container.side_effect = [ten_container, []]
-        ten_network = [
+        self.infoblox_adapter.conn.get_all_subnets.return_value = [
             {
-                "_ref": "network/ZG5zLm5ldHdvcmskMTAuNTguMTI4LjAvMTgvMA:10.0.1.0/23/default",
+                "_ref": "network/ZG5zLm5ldHdvcmskMTAuNTguMTI4LjAvMTgvMA:10.0.0.0/23/default",
                 "extattrs": {},
-                "network": "10.0.1.0/23",
+                "network": "10.0.0.0/23",
                 "network_view": "default",
                 "rir": "NONE",
                 "vlans": [],
             },
-        ]
-        self.infoblox_adapter.conn.get_child_subnets_from_container.side_effect = [
-            [],
-            ten_network,
-        ]
-        one_nine_two_network = [
             {
-                "_ref": "network/ZG5zLm5ldHdvcmskMTAuNTguMTI4LjAvMTgvMA:192.168.0.0/23/default",
+                "_ref": "network/ZG5zLm5ldHdvcmskMTAuNTguMTI4LjAvMTgvMA:172.16.0.0/24/default",
                 "extattrs": {},
-                "network": "192.168.0.0/23",
+                "network": "172.16.0.0/24",
+                "network_view": "default",
+                "rir": "NONE",
+                "vlans": [],
+            },
+            {
+                "_ref": "network/ZG5zLm5ldHdvcmskMTAuNTguMTI4LjAvMTgvMA:192.168.0.0/16/default",
+                "extattrs": {},
+                "network": "192.168.0.0/16",
                 "network_view": "default",
                 "rir": "NONE",
                 "vlans": [],
             },
         ]
-        self.infoblox_adapter.conn.get_all_subnets.side_effect = [one_nine_two_network]
         sync_filters = [{"network_view": "default", "prefixes_ipv4": ["10.0.0.0/8", "192.168.0.0/16"]}]
         self.infoblox_adapter.load_prefixes(include_ipv4=True, include_ipv6=False, sync_filters=sync_filters)
-        self.infoblox_adapter.conn.get_tree_from_container.assert_has_calls(
-            [
-                unittest.mock.call(root_container="10.0.0.0/8", network_view="default"),
-                unittest.mock.call(root_container="192.168.0.0/16", network_view="default"),
-            ]
-        )
-        self.assertEqual(self.infoblox_adapter.conn.get_tree_from_container.call_count, 2)
-        self.infoblox_adapter.conn.get_child_subnets_from_container.assert_has_calls(
-            [
-                unittest.mock.call(prefix="10.0.0.0/8", network_view="default"),
-                unittest.mock.call(prefix="10.0.0.0/16", network_view="default"),
-            ]
+        self.infoblox_adapter.conn.get_tree_from_container.assert_not_called()
+        self.infoblox_adapter.conn.get_child_subnets_from_container.assert_not_called()
+        self.infoblox_adapter.conn.get_network_containers.assert_called_once_with(network_view="default")
+        self.infoblox_adapter.conn.get_all_subnets.assert_called_once_with(network_view="default")
+        self.assertEqual(
+            {prefix.network for prefix in self.infoblox_adapter.get_all("prefix")},
+            {"10.0.0.0/8", "10.0.0.0/16", "10.0.0.0/23", "192.168.0.0/16"},
         )
-        self.assertEqual(self.infoblox_adapter.conn.get_child_subnets_from_container.call_count, 2)
-        self.infoblox_adapter.conn.get_all_subnets.assert_called_once()
-        self.infoblox_adapter.conn.get_all_subnets.assert_called_with("192.168.0.0/16", network_view="default")
         mock_default_extra_attrs.assert_called_once()
         self.assertEqual(mock_extra_attr_dict.call_count, 4)
         mock_build_vlan_map.assert_not_called()
@@ -339,11 +340,6 @@ class TestInfobloxAdapter(unittest.TestCase):
         self.assertEqual(ipv6_subnet.vlans, {})
         self.assertEqual(ipv6_subnet.ranges, [])
 
-    @unittest.mock.patch(
-        "nautobot_ssot.integrations.infoblox.diffsync.adapters.infoblox.get_default_ext_attrs",
-        autospec=True,
-        return_value={},
-    )
     @unittest.mock.patch(
         "nautobot_ssot.integrations.infoblox.diffsync.adapters.infoblox.get_ext_attr_dict",
         autospec=True,
@@ -352,7 +348,6 @@ class TestInfobloxAdapter(unittest.TestCase):
     def test_load_ip_addresses_fixed_only(
         self,
         mock_extra_attr_dict,
-        mock_default_extra_attrs,
     ):
         """Test loading IP Addresses with one fixed address only."""
         self.config.fixed_address_type = FixedAddressTypeChoices.RESERVED
@@ -365,6 +360,7 @@ class TestInfobloxAdapter(unittest.TestCase):
                 conn=mock_client,
                 config=self.config,
             )
+        mock_client.execute_concurrently.side_effect = lambda calls: [call() for call in calls]
         infoblox_adapter.conn.get_ipaddr_status.return_value = "Active"
         infoblox_adapter.conn.get_all_ipv4address_networks.side_effect = [
             [
@@ -413,14 +409,8 @@ class TestInfobloxAdapter(unittest.TestCase):
         self.assertEqual(False, ip_address.has_ptr_record)
         self.assertEqual(False, ip_address.has_host_record)
 
-        mock_default_extra_attrs.assert_called_once()
         self.assertEqual(mock_extra_attr_dict.call_count, 1)
 
-    @unittest.mock.patch(
-        "nautobot_ssot.integrations.infoblox.diffsync.adapters.infoblox.get_default_ext_attrs",
-        autospec=True,
-        return_value={},
-    )
     @unittest.mock.patch(
         "nautobot_ssot.integrations.infoblox.diffsync.adapters.infoblox.get_ext_attr_dict",
         autospec=True,
@@ -429,7 +419,6 @@ class TestInfobloxAdapter(unittest.TestCase):
     def test_load_ip_addresses_fixed_dns_a_dns_ptr(  # pylint: disable=too-many-statements
         self,
         mock_extra_attr_dict,
-        mock_default_extra_attrs,
     ):
         """Test loading IP Addresses with one fixed address, one A record and one PTR record."""
         self.config.fixed_address_type = FixedAddressTypeChoices.RESERVED
@@ -442,6 +431,7 @@ class TestInfobloxAdapter(unittest.TestCase):
                 conn=mock_client,
                 config=self.config,
             )
+        mock_client.execute_concurrently.side_effect = lambda calls: [call() for call in calls]
         infoblox_adapter.conn.get_ipaddr_status.return_value = "Active"
         infoblox_adapter.conn.get_all_ipv4address_networks.side_effect = [
             [
@@ -549,14 +539,8 @@ class TestInfobloxAdapter(unittest.TestCase):
             ptr_record.ref,
         )
 
-        mock_default_extra_attrs.assert_called_once()
         self.assertEqual(mock_extra_attr_dict.call_count, 3)
 
-    @unittest.mock.patch(
-        "nautobot_ssot.integrations.infoblox.diffsync.adapters.infoblox.get_default_ext_attrs",
-        autospec=True,
-        return_value={},
-    )
     @unittest.mock.patch(
         "nautobot_ssot.integrations.infoblox.diffsync.adapters.infoblox.get_ext_attr_dict",
         autospec=True,
@@ -565,7 +549,6 @@ class TestInfobloxAdapter(unittest.TestCase):
     def test_load_ip_addresses_fixed_dns_host(
         self,
         mock_extra_attr_dict,
-        mock_default_extra_attrs,
     ):
         """Test loading IP Addresses with one fixed address and one Host record."""
         self.config.fixed_address_type = FixedAddressTypeChoices.RESERVED
@@ -578,6 +561,7 @@ class TestInfobloxAdapter(unittest.TestCase):
                 conn=mock_client,
                 config=self.config,
             )
+        mock_client.execute_concurrently.side_effect = lambda calls: [call() for call in calls]
         infoblox_adapter.conn.get_ipaddr_status.return_value = "Active"
         infoblox_adapter.conn.get_all_ipv4address_networks.side_effect = [
             [
@@ -669,5 +653,108 @@ class TestInfobloxAdapter(unittest.TestCase):
             host_record.ref,
         )
 
-        mock_default_extra_attrs.assert_called_once()
         self.assertEqual(mock_extra_attr_dict.call_count, 2)
+
+    def test_load_ip_addresses_prefetched_records(self):
+        """Test loading IP Addresses resolves DNS records and fixed addresses from records loaded in bulk."""
+        self.config.fixed_address_type = FixedAddressTypeChoices.RESERVED
+        fixed_address_ref = "fixedaddress/ZG5zLmZpeGVkX2FkZHJlc3MkMTAuMC4wLjIuMi4u:10.0.0.4/dev"
+        a_record_ref = (
+            "record:a/ZG5zLmJpbmRfYSQuMi50ZXN0LmxvY2FsLm5hdXRvYm90LHNlcnZlcjExLDEwLjAuMC40:server11.test/default.dev"
+        )
+        ptr_record_ref = "record:ptr/ZG5zLmJpbmRfcHRyJC4yLmFycGEuaW4tYWRkci4xMC4wLjAuNC5zZXJ2ZXIxMS50ZXN0:4.0.0.10.in-addr.arpa/default.dev"
+        with unittest.mock.patch(
+            "nautobot_ssot.integrations.infoblox.utils.client.InfobloxApi", autospec=True
+        ) as mock_client:
+            infoblox_adapter = InfobloxAdapter(
+                job=unittest.mock.Mock(),
+                sync=unittest.mock.Mock(),
+                conn=mock_client,
+                config=self.config,
+            )
+        mock_client.execute_concurrently.side_effect = lambda calls: [call() for call in calls]
+        infoblox_adapter.conn.get_ipaddr_status.return_value = "Active"
+        infoblox_adapter.conn.get_all_ipv4address_networks.return_value = [
+            {
+                "_ref": "ipv4address/Li5pcHY0X2FkZHJlc3MkMTAuMC4wLjQvMg:10.0.0.4/dev",
+                "ip_address": "10.0.0.4",
+                "mac_address": "",
+                "names": ["server11.test"],
+                "network": "10.0.0.0/24",
+                "network_view": "dev",
+                "objects": [fixed_address_ref, a_record_ref, ptr_record_ref],
+                "status": "USED",
+                "types": ["RESERVATION", "A", "PTR"],
+            }
+        ]
+        infoblox_adapter.conn.get_all_fixed_addresses.return_value = [
+            {"_ref": fixed_address_ref, "name": "fa-server1", "comment": "fa server", "network_view": "dev"}
+        ]
+        infoblox_adapter.conn.get_all_a_records.return_value = [
+            {"_ref": a_record_ref, "ipv4addr": "10.0.0.4", "name": "server11.test", "view": "default.dev"}
+        ]
+        # The PTR record is missing from the bulk results, so it has to be fetched individually.
+        infoblox_adapter.conn.get_all_ptr_records.return_value = []
+        infoblox_adapter.conn.get_ptr_record_by_ref.return_value = {
+            "_ref": ptr_record_ref,
+            "ipv4addr": "10.0.0.4",
+            "ptrdname": "server11.test",
+            "view": "default.dev",
+        }
+
+        infoblox_adapter.load_ipaddresses()
+
+        infoblox_adapter.conn.get_all_fixed_addresses.assert_called_once_with(network_view="dev")
+        infoblox_adapter.conn.get_all_a_records.assert_called_once_with(dns_view="default.dev")
+        infoblox_adapter.conn.get_all_ptr_records.assert_called_once_with(dns_view="default.dev")
+        infoblox_adapter.conn.get_all_host_records.assert_not_called()
+        infoblox_adapter.conn.get_fixed_address_by_ref.assert_not_called()
+        infoblox_adapter.conn.get_a_record_by_ref.assert_not_called()
+        infoblox_adapter.conn.get_ptr_record_by_ref.assert_called_once_with(ptr_record_ref)
+        identifiers = {"address": "10.0.0.4", "prefix": "10.0.0.0/24", "prefix_length": 24, "namespace": "dev"}
+        ip_address = infoblox_adapter.get("ipaddress", identifiers)
+        self.assertEqual("fa-server1", ip_address.description)
+        self.assertEqual("fa server", ip_address.fixed_address_comment)
+        a_record = infoblox_adapter.get("dnsarecord", identifiers)
+        self.assertEqual("server11.test", a_record.dns_name)
+        ptr_record = infoblox_adapter.get("dnsptrrecord", identifiers)
+        self.assertEqual("server11.test", ptr_record.dns_name)
+
+    def test_load_ip_addresses_default_ext_attrs(self):
+        """Test Extensibility Attributes missing from streamed IP Addresses default to None."""
+        self.config.fixed_address_type = FixedAddressTypeChoices.RESERVED
+        with unittest.mock.patch(
+            "nautobot_ssot.integrations.infoblox.utils.client.InfobloxApi", autospec=True
+        ) as mock_client:
+            infoblox_adapter = InfobloxAdapter(
+                job=unittest.mock.Mock(),
+                sync=unittest.mock.Mock(),
+                conn=mock_client,
+                config=self.config,
+            )
+        infoblox_adapter.conn.get_ipaddr_status.return_value = "Active"
+        infoblox_adapter.conn.get_all_ipv4address_networks.return_value = iter(
+            [
+                {
+                    "ip_address": f"10.0.0.{host}",
+                    "extattrs": extattrs,
+                    "mac_address": "",
+                    "network": "10.0.0.0/24",
+                    "network_view": "dev",
+                    "objects": [f"fixedaddress/ZG5zLmZpeGVkX2FkZHJlc3M:10.0.0.{host}/dev"],
+                    "types": ["RESERVATION"],
+                }
+                for host, extattrs in ((2, {}), (3, {"Site": {"value": "HQ"}}))
+            ]
+        )
+        infoblox_adapter.conn.get_fixed_address_by_ref.return_value = {"name": "fa-server1"}
+
+        infoblox_adapter.load_ipaddresses()
+
+        identifiers = {"prefix": "10.0.0.0/24", "prefix_length": 24, "namespace": "dev"}
+        self.assertEqual(
+            {"site": None}, infoblox_adapter.get("ipaddress", {**identifiers, "address": "10.0.0.2"}).ext_attrs
+        )
+        self.assertEqual(
+            {"site": "HQ"}, infoblox_adapter.get("ipaddress", {**identifiers, "address": "10.0.0.3"}).ext_attrs
+        )
@@ -4,6 +4,8 @@
 import unittest
 from unittest.mock import Mock
 
+import requests_mock
+from diffsync.enum import DiffSyncStatus
 from django.test import TestCase
 
 from nautobot_ssot.integrations.infoblox.choices import (
@@ -14,7 +16,7 @@ from nautobot_ssot.integrations.infoblox.choices import (
 from nautobot_ssot.integrations.infoblox.diffsync.adapters.infoblox import InfobloxAdapter
 from nautobot_ssot.integrations.infoblox.diffsync.adapters.nautobot import NautobotAdapter
 
-from .fixtures_infoblox import create_default_infoblox_config
+from .fixtures_infoblox import LOCALHOST, create_default_infoblox_config, localhost_client_infoblox
 
 
 def _get_ip_address_dict(attrs):
@@ -196,6 +198,40 @@ class TestModelInfobloxNetwork(TestCase):
             )
             mock_tag_involved_objects.assert_called_once()
 
+    @unittest.mock.patch(
+        "nautobot_ssot.integrations.infoblox.diffsync.adapters.nautobot.NautobotMixin.tag_involved_objects",
+        autospec=True,
+    )
+    def test_network_create_batched_writes(self, mock_tag_involved_objects):
+        """Validate networks are created through the request endpoint and failures are recorded on the models."""
+        self.config.write_batch_size = 10
+        for network in ("10.0.0.0/8", "172.16.0.0/12"):
+            self.nb_adapter.add(self.nb_adapter.prefix(**_get_network_dict({"network": network})))
+        self.nb_adapter.load()
+        infoblox_adapter = InfobloxAdapter(conn=localhost_client_infoblox(LOCALHOST), config=self.config)
+        infoblox_adapter.conn.write_batch_size = self.config.write_batch_size
+        infoblox_adapter.add(infoblox_adapter.namespace(name="Global", ext_attrs={}))
+        infoblox_adapter.job = Mock()
+        with requests_mock.Mocker() as req:
+            req.post(f"{LOCALHOST}/request", json={"Error": "AdmConDataError"}, status_code=400)
+            req.post(
+                f"{LOCALHOST}/network",
+                [
+                    {"json": "network/ZG5z:10.0.0.0/8/default", "status_code": 201},
+                    {"json": {"Error": "AdmConDataError"}, "status_code": 400},
+                ],
+            )
+            self.nb_adapter.sync_to(infoblox_adapter)
+
+            self.assertEqual(req.call_count, 3)
+        self.assertIsNone(infoblox_adapter.conn.write_queue)
+        succeeded = infoblox_adapter.get("prefix", "10.0.0.0/8__Global")
+        failed = infoblox_adapter.get("prefix", "172.16.0.0/12__Global")
+        self.assertEqual(succeeded.get_status()[0], DiffSyncStatus.SUCCESS)
+        self.assertEqual(failed.get_status()[0], DiffSyncStatus.ERROR)
+        infoblox_adapter.job.logger.warning.assert_called_once()
+        mock_tag_involved_objects.assert_called_once()
+
 
 class TestModelInfobloxIPAddress(TestCase):
     """Tests Fixed Address record operations."""
@@ -0,0 +1,169 @@
+"""Unit tests for the Infoblox jobs."""
+
+from unittest import mock
+
+from diffsync.enum import DiffSyncFlags
+from django.test import TestCase
+from nautobot.extras.models import CustomField, Tag
+
+from nautobot_ssot.integrations.infoblox.diffsync.adapters.nautobot import NautobotAdapter
+from nautobot_ssot.integrations.infoblox.diffsync.models.nautobot import NautobotNamespace, NautobotVlanGroup
+from nautobot_ssot.integrations.infoblox.jobs import InfobloxDataSource, InfobloxDataTarget
+
+from .fixtures_infoblox import create_default_infoblox_config
+
+
+class PartitionAdapter(NautobotAdapter):
+    """Adapter loading a namespace per network view of its config, and a VLAN view if VLAN views are imported."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.load_count = 0
+
+    def load(self):
+        self.load_count += 1
+        for sync_filter in self.config.infoblox_sync_filters:
+            self.add(NautobotNamespace(name=sync_filter["network_view"], ext_attrs={}))
+        if self.config.import_vlan_views:
+            self.add(NautobotVlanGroup(name="vlans", ext_attrs={}))
+
+
+class TestInfobloxSyncPartitions(TestCase):
+    """Tests for syncing the network views of the sync filters as separate partitions."""
+
+    def setUp(self):
+        self.config = create_default_infoblox_config()
+        self.config.infoblox_sync_filters = [
+            {"network_view": "default"},
+            {"network_view": "dev", "prefixes_ipv4": ["10.0.0.0/8"]},
+        ]
+        self.config.import_vlan_views = True
+        self.config.import_vlans = True
+        self.job = InfobloxDataSource()
+        self.job.config = self.config
+        self.job.network_view_workers = 2
+        self.job.sync = None
+        self.job.logger = mock.Mock()
+
+    def test_is_partitioned(self):
+        self.assertTrue(self.job.is_partitioned())
+        self.job.network_view_workers = 1
+        self.assertFalse(self.job.is_partitioned())
+        self.job.network_view_workers = 2
+        self.config.infoblox_sync_filters = [{"network_view": "default"}]
+        self.assertFalse(self.job.is_partitioned())
+
+    def test_get_partition_configs(self):
+        configs = self.job.get_partition_configs()
+        self.assertEqual(
+            [config.infoblox_sync_filters for config in configs],
+            [[{"network_view": "default"}], [{"network_view": "dev", "prefixes_ipv4": ["10.0.0.0/8"]}]],
+        )
+        # VLANs are loaded by the first partition only.
+        self.assertEqual([config.import_vlans for config in configs], [True, False])
+        self.assertEqual([config.import_vlan_views for config in configs], [True, False])
+        # The job's config is left as is.
+        self.assertEqual(len(self.config.infoblox_sync_filters), 2)
+
+    def test_get_partition_configs_groups_sync_filters_by_network_view(self):
+        self.config.infoblox_sync_filters.append({"network_view": "dev", "prefixes_ipv6": ["2001:db8::/32"]})
+
+        configs = self.job.get_partition_configs()
+
+        self.assertEqual(
+            [config.infoblox_sync_filters for config in configs],
+            [
+                [{"network_view": "default"}],
+                [
+                    {"network_view": "dev", "prefixes_ipv4": ["10.0.0.0/8"]},
+                    {"network_view": "dev", "prefixes_ipv6": ["2001:db8::/32"]},
+                ],
+            ],
+        )
+        # Multiple sync filters of a single network view are synced together.
+        self.config.infoblox_sync_filters = self.config.infoblox_sync_filters[1:]
+        self.assertFalse(self.job.is_partitioned())
+
+    def test_combine_adapters(self):
+        adapters = []
+        for name in ["default", "dev"]:
+            adapter = NautobotAdapter(job=self.job, sync=None, config=self.config)
+            adapter.add(NautobotNamespace(name=name, ext_attrs={}))
+            adapters.append(adapter)
+        adapters[1].add(NautobotNamespace(name="default", ext_attrs={}))
+
+        combined = self.job._combine_adapters(  # pylint: disable=protected-access
+            NautobotAdapter(job=self.job, sync=None, config=self.config), adapters
+        )
+
+        self.assertEqual(sorted(obj.name for obj in combined.get_all("namespace")), ["default", "dev"])
+        self.job.logger.warning.assert_called_once()
+
+    def load_partitions(self):
+        with mock.patch.object(
+            self.job,
+            "get_infoblox_adapter",
+            side_effect=lambda config: PartitionAdapter(job=self.job, sync=None, config=config),
+        ), mock.patch("nautobot_ssot.integrations.infoblox.jobs.nautobot.NautobotAdapter", PartitionAdapter):
+            self.job.load_partitions()
+
+    def test_load_partitions(self):
+        self.load_partitions()
+
+        self.assertEqual(len(self.job.partitions), 2)
+        for source_adapter, target_adapter in self.job.partitions:
+            self.assertEqual(source_adapter.load_count, 1)
+            self.assertEqual(target_adapter.load_count, 1)
+        for combined in (self.job.source_adapter, self.job.target_adapter):
+            self.assertEqual(sorted(obj.name for obj in combined.get_all("namespace")), ["default", "dev"])
+            self.assertEqual([obj.name for obj in combined.get_all("vlangroup")], ["vlans"])
+        # VLANs are loaded by the first partition only, so they aren't reported as found in multiple network views.
+        for source_adapter, target_adapter in self.job.partitions[1:]:
+            self.assertEqual(source_adapter.get_all("vlangroup"), [])
+            self.assertEqual(target_adapter.get_all("vlangroup"), [])
+        self.job.logger.warning.assert_not_called()
+
+    def test_run_in_workers_raises_worker_exceptions(self):
+        def fail_on_dev(source_adapter, _target_adapter):
+            if source_adapter == "dev":
+                raise ValueError("Unable to load dev.")
+
+        with self.assertRaisesMessage(ValueError, "Unable to load dev."):
+            self.job._run_in_workers(fail_on_dev, [("default", None), ("dev", None)])  # pylint: disable=protected-access
+
+    def test_execute_sync_to_nautobot(self):
+        self.job.partitions = [(mock.Mock(), mock.Mock()), (mock.Mock(), mock.Mock())]
+
+        with mock.patch.object(self.job, "_run_in_workers") as run_in_workers:
+            self.job.execute_sync()
+
+        run_in_workers.assert_not_called()
+        for source_adapter, target_adapter in self.job.partitions:
+            source_adapter.sync_to.assert_called_once_with(target_adapter, flags=DiffSyncFlags.CONTINUE_ON_FAILURE)
+
+    def test_execute_sync_to_infoblox(self):
+        job = InfobloxDataTarget()
+        job.config = self.config
+        job.network_view_workers = 2
+        job.partitions = [(mock.Mock(), mock.Mock()), (mock.Mock(), mock.Mock())]
+        Tag.objects.filter(name="SSoT Synced to Infoblox").delete()
+        CustomField.objects.filter(key="ssot_synced_to_infoblox").delete()
+
+        job.execute_sync()
+
+        for source_adapter, target_adapter in job.partitions:
+            source_adapter.sync_to.assert_called_once_with(target_adapter, flags=DiffSyncFlags.CONTINUE_ON_FAILURE)
+        # Created before the workers start, so that they don't race to create them.
+        self.assertTrue(Tag.objects.filter(name="SSoT Synced to Infoblox").exists())
+        self.assertTrue(CustomField.objects.filter(key="ssot_synced_to_infoblox").exists())
+
+    def test_execute_sync_raises_worker_exceptions(self):
+        job = InfobloxDataTarget()
+        job.config = self.config
+        job.network_view_workers = 2
+        job.partitions = [(mock.Mock(), mock.Mock()), (mock.Mock(), mock.Mock())]
+        job.partitions[1][0].sync_to.side_effect = ValueError("Unable to sync dev.")
+
+        with self.assertRaisesMessage(ValueError, "Unable to sync dev."):
+            job.execute_sync()
+        job.partitions[0][0].sync_to.assert_called_once()
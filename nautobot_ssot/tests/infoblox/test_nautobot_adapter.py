@@ -246,6 +246,18 @@ class TestNautobotAdapter(TestCase):
         prefix_with_ranges = self.nb_adapter.get("prefix", {"network": "10.0.0.0/24", "namespace": "Global"})
         self.assertEqual(["10.0.0.50-10.0.0.254"], prefix_with_ranges.ranges)
 
+    def test_load_prefixes_query_count(self):
+        """Validate that the number of queries doesn't depend on the number of filters and prefixes."""
+        sync_filters = [
+            {"network_view": "default"},
+            {"network_view": "dev", "prefixes_ipv4": ["10.0.0.0/16", "10.2.0.0/16"]},
+            {"network_view": "test", "prefixes_ipv4": ["10.0.0.0/8"]},
+        ]
+        # Custom fields, Prefix -> VLAN associations, VLANs and prefixes.
+        with self.assertNumQueries(4):
+            self.nb_adapter.load_prefixes(include_ipv4=True, include_ipv6=False, sync_filters=sync_filters)
+        self.assertEqual(len(self.nb_adapter.get_all("prefix")), 6)
+
     def test_load_ipaddresses_loads_ips_default_namespace(self):
         sync_filters = [{"network_view": "default"}]
         self.nb_adapter.load_ipaddresses(sync_filters=sync_filters, include_ipv4=True, include_ipv6=False)
@@ -314,6 +326,22 @@ class TestNautobotAdapter(TestCase):
             },
         )
 
+    def test_load_ipaddresses_query_count(self):
+        """Validate that the number of queries doesn't depend on the number of filters and IP addresses."""
+        self.config.dns_record_type = DNSRecordTypeChoices.A_AND_PTR_RECORD
+        nb_adapter = NautobotAdapter(config=self.config)
+        nb_adapter.job = mock.Mock()
+        sync_filters = [
+            {"network_view": "default"},
+            {"network_view": "dev", "prefixes_ipv4": ["10.0.0.0/16", "10.2.0.0/16"]},
+            {"network_view": "test", "prefixes_ipv4": ["10.0.0.0/8"]},
+        ]
+        # Custom fields and IP addresses.
+        with self.assertNumQueries(2):
+            nb_adapter.load_ipaddresses(include_ipv4=True, include_ipv6=False, sync_filters=sync_filters)
+        self.assertEqual(len(nb_adapter.get_all("ipaddress")), 6)
+        self.assertEqual(len(nb_adapter.get_all("dnsarecord")), 6)
+
     def test_load_ipaddresses_load_host_records(self):
         self.config.dns_record_type = DNSRecordTypeChoices.HOST_RECORD
         nb_adapter = NautobotAdapter(config=self.config)
@@ -16,6 +16,7 @@ from nautobot_ssot.integrations.infoblox.choices import (
 )
 from nautobot_ssot.integrations.infoblox.diffsync.adapters.infoblox import InfobloxAdapter
 from nautobot_ssot.integrations.infoblox.diffsync.adapters.nautobot import NautobotAdapter
+from nautobot_ssot.integrations.infoblox.diffsync.models.nautobot import process_ext_attrs
 from nautobot_ssot.tests.infoblox.fixtures_infoblox import create_default_infoblox_config, create_prefix_relationship
 
 
@@ -181,6 +182,26 @@ class TestModelNautobotNetwork(TestCase):
         self.assertIn(self.tag_sync_from_infoblox, prefix.tags.all())
 
 
+class TestProcessExtAttrs(TestCase):
+    """Tests Extensibility Attributes are processed into Custom Fields."""
+
+    def test_process_ext_attrs_creates_custom_field_once(self):
+        """Validate the Custom Field is created for the first object only."""
+        adapter = Mock(ext_attr_custom_fields=None)
+        prefix_1 = Prefix(prefix="10.0.0.0/24")
+        prefix_2 = Prefix(prefix="10.0.1.0/24")
+
+        process_ext_attrs(adapter=adapter, obj=prefix_1, extattrs={"Building-Name": "HQ"})
+        with self.assertNumQueries(0):
+            process_ext_attrs(adapter=adapter, obj=prefix_2, extattrs={"Building-Name": "Branch"})
+
+        custom_field = CustomField.objects.get(key="building_name")
+        self.assertEqual(custom_field.label, "Building-Name")
+        self.assertIn(ContentType.objects.get_for_model(Prefix), custom_field.content_types.all())
+        self.assertEqual(prefix_1.custom_field_data, {"building_name": "HQ"})
+        self.assertEqual(prefix_2.custom_field_data, {"building_name": "Branch"})
+
+
 class TestModelNautobotIPAddress(TestCase):
     """Tests correct IP address record is created or updated."""
 
@@ -17,6 +17,7 @@ from nautobot_ssot.integrations.infoblox.utils.diffsync import (
     validate_dns_name,
 )
 from nautobot_ssot.integrations.infoblox.utils.nautobot import build_vlan_map_from_relations
+from nautobot_ssot.integrations.infoblox.utils.prefix_tree import PrefixTree
 
 
 class TestUtils(unittest.TestCase):
@@ -209,3 +210,40 @@ class TestNautobotUtils(TestCase):
             },
         }
         self.assertEqual(actual, expected)
+
+
+class TestPrefixTree(unittest.TestCase):
+    """Test infoblox.utils.prefix_tree.py."""
+
+    def setUp(self):
+        self.tree = PrefixTree()
+        for network in ["10.0.0.0/8", "10.0.0.0/16", "10.0.1.0/24", "10.1.0.0/16", "172.16.0.0/12", "11.0.0.0/24"]:
+            self.tree.add(network, network)
+
+    def test_get(self):
+        """Test networks are only returned on exact matches."""
+        self.assertEqual(self.tree.get("10.0.0.0/16"), "10.0.0.0/16")
+        self.assertIsNone(self.tree.get("10.0.0.0/24"))
+        self.assertEqual(len(self.tree), 6)
+
+    def test_subnets(self):
+        """Test the networks within a network are returned, including the network itself."""
+        self.assertEqual(
+            list(self.tree.subnets("10.0.0.0/8")), ["10.0.0.0/16", "10.0.0.0/8", "10.0.1.0/24", "10.1.0.0/16"]
+        )
+        self.assertEqual(list(self.tree.subnets("10.0.0.0/16")), ["10.0.0.0/16", "10.0.1.0/24"])
+        self.assertEqual(list(self.tree.subnets("10.2.0.0/16")), [])
+
+    def test_subnets_after_add(self):
+        """Test networks added after a query are found by later queries."""
+        list(self.tree.subnets("10.0.0.0/8"))
+        self.tree.add("10.2.0.0/16", "10.2.0.0/16")
+        self.assertIn("10.2.0.0/16", list(self.tree.subnets("10.0.0.0/8")))
+
+    def test_ipv6(self):
+        """Test IPv6 networks are indexed like IPv4 networks."""
+        tree = PrefixTree()
+        tree.add("2001:5b0:4100::/40", "container")
+        tree.add("2001:5b0:4100::/48", "subnet")
+        tree.add("2001:5b0:5000::/48", "other")
+        self.assertEqual(list(tree.subnets("2001:5b0:4100::/40")), ["subnet", "container"])
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock, patch
 
 from nautobot.extras.models import JobResult
 
-from nautobot_ssot.integrations.ipfabric.diffsync.adapter_ipfabric import IPFabricDiffSync
+from nautobot_ssot.integrations.ipfabric.diffsync.adapter_ipfabric import IPFabricDiffSync, iter_table
 from nautobot_ssot.integrations.ipfabric.jobs import IpFabricDataSource
 
 
@@ -24,6 +24,15 @@ NETWORKS_FIXTURE = [{"net": "10.255.254.0/23", "siteName": "site1"}, {"net": "17
 STACKS_FIXTURE = load_json("./nautobot_ssot/tests/ipfabric/fixtures/get_stack_members.json")
 
 
+def paged(rows):
+    """Return a mock of the `fetch` method of an IP Fabric table holding `rows`."""
+
+    def fetch(columns=None, limit=1000, start=0, **kwargs):  # pylint: disable=unused-argument
+        return [{column: row.get(column) for column in columns} for row in rows[start : start + limit]]
+
+    return fetch
+
+
 class IPFabricDiffSyncTestCase(TestCase):
     """Test the IPFabricDiffSync adapter class."""
 
@@ -32,20 +41,19 @@ class IPFabricDiffSyncTestCase(TestCase):
         # Create a mock client
         ipfabric_client = MagicMock()
         ipfabric_client.inventory.sites.all.return_value = SITE_FIXTURE
-        ipfabric_client.inventory.devices.all.return_value = DEVICE_INVENTORY_FIXTURE
-        ipfabric_client.fetch_all = MagicMock(
-            side_effect=(lambda x: VLAN_FIXTURE if x == "tables/vlan/site-summary" else "")
+        ipfabric_client.inventory.devices.fetch.side_effect = paged(DEVICE_INVENTORY_FIXTURE)
+        ipfabric_client.fetch.side_effect = lambda url, **kwargs: (
+            paged(VLAN_FIXTURE)(**kwargs) if url == "tables/vlan/site-summary" else []
         )
-        ipfabric_client.inventory.interfaces.all.return_value = INTERFACE_FIXTURE
+        ipfabric_client.inventory.interfaces.fetch.side_effect = paged(INTERFACE_FIXTURE)
         ipfabric_client.technology.managed_networks.networks.all.return_value = NETWORKS_FIXTURE
-        ipfabric_client.technology.platforms.stacks_members.all.side_effect = [[] for site in SITE_FIXTURE[:-1]] + [
-            STACKS_FIXTURE
-        ]
+        ipfabric_client.technology.platforms.stacks_members.all.return_value = STACKS_FIXTURE
 
         job = IpFabricDataSource()
         job.job_result = JobResult.objects.create(name=job.class_path, task_name="fake task", worker="default")
         self.ipfabric = IPFabricDiffSync(job=job, sync=None, client=ipfabric_client)
         self.ipfabric.load()
+        self.ipfabric_client = ipfabric_client
 
     def test_data_loading(self):
         """Test the load() function."""
@@ -119,6 +127,7 @@ class IPFabricDiffSyncTestCase(TestCase):
 
     def test_data_loading_stacks(self):
         """Test the load() function loads stack switches."""
+        self.ipfabric_client.technology.platforms.stacks_members.all.assert_called_once()
         stack_members = [dev for dev in self.ipfabric.get_all("device") if dev.location_name == "stack"]
         self.assertEqual(len(stack_members), 3)
         stack = self.ipfabric.get("device", {"name": "stack"})
@@ -142,3 +151,89 @@ class IPFabricDiffSyncTestCase(TestCase):
         self.assertEqual(stack.serial_number, "stack4")
         self.assertEqual(stack.model, "ws-3850-b")
         self.assertFalse(stack.vc_master)
+
+
+def synthetic_inventory(sites=50, devices_per_site=10, interfaces_per_device=20):
+    """Return a mock IP Fabric client with a synthetic inventory of the given size."""
+    site_rows, device_rows, interface_rows, vlan_rows, network_rows = [], [], [], [], []
+    for site_index in range(sites):
+        site_name = f"site{site_index}"
+        site_rows.append({"siteName": site_name, "id": str(site_index)})
+        vlan_rows.append({"siteName": site_name, "vlanId": 10, "vlanName": f"vlan10-{site_name}", "dscr": ""})
+        network_rows.append({"net": f"10.{site_index}.0.0/16", "siteName": site_name})
+        for device_index in range(devices_per_site):
+            hostname = f"{site_name}-dev{device_index}"
+            login_ip = f"10.{site_index}.{device_index}.1"
+            device_rows.append(
+                {
+                    "hostname": hostname,
+                    "siteName": site_name,
+                    "sn": hostname,
+                    "vendor": "cisco",
+                    "model": "c9300",
+                    "devType": "switch",
+                    "family": "ios",
+                    "loginIp": login_ip,
+                }
+            )
+            for interface_index in range(interfaces_per_device):
+                interface_rows.append(
+                    {
+                        "hostname": hostname,
+                        "intName": f"Ethernet{interface_index}",
+                        "primaryIp": login_ip if interface_index == 0 else None,
+                    }
+                )
+    client = MagicMock()
+    client.inventory.sites.all.return_value = site_rows
+    client.inventory.devices.fetch.side_effect = paged(device_rows)
+    client.inventory.interfaces.fetch.side_effect = paged(interface_rows)
+    client.fetch.side_effect = (
+        lambda url, **kwargs: paged(vlan_rows)(**kwargs) if url == "tables/vlan/site-summary" else []
+    )
+    client.technology.managed_networks.networks.all.return_value = network_rows
+    client.technology.platforms.stacks_members.all.return_value = []
+    return client
+
+
+class IPFabricDiffSyncScaleTestCase(TestCase):
+    """Test loading a larger synthetic inventory with the IPFabricDiffSync adapter class."""
+
+    def test_load_groups_inventory(self):
+        """Test that sites, devices and interfaces are matched up when loading many of them."""
+        job = IpFabricDataSource()
+        job.job_result = JobResult.objects.create(name=job.class_path, task_name="fake task", worker="default")
+        ipfabric = IPFabricDiffSync(job=job, sync=None, client=synthetic_inventory())
+        ipfabric.load()
+
+        self.assertEqual(len(ipfabric.get_all("location")), 50)
+        self.assertEqual(len(ipfabric.get_all("device")), 500)
+        self.assertEqual(len(ipfabric.get_all("interface")), 10000)
+        self.assertEqual(len(ipfabric.get_all("vlan")), 50)
+        location = ipfabric.get("location", "site7")
+        self.assertEqual(len(location.devices), 10)
+        self.assertEqual(len(location.vlans), 1)
+        device = ipfabric.get("device", "site7-dev3")
+        self.assertEqual(len(device.interfaces), 20)
+        interface = ipfabric.get("interface", {"name": "Ethernet0", "device_name": "site7-dev3"})
+        self.assertEqual(interface.subnet_mask, "255.255.0.0")
+        self.assertTrue(interface.ip_is_primary)
+
+
+class IterTableTestCase(TestCase):
+    """Test fetching IP Fabric tables page by page."""
+
+    def test_iter_table(self):
+        rows = [{"hostname": f"device{index}", "sn": str(index)} for index in range(25)]
+        fetch = MagicMock(side_effect=paged(rows))
+        result = iter_table(fetch, ["hostname"], page_size=10)
+        # Nothing is fetched until the rows are consumed.
+        fetch.assert_not_called()
+        self.assertEqual(list(result), [{"hostname": row["hostname"]} for row in rows])
+        self.assertEqual([call.kwargs["start"] for call in fetch.call_args_list], [0, 10, 20])
+        self.assertTrue(all(call.kwargs["columns"] == ["hostname"] for call in fetch.call_args_list))
+
+    def test_iter_table_full_last_page(self):
+        fetch = MagicMock(side_effect=paged([{"hostname": str(index)} for index in range(20)]))
+        self.assertEqual(len(list(iter_table(fetch, ["hostname"], page_size=10))), 20)
+        self.assertEqual(fetch.call_count, 3)
@@ -146,3 +146,41 @@ class TestNautobotAdapter(TestCase):
             self.assertEqual(device.status, "Active")
             self.assertEqual(device.vc_priority, int(device.name[-1]))
             self.assertEqual(device.vc_position, int(device.name[-1]))
+
+    def test_batched_interface_writes(self):
+        """Test that new interfaces are queued by `Interface.create` and created once the sync is complete."""
+        self.nb_adapter.batched_writes = True
+        device = Device.objects.get(name="dev1")
+        device.tags.add(self.nb_adapter.get_tag())
+        device.interfaces.create(name="Ethernet1", status=Status.objects.get(name="Active"))
+        attrs = {
+            "description": "",
+            "enabled": True,
+            "mac_address": None,
+            "mtu": 1500,
+            "type": "1000base-t",
+            "mgmt_only": False,
+            "ip_address": None,
+            "subnet_mask": None,
+            "ip_is_primary": False,
+            "status": "Active",
+        }
+        for name in ["Ethernet1", "Ethernet2"]:
+            self.nb_adapter.interface.create(self.nb_adapter, {"name": name, "device_name": "dev1"}, dict(attrs))
+        self.nb_adapter.interface.create(
+            self.nb_adapter, {"name": "Ethernet3", "device_name": "dev1"}, {**attrs, "status": "Unknown"}
+        )
+        self.assertEqual(len(self.nb_adapter.pending_interfaces), 3)
+        self.assertFalse(device.interfaces.filter(name="Ethernet2").exists())
+
+        self.nb_adapter.sync_complete(source=None, diff=None)
+
+        self.assertEqual(self.nb_adapter.pending_interfaces, [])
+        self.assertEqual(device.interfaces.filter(name__in=["Ethernet1", "Ethernet2"]).count(), 2)
+        self.assertEqual(device.interfaces.get(name="Ethernet2").mac_address, "00:00:00:00:00:01")
+        self.assertTrue(device.interfaces.get(name="Ethernet2").tags.filter(name="SSoT Synced from IPFabric").exists())
+        # Interfaces that can't be created are logged, as they were already counted as created when queued.
+        self.assertFalse(device.interfaces.filter(name="Ethernet3").exists())
+        self.nb_adapter.job.logger.error.assert_any_call(
+            "Unable to create an Interface named Ethernet3 on a Device named dev1"
+        )
@@ -5,15 +5,18 @@ import unittest
 from django.contrib.contenttypes.models import ContentType
 from django.core.exceptions import ValidationError
 from django.db import Error as DjangoBaseDBError
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from nautobot.core.choices import ColorChoices
 from nautobot.dcim.models import DeviceType, Location, LocationType, Manufacturer, Platform
 from nautobot.dcim.models.devices import Device
-from nautobot.extras.models import Role
+from nautobot.extras.models import Role, Tag
 from nautobot.extras.models.statuses import Status
 from nautobot.ipam.models import VLAN, IPAddress, Prefix, get_default_namespace
 
 from nautobot_ssot.integrations.ipfabric.utilities import (
+    bulk_create_interfaces,
     create_device_type_object,
     create_ip,
     create_location,
@@ -781,3 +784,146 @@ class TestNautobotUtils(TestCase):
     #     interface_details = {"name": "Test-Interface"}
     #     test_interface = create_interface(self.device, interface_details)
     #     self.assertEqual(test_interface.id, self.device.interfaces.get(name="Test-Interface").id)
+
+    def test_bulk_create_interfaces(self):
+        """Test `bulk_create_interfaces` Utility."""
+        tag = Tag.objects.create(name="SSoT Synced from IPFabric")
+        pending = [
+            (
+                self.device,
+                {
+                    "name": "Ethernet1",
+                    "type": "1000base-t",
+                    "ip_address": "192.168.0.1",
+                    "subnet_mask": "255.255.255.255",
+                },
+            ),
+            (
+                self.device,
+                {
+                    "name": "Ethernet2",
+                    "ip_address": "192.168.1.10",
+                    "subnet_mask": "255.255.255.0",
+                    "ip_is_primary": True,
+                    "mtu": 9000,
+                    "description": "uplink",
+                    "type": "1000base-t",
+                },
+            ),
+            (
+                self.device,
+                {"name": "Ethernet3", "type": "1000base-t", "ip_address": "10.1.1.1", "subnet_mask": "255.255.255.255"},
+            ),
+            (self.device, {"name": "Ethernet4", "type": "virtual", "ip_address": None, "subnet_mask": None}),
+        ]
+
+        interfaces = bulk_create_interfaces(pending, tag=tag)
+
+        self.assertEqual(
+            [interface.name for interface in interfaces], ["Ethernet1", "Ethernet2", "Ethernet3", "Ethernet4"]
+        )
+        ethernet1 = self.device.interfaces.get(name="Ethernet1")
+        # Existing IP addresses with the same mask and status are reused.
+        self.assertEqual(list(ethernet1.ip_addresses.all()), [self.ip_address])
+        ethernet2 = self.device.interfaces.get(name="Ethernet2")
+        self.assertEqual(ethernet2.mtu, 9000)
+        self.assertEqual(ethernet2.description, "uplink")
+        ip_address = ethernet2.ip_addresses.get()
+        self.assertEqual(str(ip_address.address), "192.168.1.10/24")
+        self.assertEqual(ip_address.parent, self.prefix)
+        self.device.refresh_from_db()
+        self.assertEqual(self.device.primary_ip4, ip_address)
+        # IPv4 addresses without a parent prefix are created under 0.0.0.0/0.
+        ip_address = self.device.interfaces.get(name="Ethernet3").ip_addresses.get()
+        self.assertEqual(str(ip_address.parent.prefix), "0.0.0.0/0")
+        self.assertFalse(self.device.interfaces.get(name="Ethernet4").ip_addresses.exists())
+        for interface in self.device.interfaces.filter(name__startswith="Ethernet"):
+            self.assertIn(tag, interface.tags.all())
+            self.assertEqual(interface.cf["system_of_record"], "IPFabric")
+        self.assertIn(tag, self.ip_address.tags.all())
+
+    def test_bulk_create_interfaces_primary_ip_after_interface_without_ip(self):
+        """Test that `bulk_create_interfaces` sets the primary IP of the interface it belongs to."""
+        tag = Tag.objects.create(name="SSoT Synced from IPFabric")
+        pending = [
+            (self.device, {"name": "Loopback0", "type": "virtual", "ip_address": None, "subnet_mask": None}),
+            (
+                self.device,
+                {
+                    "name": "Ethernet1",
+                    "type": "1000base-t",
+                    "ip_address": "192.168.1.10",
+                    "subnet_mask": "255.255.255.0",
+                    "ip_is_primary": True,
+                },
+            ),
+            (
+                self.device,
+                {
+                    "name": "Ethernet2",
+                    "type": "1000base-t",
+                    "ip_address": "192.168.2.10",
+                    "subnet_mask": "255.255.255.0",
+                },
+            ),
+        ]
+
+        bulk_create_interfaces(pending, tag=tag)
+
+        self.device.refresh_from_db()
+        self.assertEqual(str(self.device.primary_ip4.address), "192.168.1.10/24")
+
+    def test_bulk_create_interfaces_same_host_different_masks(self):
+        """Test that `bulk_create_interfaces` creates an IP address once per parent and host."""
+        tag = Tag.objects.create(name="SSoT Synced from IPFabric")
+        logger = unittest.mock.Mock()
+        pending = [
+            (
+                self.device,
+                {"name": name, "type": "1000base-t", "ip_address": "192.168.1.20", "subnet_mask": subnet_mask},
+            )
+            for name, subnet_mask in [
+                ("Ethernet1", "255.255.255.0"),
+                ("Ethernet2", "255.255.255.255"),
+                ("Ethernet3", "255.255.255.0"),
+            ]
+        ]
+
+        interfaces = bulk_create_interfaces(pending, tag=tag, logger=logger)
+
+        self.assertEqual(len(interfaces), 3)
+        ip_address = IPAddress.objects.get(host="192.168.1.20")
+        self.assertEqual(str(ip_address.address), "192.168.1.20/24")
+        self.assertEqual(list(self.device.interfaces.get(name="Ethernet1").ip_addresses.all()), [ip_address])
+        self.assertEqual(list(self.device.interfaces.get(name="Ethernet3").ip_addresses.all()), [ip_address])
+        self.assertFalse(self.device.interfaces.get(name="Ethernet2").ip_addresses.exists())
+        logger.error.assert_any_call("Unable to create a new IPAddress of 192.168.1.20/32")
+        logger.error.assert_any_call(
+            "Unable to assign an IPAddress to an Interface named Ethernet2 on a Device named "
+            f"{self.device.name} because of a failure to get or create an IPAddress of 192.168.1.20/255.255.255.255"
+        )
+
+    def test_bulk_create_interfaces_query_count(self):
+        """Test that `bulk_create_interfaces` doesn't query the database per interface."""
+        tag = Tag.objects.create(name="SSoT Synced from IPFabric")
+
+        def pending(prefix, count):
+            return [
+                (
+                    self.device,
+                    {
+                        "name": f"{prefix}{index}",
+                        "type": "1000base-t",
+                        "ip_address": f"192.168.{len(prefix)}.{index + 1}",
+                        "subnet_mask": "255.255.255.0",
+                    },
+                )
+                for index in range(count)
+            ]
+
+        with CaptureQueriesContext(connection) as few:
+            bulk_create_interfaces(pending("Ethernet", 5), tag=tag)
+        with CaptureQueriesContext(connection) as many:
+            bulk_create_interfaces(pending("GigabitEthernet", 50), tag=tag)
+        self.assertEqual(len(few), len(many))
+        self.assertEqual(self.device.interfaces.filter(ip_addresses__isnull=False).count(), 55)
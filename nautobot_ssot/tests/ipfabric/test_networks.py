@@ -0,0 +1,52 @@
+"""Tests for IPFabric utilities.networks."""
+
+import ipaddress
+
+from django.test import SimpleTestCase
+
+from nautobot_ssot.integrations.ipfabric.utilities.networks import ManagedNetworks, NetworkIndex
+
+
+class TestNetworkIndex(SimpleTestCase):
+    """Test the longest prefix match of NetworkIndex."""
+
+    def setUp(self):
+        self.index = NetworkIndex()
+        for network in ["10.0.0.0/8", "10.1.0.0/16", "10.1.2.0/24", "0.0.0.0/0", "2001:db8::/32", "2001:db8:1::/48"]:
+            self.index.add(ipaddress.ip_network(network))
+
+    def test_lookup_longest_match(self):
+        self.assertEqual(self.index.lookup("10.1.2.3"), ipaddress.ip_network("10.1.2.0/24"))
+        self.assertEqual(self.index.lookup("10.1.3.3"), ipaddress.ip_network("10.1.0.0/16"))
+        self.assertEqual(self.index.lookup("10.2.0.1"), ipaddress.ip_network("10.0.0.0/8"))
+        self.assertEqual(self.index.lookup("192.168.0.1"), ipaddress.ip_network("0.0.0.0/0"))
+
+    def test_lookup_ipv6(self):
+        self.assertEqual(self.index.lookup("2001:db8:1::1"), ipaddress.ip_network("2001:db8:1::/48"))
+        self.assertEqual(self.index.lookup("2001:db8:2::1"), ipaddress.ip_network("2001:db8::/32"))
+        self.assertIsNone(self.index.lookup("2001:db9::1"))
+
+    def test_lookup_after_add(self):
+        self.assertEqual(self.index.lookup("10.1.2.130"), ipaddress.ip_network("10.1.2.0/24"))
+        self.index.add(ipaddress.ip_network("10.1.2.128/25"))
+        self.assertEqual(self.index.lookup("10.1.2.130"), ipaddress.ip_network("10.1.2.128/25"))
+        self.assertEqual(len(self.index), 7)
+
+    def test_host_network(self):
+        self.index.add(ipaddress.ip_network("10.1.2.3/32"))
+        self.assertEqual(self.index.lookup("10.1.2.3"), ipaddress.ip_network("10.1.2.3/32"))
+
+
+class TestManagedNetworks(SimpleTestCase):
+    """Test the per-site lookups of ManagedNetworks."""
+
+    def test_lookup_prefers_site(self):
+        networks = ManagedNetworks()
+        networks.add("site1", ipaddress.ip_network("10.0.0.0/16"))
+        networks.add("site2", ipaddress.ip_network("10.0.1.0/24"))
+        self.assertEqual(networks.lookup("site1", "10.0.1.1"), ipaddress.ip_network("10.0.0.0/16"))
+        self.assertEqual(networks.lookup("site2", "10.0.1.1"), ipaddress.ip_network("10.0.1.0/24"))
+        # Addresses outside the networks of their site fall back to the networks of all sites.
+        self.assertEqual(networks.lookup("site2", "10.0.2.1"), ipaddress.ip_network("10.0.0.0/16"))
+        self.assertEqual(networks.lookup("site3", "10.0.1.1"), ipaddress.ip_network("10.0.1.0/24"))
+        self.assertIsNone(networks.lookup("site1", "192.168.0.1"))
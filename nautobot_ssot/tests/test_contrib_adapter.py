@@ -1,5 +1,6 @@
 """Tests for contrib.NautobotAdapter."""
 
+from types import SimpleNamespace
 from typing import List
 from unittest import skip
 from unittest.mock import MagicMock
@@ -9,6 +10,7 @@ from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.db import connection
 from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
 from nautobot.circuits import models as circuits_models
 from nautobot.core.testing import TestCase
 from nautobot.dcim import models as dcim_models
@@ -19,6 +21,7 @@ from nautobot.tenancy import models as tenancy_models
 from typing_extensions import Annotated, TypedDict
 
 from nautobot_ssot.contrib import CustomFieldAnnotation, NautobotAdapter, NautobotModel
+from nautobot_ssot.snapshots import dump_adapter
 from nautobot_ssot.tests.contrib_base_classes import (
     NautobotCable,
     NautobotDevice,
@@ -208,6 +211,187 @@ class NautobotAdapterTests(TestCase):
         self.assertEqual(new_tenant_name, diffsync_tenant.name)
 
 
+class NautobotAdapterQueryCountTests(TestCase):
+    """Test that the 'NautobotAdapter' loads data with a fixed number of queries."""
+
+    @staticmethod
+    def _create_tenants(amount):
+        tags = [extras_models.Tag.objects.create(name=f"Tag {i}") for i in range(2)]
+        for tag in tags:
+            tag.content_types.set([ContentType.objects.get_for_model(tenancy_models.Tenant)])
+        for i in range(amount):
+            tenant_group = tenancy_models.TenantGroup.objects.create(name=f"Group {i}")
+            for j in range(amount):
+                tenant = tenancy_models.Tenant.objects.create(name=f"Tenant {i}-{j}", tenant_group=tenant_group)
+                tenant.tags.set(tags)
+
+    def _count_load_queries(self):
+        adapter = TestAdapter(job=MagicMock())
+        with CaptureQueriesContext(connection) as ctx:
+            adapter.load()
+        return adapter, len(ctx.captured_queries)
+
+    def test_load_query_count_is_constant(self):
+        """Test that the number of queries doesn't depend on the number of objects, including children."""
+        self._create_tenants(1)
+        _, small_query_count = self._count_load_queries()
+        tenancy_models.Tenant.objects.all().delete()
+        tenancy_models.TenantGroup.objects.all().delete()
+        extras_models.Tag.objects.all().delete()
+
+        self._create_tenants(5)
+        adapter, large_query_count = self._count_load_queries()
+
+        self.assertEqual(small_query_count, large_query_count)
+        self.assertEqual(25, len(adapter.get_all("tenant")))
+        diffsync_tenant = adapter.get(NautobotTenant, "Tenant 3-4")
+        self.assertEqual("Group 3", diffsync_tenant.tenant_group__name)
+        self.assertEqual(["Tag 0", "Tag 1"], sorted(tag["name"] for tag in diffsync_tenant.tags))
+
+    def test_overridden_get_queryset_is_respected(self):
+        """Test that columns aren't restricted if the queryset already defers fields."""
+
+        class TenantModel(NautobotModel):
+            """Test model with a 'get_queryset' that defers fields."""
+
+            _model = tenancy_models.Tenant
+            _modelname = "tenant"
+            _identifiers = ("name",)
+            _attributes = ("description",)
+
+            name: str
+            description: str
+
+            @classmethod
+            def get_queryset(cls):
+                return tenancy_models.Tenant.objects.defer("comments")
+
+        class Adapter(NautobotAdapter):
+            """Test adapter."""
+
+            top_level = ("tenant",)
+            tenant = TenantModel
+
+        tenancy_models.Tenant.objects.create(name="Test", description="Test Description")
+        adapter = Adapter(job=MagicMock())
+        queryset = adapter._optimize_queryset(TenantModel, TenantModel._get_queryset())  # pylint: disable=protected-access
+        self.assertEqual((frozenset({"comments"}), True), queryset.query.deferred_loading)
+        adapter.load()
+        self.assertEqual("Test Description", adapter.get(TenantModel, "Test").description)
+
+
+class IncrementalTestAdapter(TestAdapter):
+    """Test adapter with incremental loading enabled."""
+
+    incremental_load = True
+
+
+class NautobotAdapterIncrementalLoadTests(TestCase):
+    """Test incremental loading through the 'NautobotAdapter'."""
+
+    def setUp(self):
+        for i in range(3):
+            tenant_group = tenancy_models.TenantGroup.objects.create(name=f"Group {i}", description="Original")
+            for j in range(2):
+                tenancy_models.Tenant.objects.create(
+                    name=f"Tenant {i}-{j}", tenant_group=tenant_group, description="Original"
+                )
+        adapter = TestAdapter(job=MagicMock())
+        adapter.load()
+        self.snapshot = SimpleNamespace(watermark=timezone.now(), data=dump_adapter(adapter))
+        # Mark the objects in the snapshot, so that restored objects can be told apart from loaded ones.
+        for objects in self.snapshot.data.values():
+            for fields in objects.values():
+                fields["description"] = "Snapshot"
+
+    def _load_incrementally(self):
+        job = MagicMock()
+        job.get_incremental_snapshot.return_value = self.snapshot
+        adapter = IncrementalTestAdapter(job=job)
+        adapter.load()
+        job.get_incremental_snapshot.assert_called_once_with(adapter)
+        return adapter
+
+    def test_unchanged_objects_are_restored(self):
+        adapter = self._load_incrementally()
+        self.assertEqual(3, len(adapter.get_all("tenant_group")))
+        self.assertEqual(6, len(adapter.get_all("tenant")))
+        self.assertEqual("Snapshot", adapter.get(NautobotTenantGroup, "Group 0").description)
+        self.assertEqual("Snapshot", adapter.get(NautobotTenant, "Tenant 0-0").description)
+        self.assertEqual(["Tenant 0-0", "Tenant 0-1"], adapter.get(NautobotTenantGroup, "Group 0").tenants)
+
+    def test_changed_objects_are_loaded(self):
+        tenant_group = tenancy_models.TenantGroup.objects.get(name="Group 0")
+        tenant_group.description = "Changed"
+        tenant_group.save()
+        tenant = tenancy_models.Tenant.objects.get(name="Tenant 1-0")
+        tenant.description = "Changed"
+        tenant.save()
+        new_tenant_group = tenancy_models.TenantGroup.objects.create(name="Group 3", description="New")
+        tenancy_models.Tenant.objects.create(name="Tenant 3-0", tenant_group=new_tenant_group, description="New")
+
+        adapter = self._load_incrementally()
+        self.assertEqual("Changed", adapter.get(NautobotTenantGroup, "Group 0").description)
+        self.assertEqual("Original", adapter.get(NautobotTenant, "Tenant 0-0").description)
+        # A changed child causes its parent to be loaded as well, including all of its children.
+        self.assertEqual("Changed", adapter.get(NautobotTenant, "Tenant 1-0").description)
+        self.assertEqual("Original", adapter.get(NautobotTenantGroup, "Group 1").description)
+        self.assertEqual("New", adapter.get(NautobotTenant, "Tenant 3-0").description)
+        self.assertEqual(["Tenant 3-0"], adapter.get(NautobotTenantGroup, "Group 3").tenants)
+        self.assertEqual("Snapshot", adapter.get(NautobotTenantGroup, "Group 2").description)
+
+    def test_changed_foreign_key_is_loaded(self):
+        class TenantModel(NautobotModel):
+            """Test model with a foreign key."""
+
+            _model = tenancy_models.Tenant
+            _modelname = "tenant"
+            _identifiers = ("name",)
+            _attributes = ("tenant_group__name",)
+
+            name: str
+            tenant_group__name: str
+
+        class Adapter(NautobotAdapter):
+            """Test adapter with incremental loading enabled."""
+
+            top_level = ("tenant",)
+            tenant = TenantModel
+            incremental_load = True
+
+        job = MagicMock()
+        job.get_incremental_snapshot.return_value = SimpleNamespace(
+            watermark=self.snapshot.watermark,
+            data={"tenant": {"Tenant 0-0": {"name": "Tenant 0-0", "tenant_group__name": "Group 0"}}},
+        )
+        tenant_group = tenancy_models.TenantGroup.objects.get(name="Group 1")
+        tenant_group.name = "Renamed"
+        tenant_group.save()
+        adapter = Adapter(job=job)
+        adapter.load()
+        self.assertEqual("Renamed", adapter.get(TenantModel, "Tenant 1-0").tenant_group__name)
+        self.assertEqual(3, len(adapter.get_all("tenant")))
+
+    def test_deleted_objects_are_not_restored(self):
+        tenancy_models.Tenant.objects.get(name="Tenant 2-1").delete()
+        tenancy_models.Tenant.objects.filter(tenant_group__name="Group 1").delete()
+        tenancy_models.TenantGroup.objects.get(name="Group 1").delete()
+
+        adapter = self._load_incrementally()
+        self.assertEqual(["Group 0", "Group 2"], sorted(group.name for group in adapter.get_all("tenant_group")))
+        self.assertEqual(3, len(adapter.get_all("tenant")))
+        self.assertIsNone(adapter.get_or_none(NautobotTenant, "Tenant 2-1"))
+        self.assertEqual(["Tenant 2-0"], adapter.get(NautobotTenantGroup, "Group 2").tenants)
+
+    def test_full_load_without_snapshot(self):
+        job = MagicMock()
+        job.get_incremental_snapshot.return_value = None
+        adapter = IncrementalTestAdapter(job=job)
+        adapter.load()
+        self.assertEqual("Original", adapter.get(NautobotTenantGroup, "Group 0").description)
+        self.assertEqual(6, len(adapter.get_all("tenant")))
+
+
 class CustomRelationShipTestAdapterSource(NautobotAdapter):
     """Adapter for testing custom relationship support."""
 
@@ -289,7 +473,7 @@ class CacheTests(TestCase):
             # One query to get the tenant group into the cache and another query per tenant during `clean`.
             self.assertEqual(4, len(tenant_group_queries))
         # As a consequence, there should be two cache hits for 'tenancy.tenantgroup'.
-        self.assertEqual(2, adapter._cache_hits["tenancy.tenantgroup"])  # pylint: disable=protected-access
+        self.assertEqual(2, adapter._cache_hits[tenancy_models.TenantGroup])  # pylint: disable=protected-access
 
         with CaptureQueriesContext(connection) as ctx:
             for i, tenant in enumerate(adapter.get_all("tenant")):
@@ -299,6 +483,59 @@ class CacheTests(TestCase):
             # One query per tenant to get the tenant group, one to pre-populate the cache, and another query per tenant during `clean`.
             self.assertEqual(6, len(tenant_group_queries))
 
+    def test_warm_cache(self):
+        """Test that lookups on a warmed model class don't query the database."""
+        tenant_groups = [tenancy_models.TenantGroup.objects.create(name=f"Group {i}") for i in range(3)]
+        adapter = TestAdapter(job=MagicMock())
+        with self.assertNumQueries(1):
+            adapter.warm_cache(tenancy_models.TenantGroup, ["name"])
+        with self.assertNumQueries(0):
+            for tenant_group in tenant_groups:
+                self.assertEqual(
+                    tenant_group, adapter.get_from_orm_cache({"name": tenant_group.name}, tenancy_models.TenantGroup)
+                )
+        # Objects created after warming the cache are still found in the database.
+        new_tenant_group = tenancy_models.TenantGroup.objects.create(name="New Group")
+        self.assertEqual(
+            new_tenant_group, adapter.get_from_orm_cache({"name": "New Group"}, tenancy_models.TenantGroup)
+        )
+        statistics = adapter.get_orm_cache_statistics()["tenancy.tenantgroup"]
+        self.assertEqual(3, statistics["hits"])
+        self.assertEqual(1, statistics["misses"])
+
+    def test_warm_cache_ambiguous_lookup(self):
+        """Test that lookups matching multiple warmed objects still raise."""
+        tenant_group = tenancy_models.TenantGroup.objects.create(name="Group")
+        for i in range(2):
+            tenancy_models.Tenant.objects.create(name=f"Tenant {i}", tenant_group=tenant_group)
+        adapter = TestAdapter(job=MagicMock())
+        adapter.warm_cache(tenancy_models.Tenant, ["tenant_group__name"])
+        with self.assertRaises(tenancy_models.Tenant.MultipleObjectsReturned):
+            adapter.get_from_orm_cache({"tenant_group__name": "Group"}, tenancy_models.Tenant)
+
+    def test_max_size(self):
+        """Test that the least recently used objects are evicted once the cache is full."""
+
+        class Adapter(TestAdapter):
+            """Test adapter with a limited ORM cache."""
+
+            orm_cache_max_sizes = {tenancy_models.TenantGroup: 2}
+
+        for i in range(3):
+            tenancy_models.TenantGroup.objects.create(name=f"Group {i}")
+        adapter = Adapter(job=MagicMock())
+        for name in ["Group 0", "Group 1", "Group 0", "Group 2"]:
+            adapter.get_from_orm_cache({"name": name}, tenancy_models.TenantGroup)
+        # "Group 1" was the least recently used one when "Group 2" was added.
+        with self.assertNumQueries(0):
+            adapter.get_from_orm_cache({"name": "Group 0"}, tenancy_models.TenantGroup)
+        with self.assertNumQueries(1):
+            adapter.get_from_orm_cache({"name": "Group 1"}, tenancy_models.TenantGroup)
+        self.assertEqual(
+            {"hits": 2, "misses": 4, "evictions": 2, "size": 2},
+            adapter.get_orm_cache_statistics()["tenancy.tenantgroup"],
+        )
+
 
 class TestNestedRelationships(TestCase):
     """Tests for nested relationships."""
@@ -0,0 +1,75 @@
+"""Tests for the field plans of contrib.NautobotModel."""
+
+from unittest import TestCase
+from unittest.mock import patch
+
+from nautobot.tenancy import models as tenancy_models
+from typing_extensions import Annotated
+
+from nautobot_ssot.contrib import CustomFieldAnnotation, NautobotModel
+from nautobot_ssot.contrib.field_plan import FieldKind, get_field_plan
+from nautobot_ssot.tests.contrib_base_classes import (
+    NautobotCable,
+    NautobotTenant,
+    ProviderModelCustomRelationship,
+    TenantModelCustomRelationship,
+)
+
+
+class FieldPlanTests(TestCase):
+    """Tests for `get_field_plan`."""
+
+    def test_field_kinds(self):
+        """Test that each field is classified correctly."""
+
+        class TenantModel(NautobotModel):
+            """Tenant model with a custom field."""
+
+            _model = tenancy_models.Tenant
+            _modelname = "tenant"
+            _identifiers = ("name",)
+            _attributes = ("is_customer",)
+
+            name: str
+            is_customer: Annotated[bool, CustomFieldAnnotation(key="is_customer")] = False
+
+        cases = [
+            (NautobotTenant, "description", FieldKind.PLAIN),
+            (NautobotTenant, "tenant_group__name", FieldKind.FOREIGN_KEY),
+            (NautobotTenant, "tags", FieldKind.TO_MANY),
+            (NautobotCable, "termination_a__name", FieldKind.GENERIC_FOREIGN_KEY),
+            (TenantModel, "is_customer", FieldKind.CUSTOM_FIELD),
+            (TenantModelCustomRelationship, "provider__name", FieldKind.CUSTOM_RELATIONSHIP_FOREIGN_KEY),
+            (ProviderModelCustomRelationship, "tenants", FieldKind.CUSTOM_RELATIONSHIP_TO_MANY),
+        ]
+        for diffsync_model, field_name, kind in cases:
+            with self.subTest(diffsync_model=diffsync_model.__name__, field_name=field_name):
+                self.assertEqual(kind, get_field_plan(diffsync_model)[field_name].kind)
+
+    def test_field_details(self):
+        """Test that the Django field, related model and typed dict keys are resolved."""
+        field_plan = get_field_plan(NautobotTenant)
+        self.assertEqual(tenancy_models.Tenant._meta.get_field("description"), field_plan["description"].django_field)
+        self.assertEqual("tenant_group", field_plan["tenant_group__name"].foreign_key)
+        self.assertEqual("name", field_plan["tenant_group__name"].lookup)
+        self.assertEqual(tenancy_models.TenantGroup, field_plan["tenant_group__name"].related_model)
+        self.assertEqual(("name",), field_plan["tags"].typed_dict_keys)
+        self.assertIsNone(get_field_plan(NautobotCable)["termination_a__name"].related_model)
+
+    def test_plan_is_memoised(self):
+        """Test that type hints are only introspected once per class."""
+
+        class TenantModel(NautobotModel):
+            """Test model."""
+
+            _model = tenancy_models.Tenant
+            _modelname = "tenant"
+            _identifiers = ("name",)
+
+            name: str
+
+        with patch("nautobot_ssot.contrib.field_plan.get_type_hints") as get_type_hints:
+            get_type_hints.return_value = {"name": str}
+            for _ in range(3):
+                get_field_plan(TenantModel)
+        self.assertEqual(2, get_type_hints.call_count)
@@ -1,8 +1,9 @@
 """Tests for contrib.NautobotModel."""
 
 from typing import List, Optional
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
+from diffsync import Adapter
 from django.contrib.contenttypes.models import ContentType
 from nautobot.circuits import models as circuits_models
 from nautobot.core.testing import TestCase
@@ -15,10 +16,12 @@ from nautobot.tenancy import models as tenancy_models
 from nautobot_ssot.contrib import NautobotAdapter, NautobotModel
 from nautobot_ssot.tests.contrib_base_classes import (
     NautobotTenant,
+    NautobotTenantGroup,
     ProviderModelCustomRelationship,
     TagDict,
     TagModel,
     TenantModelCustomRelationship,
+    TestAdapter,
     TestCaseWithDeviceData,
 )
 from nautobot_ssot.tests.test_contrib_adapter import (
@@ -249,6 +252,90 @@ class BaseModelManyToManyTest(TestCase):
         )
 
 
+class BatchedWritesTestAdapter(TestAdapter):
+    """Test adapter with batched writes enabled."""
+
+    batched_writes = True
+
+
+class BatchedWritesSourceAdapter(Adapter):
+    """Plain source adapter holding the same models as `TestAdapter`."""
+
+    top_level = ("tenant_group",)
+    tenant_group = NautobotTenantGroup
+    tenant = NautobotTenant
+
+
+class BaseModelBatchedWritesTest(TestCase):
+    """Tests for queueing ORM writes through the shared base model code."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.tag = extras_models.Tag.objects.create(name="batched-tag")
+        cls.tag.content_types.add(ContentType.objects.get_for_model(tenancy_models.Tenant))
+
+    def _source_adapter(self, tenant_groups):
+        source = BatchedWritesSourceAdapter()
+        for group_name, tenant_names in tenant_groups.items():
+            group = source.tenant_group(name=group_name, description="Batched")
+            source.add(group)
+            for tenant_name in tenant_names:
+                tenant = source.tenant(
+                    name=tenant_name, description="", tenant_group__name=group_name, tags=[{"name": self.tag.name}]
+                )
+                source.add(tenant)
+                group.add_child(tenant)
+        return source
+
+    def test_create(self):
+        """Test that creations are queued and written to the database once the sync is complete."""
+        destination = BatchedWritesTestAdapter(job=MagicMock())
+        destination.load()
+        source = self._source_adapter({"Group 1": ["Tenant 1", "Tenant 2"], "Group 2": ["Tenant 3"]})
+
+        with patch.object(BatchedWritesTestAdapter, "sync_complete") as sync_complete:
+            destination.sync_from(source)
+            sync_complete.assert_called_once()
+        self.assertEqual(len(destination.write_queue), 5)
+        self.assertFalse(tenancy_models.TenantGroup.objects.exists())
+
+        destination.sync_complete(source, None)
+        self.assertEqual(len(destination.write_queue), 0)
+        self.assertEqual(tenancy_models.TenantGroup.objects.count(), 2)
+        tenant = tenancy_models.Tenant.objects.get(name="Tenant 3")
+        self.assertEqual(tenant.tenant_group.name, "Group 2")
+        self.assertEqual(list(tenant.tags.all()), [self.tag])
+
+    def test_update_and_delete(self):
+        """Test that updates and deletions are performed in bulk."""
+        group = tenancy_models.TenantGroup.objects.create(name="Group 1", description="Old")
+        tenancy_models.Tenant.objects.create(name="Tenant 1", tenant_group=group)
+        tenancy_models.Tenant.objects.create(name="Tenant 2", tenant_group=group)
+        destination = BatchedWritesTestAdapter(job=MagicMock())
+        destination.load()
+
+        destination.sync_from(self._source_adapter({"Group 1": ["Tenant 1"]}))
+
+        group.refresh_from_db()
+        self.assertEqual(group.description, "Batched")
+        self.assertEqual(list(group.tenants.values_list("name", flat=True)), ["Tenant 1"])
+        self.assertEqual(list(group.tenants.get().tags.all()), [self.tag])
+
+    def test_create_validation_failure(self):
+        """Test that objects failing validation, and objects depending on them, are skipped and logged."""
+        destination = BatchedWritesTestAdapter(job=MagicMock())
+        destination.load()
+        source = self._source_adapter({"Group 1": ["Tenant 1"]})
+        source.get("tenant_group", "Group 1").description = "x" * 300
+
+        destination.sync_from(source)
+
+        self.assertFalse(tenancy_models.TenantGroup.objects.exists())
+        self.assertFalse(tenancy_models.Tenant.objects.exists())
+        self.assertEqual(destination.write_queue.failed, 2)
+        self.assertEqual(destination.job.logger.error.call_count, 2)
+
+
 class AnnotationsSubclassingTest(TestCase):
     """Test that annotations work properly with subclassing."""
 
@@ -1,18 +1,43 @@
 """Test the Job classes in nautobot_ssot."""
 
 import os.path
-from unittest.mock import Mock, call, patch
-
+import tempfile
+import threading
+import uuid
+from unittest.mock import Mock, patch
+
+from diffsync import Adapter, DiffSyncModel
+from diffsync.diff import Diff as DiffSyncDiff
+from diffsync.diff import DiffElement
 from django.db.utils import IntegrityError, OperationalError
 from django.test import override_settings
 from nautobot.core.testing import TransactionTestCase
+from nautobot.extras.choices import JobResultStatusChoices
 from nautobot.extras.models import JobResult
 
 from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
-from nautobot_ssot.models import SyncLogEntry
+from nautobot_ssot.models import SyncAdapterSnapshot, SyncDiffChunk, SyncLogEntry
 from nautobot_ssot.tests.jobs import DataSource, DataSyncBaseJob, DataTarget
 
 
+class SnapshotTestModel(DiffSyncModel):
+    """DiffSync model for testing adapter snapshots."""
+
+    _modelname = "tenant"
+    _identifiers = ("name",)
+    _attributes = ("description",)
+
+    name: str
+    description: str = ""
+
+
+class SnapshotTestAdapter(Adapter):
+    """Adapter for testing adapter snapshots."""
+
+    tenant = SnapshotTestModel
+    top_level = ["tenant"]
+
+
 @override_settings(JOBS_ROOT=os.path.join(os.path.dirname(__file__), "jobs"))
 class BaseJobTestCase(TransactionTestCase):
     """Test the DataSyncBaseJob class."""
@@ -37,6 +62,13 @@ class BaseJobTestCase(TransactionTestCase):
         self.job.load_source_adapter = lambda *x, **y: None
         self.job.load_target_adapter = lambda *x, **y: None
 
+        # Adapter snapshots are stored as files.
+        media_root = tempfile.TemporaryDirectory()  # pylint: disable=consider-using-with
+        self.addCleanup(media_root.cleanup)
+        media_root_override = override_settings(MEDIA_ROOT=media_root.name)
+        media_root_override.enable()
+        self.addCleanup(media_root_override.disable)
+
     def test_sync_log(self):
         """Test the sync_log() method."""
         self.job.run(dryrun=True, memory_profiling=False)
@@ -58,6 +90,207 @@ class BaseJobTestCase(TransactionTestCase):
 
         self.assertEqual(2, SyncLogEntry.objects.count())
 
+    def test_sync_log_buffered(self):
+        """Test that sync_log() entries are buffered during a run and written in batches."""
+        self.job.sync_log_batch_size = 2
+
+        def load_source_adapter():
+            for _ in range(3):
+                self.job.sync_log(
+                    action=SyncLogEntryActionChoices.ACTION_NO_CHANGE,
+                    status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+                )
+            # The first batch has been written, the third entry is still pending.
+            self.assertEqual(2, SyncLogEntry.objects.count())
+            self.assertEqual(1, len(self.job.sync_log_buffer))
+
+        self.job.load_source_adapter = load_source_adapter
+        self.job.run(dryrun=True, memory_profiling=False)
+        self.assertEqual(3, SyncLogEntry.objects.filter(sync=self.job.sync).count())
+        self.assertIsNone(self.job.sync_log_buffer)
+
+    def test_sync_log_flushed_on_failure(self):
+        """Test that buffered sync_log() entries are written even if the job fails."""
+
+        def load_source_adapter():
+            self.job.sync_log(
+                action=SyncLogEntryActionChoices.ACTION_CREATE,
+                status=SyncLogEntryStatusChoices.STATUS_ERROR,
+            )
+            raise RuntimeError("Source system unreachable")
+
+        self.job.load_source_adapter = load_source_adapter
+        with self.assertRaises(RuntimeError):
+            self.job.run(dryrun=True, memory_profiling=False)
+        self.assertEqual(1, SyncLogEntry.objects.filter(sync=self.job.sync).count())
+
+    def test_record_orm_cache_statistics(self):
+        """Test that the ORM cache statistics of the adapters are recorded on the Sync."""
+        statistics = {"tenancy.tenant": {"hits": 3, "misses": 1, "evictions": 0, "size": 1}}
+
+        def load_target_adapter():
+            self.job.target_adapter = Mock()
+            self.job.target_adapter.get_orm_cache_statistics.return_value = statistics
+
+        self.job.load_target_adapter = load_target_adapter
+        self.job.run(dryrun=True, memory_profiling=False)
+        self.job.sync.refresh_from_db()
+        self.assertEqual(statistics, self.job.sync.orm_cache_statistics)
+
+    def test_parallel_loading(self):
+        """Test that the adapters are loaded at the same time, with the Nautobot adapter on the main thread."""
+        self.job.parallel_loading = True
+        # Both loads have to be running at the same time to get past the barrier.
+        barrier = threading.Barrier(2, timeout=10)
+        load_threads = {}
+
+        def load(side):
+            def _load():
+                load_threads[side] = threading.current_thread()
+                barrier.wait()
+                self.job.sync_log(
+                    action=SyncLogEntryActionChoices.ACTION_NO_CHANGE,
+                    status=SyncLogEntryStatusChoices.STATUS_SUCCESS,
+                )
+
+            return _load
+
+        self.job.load_source_adapter = load("source")
+        self.job.load_target_adapter = load("target")
+        self.job.run(dryrun=True, memory_profiling=False)
+
+        local_side = "source" if self.job.data_source == "Nautobot" else "target"
+        remote_side = "target" if local_side == "source" else "source"
+        self.assertIs(threading.main_thread(), load_threads[local_side])
+        self.assertIsNot(threading.main_thread(), load_threads[remote_side])
+        self.job.sync.refresh_from_db()
+        self.assertIsNotNone(self.job.sync.source_load_time)
+        self.assertIsNotNone(self.job.sync.target_load_time)
+        self.assertEqual(2, SyncLogEntry.objects.filter(sync=self.job.sync).count())
+
+    def test_parallel_loading_failure(self):
+        """Test that an error in the worker thread is raised by the job."""
+        self.job.parallel_loading = True
+
+        def load_remote_adapter():
+            raise RuntimeError("Remote system unreachable")
+
+        if self.job.data_source == "Nautobot":
+            self.job.load_target_adapter = load_remote_adapter
+        else:
+            self.job.load_source_adapter = load_remote_adapter
+        with self.assertRaises(RuntimeError):
+            self.job.run(dryrun=True, memory_profiling=False)
+
+    @patch("tracemalloc.start")
+    def test_parallel_loading_memory_profiling(self, mock_malloc_start):
+        """Test that the adapters are loaded one after the other when memory profiling."""
+        self.job.parallel_loading = True
+        load_threads = []
+        self.job.load_source_adapter = lambda: load_threads.append(threading.current_thread())
+        self.job.load_target_adapter = lambda: load_threads.append(threading.current_thread())
+        self.job.run(dryrun=True, memory_profiling=True)
+        mock_malloc_start.assert_called()
+        self.assertEqual([threading.main_thread()] * 2, load_threads)
+
+    def _new_job(self):
+        job = self.job_class()
+        job.job_result = JobResult.objects.create(name="fake job", task_name="fake job", worker="default")
+        job.load_source_adapter = lambda *x, **y: None
+        job.load_target_adapter = lambda *x, **y: None
+        return job
+
+    def _run_incremental_job(self, adapter):
+        """Run a new instance of the job in incremental mode, returning the snapshot handed to its source adapter."""
+        job = self._new_job()
+        snapshots = []
+
+        def load_source_adapter():
+            job.source_adapter = adapter
+            snapshots.append(job.get_incremental_snapshot(adapter))
+
+        job.load_source_adapter = load_source_adapter
+        job.incremental = True
+        job.run(dryrun=True, memory_profiling=False)
+        return job, snapshots[0]
+
+    def test_incremental_snapshots(self):
+        """Test that adapter snapshots are stored and handed to the adapters of the next incremental sync."""
+        adapter = Mock(spec=["incremental_load", "dict"], incremental_load=True)
+        adapter.dict.return_value = {"tenant": {"Tenant 1": {"name": "Tenant 1"}}}
+
+        first_job, used_snapshot = self._run_incremental_job(adapter)
+        self.assertIsNone(used_snapshot)
+        snapshot = SyncAdapterSnapshot.objects.get(sync=first_job.sync)
+        self.assertEqual(first_job.sync.start_time, snapshot.watermark)
+        self.assertEqual(1, snapshot.object_count)
+        self.assertEqual(adapter.dict.return_value, snapshot.data)
+
+        # Snapshots of syncs that didn't complete successfully aren't used.
+        _, used_snapshot = self._run_incremental_job(adapter)
+        self.assertIsNone(used_snapshot)
+
+        first_job.job_result.status = JobResultStatusChoices.STATUS_SUCCESS
+        first_job.job_result.save()
+        _, used_snapshot = self._run_incremental_job(adapter)
+        self.assertEqual(snapshot, used_snapshot)
+
+    def test_incremental_disabled(self):
+        """Test that no snapshots are stored or used unless incremental mode is enabled."""
+        adapter = Mock(spec=["incremental_load", "dict"], incremental_load=True)
+
+        def load_source_adapter():
+            self.job.source_adapter = adapter
+            self.assertIsNone(self.job.get_incremental_snapshot(adapter))
+
+        self.job.load_source_adapter = load_source_adapter
+        self.job.run(dryrun=True, memory_profiling=False)
+        self.assertFalse(SyncAdapterSnapshot.objects.exists())
+
+    def test_snapshot_replay(self):
+        """Test that adapter snapshots can be stored and diffed against by a later run."""
+
+        def load_adapter(descriptions):
+            adapter = SnapshotTestAdapter()
+            for name, description in descriptions.items():
+                adapter.add(SnapshotTestModel(name=name, description=description))
+            return adapter
+
+        self.job.load_source_adapter = lambda: setattr(self.job, "source_adapter", load_adapter({"a": "new", "b": "b"}))
+        self.job.load_target_adapter = lambda: setattr(self.job, "target_adapter", load_adapter({"a": "old"}))
+        self.job.run(dryrun=True, memory_profiling=False, save_snapshots=True)
+        snapshots = {snapshot.side: snapshot for snapshot in self.job.sync.adapter_snapshots.all()}
+        self.assertEqual(2, snapshots["source"].object_count)
+        self.assertEqual(
+            {"tenant": {"a": {"name": "a", "description": "new"}, "b": {"name": "b", "description": "b"}}},
+            snapshots["source"].data,
+        )
+        self.assertEqual({"tenant": {"a": {"name": "a", "description": "old"}}}, snapshots["target"].read(["tenant"]))
+
+        replay_job = self._new_job()
+        replay_job.load_source_adapter = Mock(side_effect=AssertionError("Source system queried"))
+        replay_job.load_target_adapter = Mock(side_effect=AssertionError("Target system queried"))
+        replay_job.run(
+            dryrun=False,
+            memory_profiling=False,
+            source_snapshot=str(self.job.sync.pk),
+            target_snapshot=str(self.job.sync.pk),
+        )
+        self.assertTrue(replay_job.sync.dry_run)
+        self.assertEqual({"create": 1, "update": 1, "delete": 0, "no-change": 0, "skip": 0}, replay_job.sync.summary)
+        self.assertEqual("SnapshotTestAdapter", replay_job.source_adapter.type)
+        self.assertFalse(replay_job.sync.adapter_snapshots.exists())
+
+        path = snapshots["source"].file.path
+        snapshots["source"].delete()
+        self.assertFalse(os.path.exists(path))
+
+    def test_snapshot_replay_invalid_sync(self):
+        """Test that selecting a data sync without snapshots fails the job."""
+        for sync_id in (str(uuid.uuid4()), "invalid"):
+            with self.assertRaises(ValueError):
+                self.job.run(dryrun=True, memory_profiling=False, target_snapshot=sync_id)
+
     def test_as_form(self):
         """Test the as_form() method."""
         form = self.job.as_form()
@@ -142,36 +375,53 @@ class BaseJobTestCase(TransactionTestCase):
         self.job.sync = Mock()
         self.job.source_adapter = Mock()
         self.job.target_adapter = Mock()
-        self.job.source_adapter.diff_to().dict.return_value = {}
+        self.job.source_adapter.diff_to().get_children.return_value = []
         self.job.calculate_diff()
         self.job.source_adapter.diff_to.assert_called()
-        self.job.sync.save.assert_has_calls([call(), call()])
+        self.job.sync.save.assert_called_once()
 
-    def test_calculate_diff_fail_diff_save_too_large(self):
-        """Test calculate_diff() method logs failure."""
-        self.job.sync = Mock()
-        self.job.sync.save.side_effect = [None, OperationalError("Fail")]
-        self.job.source_adapter = Mock()
-        self.job.target_adapter = Mock()
-        self.job.logger.info = Mock()
+    def test_save_diff(self):
+        """Test that save_diff() stores the diff in chunks per model type."""
+        self.job.diff_chunk_size = 2
+        self.job.run(dryrun=True, memory_profiling=False)
+        diff = DiffSyncDiff()
+        for i in range(3):
+            diff.add(DiffElement("location", f"location{i}", {"name": f"location{i}"}))
+        diff.add(DiffElement("device", "device0", {"name": "device0"}))
+        for element in diff.get_children():
+            element.add_attrs(source={"description": "new"}, dest={"description": "old"})
+
+        self.job.save_diff(diff)
+
+        chunks = list(self.job.sync.diff_chunks.all())
+        self.assertEqual(["location", "location", "device"], [chunk.model_type for chunk in chunks])
+        self.assertEqual([2, 1, 1], [chunk.element_count for chunk in chunks])
+        reassembled = {}
+        for chunk in chunks:
+            reassembled.setdefault(chunk.model_type, {}).update(chunk.diff)
+        self.assertEqual(diff.dict(), reassembled)
+
+    def test_save_diff_fail_chunk_save_too_large(self):
+        """Test save_diff() logs failure to save a chunk."""
+        self.job.run(dryrun=True, memory_profiling=False)
+        diff = DiffSyncDiff()
+        diff.add(DiffElement("location", "location0", {"name": "location0"}))
+        next(diff.get_children()).add_attrs(source={"description": "new"}, dest=None)
         self.job.logger.warning = Mock()
-        self.job.source_adapter.diff_to().dict.return_value = {}
-        self.job.calculate_diff()
-        self.job.logger.warning.assert_any_call(
-            "Unable to save JSON diff to the database; likely the diff is too large."
-        )
+        with patch.object(SyncDiffChunk, "save", side_effect=OperationalError("Fail")):
+            self.job.save_diff(diff)
+        self.job.logger.warning.assert_called_once()
+        self.assertFalse(self.job.sync.diff_chunks.exists())
 
-    def test_calculate_diff_fail_diff_save_generic(self):
-        """Test calculate_diff() method logs failure."""
-        self.job.sync = Mock()
-        self.job.sync.save.side_effect = [None, IntegrityError("Fail")]
-        self.job.source_adapter = Mock()
-        self.job.target_adapter = Mock()
-        self.job.logger.info = Mock()
-        self.job.logger.warning = Mock()
-        self.job.source_adapter.diff_to().dict.return_value = {}
-        with self.assertRaises(IntegrityError):
-            self.job.calculate_diff()
+    def test_save_diff_fail_chunk_save_generic(self):
+        """Test save_diff() passes through other failures."""
+        self.job.run(dryrun=True, memory_profiling=False)
+        diff = DiffSyncDiff()
+        diff.add(DiffElement("location", "location0", {"name": "location0"}))
+        next(diff.get_children()).add_attrs(source={"description": "new"}, dest=None)
+        with patch.object(SyncDiffChunk, "save", side_effect=IntegrityError("Fail")):
+            with self.assertRaises(IntegrityError):
+                self.job.save_diff(diff)
 
 
 class DataSourceTestCase(BaseJobTestCase):
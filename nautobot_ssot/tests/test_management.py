@@ -1,5 +1,6 @@
 """Test cases for custom Django MGMT commands."""
 
+import json
 from io import StringIO
 
 from django.contrib.contenttypes.models import ContentType
@@ -187,3 +188,38 @@ class TestElongateInterfaceNames(TestCase):
             stdout=out,
         )
         self.assertEqual(out.getvalue().strip(), "Updating ssot_test_1.ge2 >> GigabitEthernet2")
+
+
+class TestBenchmarkContrib(TestCase):
+    """Unittests for benchmark_contrib command."""
+
+    def test_benchmark(self):
+        out = StringIO()
+        call_command(
+            "benchmark_contrib",
+            "--no-color",
+            "--skip-checks",
+            "--scale",
+            "20",
+            "--mix",
+            "mixed",
+            "--change-ratio",
+            "0.3",
+            stdout=out,
+            stderr=StringIO(),
+        )
+        results = json.loads(out.getvalue())["results"]
+        self.assertEqual(
+            [(result["step"], result.get("mix")) for result in results],
+            [("load", None), ("diff", "mixed"), ("sync", "mixed")],
+        )
+        self.assertEqual(results[0]["objects"], 20 + 20 + 2 + 1)
+        # Two new interfaces along with their IP addresses, two updated and two deleted interfaces.
+        self.assertEqual(results[1]["objects"], 8)
+        self.assertEqual(
+            {action: count for action, count in results[1]["summary"].items() if action != "no-change"},
+            {"create": 4, "update": 2, "delete": 2, "skip": 0},
+        )
+        self.assertGreater(results[2]["queries"], 0)
+        # The generated dataset is rolled back afterwards.
+        self.assertFalse(Device.objects.filter(name__startswith="benchmark-device-").exists())
@@ -2,7 +2,13 @@
 
 import unittest
 
-from nautobot_ssot.utils import parse_hostname_for_role
+from django.contrib.contenttypes.models import ContentType
+from nautobot.core.testing import TestCase
+from nautobot.extras.choices import CustomFieldTypeChoices
+from nautobot.extras.models import CustomField, Status, Tag
+from nautobot.ipam.models import Namespace, Prefix
+
+from nautobot_ssot.utils import bulk_tag_objects, parse_hostname_for_role
 
 
 class TestSSoTUtils(unittest.TestCase):
@@ -25,3 +31,37 @@ class TestSSoTUtils(unittest.TestCase):
             hostname_map=hostname_mapping, device_hostname=hostname, default_role="Unknown"
         )
         self.assertEqual(result, "Unknown")
+
+
+class TestBulkTagObjects(TestCase):
+    """Test the bulk_tag_objects utility function."""
+
+    def setUp(self):
+        self.tag = Tag.objects.create(name="Bulk Tag")
+        self.custom_field = CustomField.objects.create(
+            key="bulk_cf", label="Bulk CF", type=CustomFieldTypeChoices.TYPE_DATE
+        )
+        self.custom_field.content_types.add(ContentType.objects.get_for_model(Prefix))
+        namespace = Namespace.objects.create(name="Bulk")
+        status = Status.objects.get(name="Active")
+        self.prefixes = [
+            Prefix.objects.create(prefix=f"10.0.{i}.0/24", namespace=namespace, status=status) for i in range(10)
+        ]
+
+    def test_bulk_tag_objects(self):
+        """Validate that the tag and custom field are applied with a constant number of queries."""
+        self.prefixes[0].tags.add(self.tag)
+        pks = [prefix.pk for prefix in self.prefixes]
+        # Tag insert, custom field select and update.
+        with self.assertNumQueries(3):
+            bulk_tag_objects(Prefix, pks, tag=self.tag, custom_field_values={"bulk_cf": "2024-01-01"})
+        for prefix in Prefix.objects.filter(pk__in=pks):
+            self.assertEqual(list(prefix.tags.all()), [self.tag])
+            self.assertEqual(prefix.cf["bulk_cf"], "2024-01-01")
+
+    def test_bulk_tag_objects_skips_unchanged(self):
+        """Validate that objects already holding the custom field values aren't updated."""
+        pks = [prefix.pk for prefix in self.prefixes]
+        bulk_tag_objects(Prefix, pks, custom_field_values={"bulk_cf": "2024-01-01"})
+        with self.assertNumQueries(1):
+            bulk_tag_objects(Prefix, pks, custom_field_values={"bulk_cf": "2024-01-01"})
@@ -11,7 +11,7 @@ from nautobot.extras.models import Job, JobResult
 from nautobot.users.models import ObjectPermission
 
 from nautobot_ssot.choices import SyncLogEntryActionChoices, SyncLogEntryStatusChoices
-from nautobot_ssot.models import Sync, SyncLogEntry
+from nautobot_ssot.models import Sync, SyncAdapterSnapshot, SyncDiffChunk, SyncLogEntry
 
 
 class SyncViewsTestCase(  # pylint: disable=too-many-ancestors
@@ -109,6 +109,50 @@ class SyncViewsTestCase(  # pylint: disable=too-many-ancestors
     def test_has_advanced_tab(self):
         pass
 
+    def test_get_object_with_diff_chunks(self):
+        """Test that a diff stored in chunks is rendered one page at a time."""
+        obj_perm = ObjectPermission(name="Test permission", actions=["view"])
+        obj_perm.save()
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(self.model))
+        sync = Sync.objects.first()
+        for index, name in enumerate(["ams01", "bcn01"]):
+            SyncDiffChunk.objects.create(
+                sync=sync, index=index, model_type="location", element_count=1, diff={name: {"+": {}}}
+            )
+
+        response = self.client.get(sync.get_absolute_url())
+        self.assertHttpStatus(response, 200)
+        self.assertIn("ams01", response.content.decode())
+        self.assertNotIn("bcn01", response.content.decode())
+        self.assertIn("Page 1 of 2", response.content.decode())
+
+        response = self.client.get(f"{sync.get_absolute_url()}?diff_page=2")
+        self.assertHttpStatus(response, 200)
+        self.assertNotIn("ams01", response.content.decode())
+        self.assertIn("bcn01", response.content.decode())
+
+    def test_get_object_with_adapter_snapshots(self):
+        """Test that the adapter snapshots of a sync are listed."""
+        obj_perm = ObjectPermission(name="Test permission", actions=["view"])
+        obj_perm.save()
+        obj_perm.users.add(self.user)
+        obj_perm.object_types.add(ContentType.objects.get_for_model(self.model))
+        sync = Sync.objects.first()
+        SyncAdapterSnapshot.objects.create(
+            sync=sync,
+            side="source",
+            adapter="nautobot_ssot.tests.test_jobs.SnapshotTestAdapter",
+            watermark=sync.start_time,
+            object_count=42,
+            file="nautobot_ssot/snapshots/test.zip",
+        )
+
+        response = self.client.get(sync.get_absolute_url())
+        self.assertHttpStatus(response, 200)
+        self.assertIn("Adapter Snapshots", response.content.decode())
+        self.assertIn("nautobot_ssot.tests.test_jobs.SnapshotTestAdapter", response.content.decode())
+
     @skip("Not implemented")
     def test_list_objects_with_permission(self):
         pass
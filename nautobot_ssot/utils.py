@@ -2,10 +2,12 @@
 
 import logging
 import re
-from typing import List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
 
+from django.contrib.contenttypes.models import ContentType
+from django.db.models import Model
 from nautobot.extras.choices import SecretsGroupAccessTypeChoices, SecretsGroupSecretTypeChoices
-from nautobot.extras.models import SecretsGroup
+from nautobot.extras.models import SecretsGroup, Tag, TaggedItem
 
 try:
     from nautobot.dcim.models import Controller, ControllerManagedDeviceGroup
@@ -80,3 +82,44 @@ def parse_hostname_for_role(hostname_map: List[Tuple[str, str]], device_hostname
             if match:
                 device_role = entry[1]
     return device_role
+
+
+def bulk_tag_objects(
+    model_class: Type[Model],
+    pks: Iterable,
+    tag: Optional[Tag] = None,
+    custom_field_values: Optional[Dict[str, Any]] = None,
+    batch_size: int = 1000,
+):
+    """Apply a tag and custom field values to many objects of a model at once.
+
+    Rather than fetching and saving each object, the tag is assigned by inserting the rows of the tag through-table in
+    bulk and the custom field data is updated with `bulk_update`. As the objects aren't saved one by one, no change log
+    entries are created and no signals are sent for them.
+
+    Args:
+        model_class (Type[Model]): Model of the objects.
+        pks (Iterable): Primary keys of the objects.
+        tag (Tag): Tag to apply, if the model supports tags.
+        custom_field_values (Dict[str, Any]): Custom field values by key, if the model supports custom fields.
+        batch_size (int): Number of objects handled per query.
+    """
+    pks = list(pks)
+    if tag is not None and hasattr(model_class, "tags"):
+        content_type = ContentType.objects.get_for_model(model_class)
+        TaggedItem.objects.bulk_create(
+            [TaggedItem(content_type=content_type, object_id=pk, tag=tag) for pk in pks],
+            batch_size=batch_size,
+            # Objects that already have the tag keep it.
+            ignore_conflicts=True,
+        )
+    if custom_field_values and hasattr(model_class, "_custom_field_data"):
+        for i in range(0, len(pks), batch_size):
+            queryset = model_class.objects.filter(pk__in=pks[i : i + batch_size]).only("pk", "_custom_field_data")
+            changed_objects = []
+            # The default ordering of some models joins related tables, which isn't needed here.
+            for obj in queryset.order_by():
+                if any(obj._custom_field_data.get(key) != value for key, value in custom_field_values.items()):  # pylint: disable=protected-access
+                    obj._custom_field_data.update(custom_field_values)  # pylint: disable=protected-access
+                    changed_objects.append(obj)
+            model_class.objects.bulk_update(changed_objects, ["_custom_field_data"], batch_size=batch_size)
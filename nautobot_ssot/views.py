@@ -1,7 +1,6 @@
 """Django views for Single Source of Truth (SSoT)."""
 
-import pprint
-
+from django.core.paginator import Paginator
 from django.http import Http404
 from django.shortcuts import get_object_or_404, render
 from django.views import View as DjangoView
@@ -130,14 +129,18 @@ class SyncBulkDeleteView(BulkDeleteView):
 class SyncView(ObjectView):
     """View for details of a single Sync record."""
 
-    queryset = Sync.annotated_queryset()
+    # The diff is loaded lazily, as it may be stored in chunks (see SyncDiffChunk) rather than in `Sync.diff`.
+    queryset = Sync.annotated_queryset().defer("diff")
     template_name = "nautobot_ssot/sync_detail.html"
+    # Number of SyncDiffChunk records rendered per page.
+    diff_chunks_per_page = 1
 
     def get_extra_context(self, request, instance):
         """Add additional context to the view."""
-        return {
-            "diff": pprint.pformat(instance.diff, width=180, compact=True),
-        }
+        paginator = Paginator(instance.diff_chunks.all(), self.diff_chunks_per_page)
+        if not paginator.count:
+            return {"diff_page": None}
+        return {"diff_page": paginator.get_page(request.GET.get("diff_page"))}
 
 
 class SyncJobResultView(ObjectView):